@@ -0,0 +1,75 @@
+#! /bin/python3
+
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Translation of the MAL header to and from the X-MAL-* HTTP headers.
+
+The messages of a transaction share most of their header: the constant
+part is translated once. The "first message" times empty the caches before
+each translation, as for the first message of a new transaction.
+"""
+
+import sys
+sys.path.append('../../src')
+
+import email.parser
+import time
+
+from malpy.mo import mal
+from malpy.transport import http
+
+RUNS = 20000
+
+
+def message():
+    header = mal.MALHeader()
+    header.area_version = 1
+    header.ip_type = mal.InteractionTypeEnum.PROGRESS
+    header.ip_stage = mal.MAL_IP_STAGES.PROGRESS_UPDATE
+    header.area = 4
+    header.service = 2
+    header.operation = 3
+    header.is_error_message = False
+    header.qos_level = mal.QoSLevelEnum.BESTEFFORT
+    header.session = mal.SessionTypeEnum.LIVE
+    header.transaction_id = 12345
+    header.priority = 0
+    header.uri_from = "https://192.168.1.10:8443/provider"
+    header.uri_to = "https://192.168.1.20:8443/consumer"
+    header.timestamp = time.time()
+    header.network_zone = "ground"
+    header.session_name = "LIVE"
+    header.domain = ["esa", "mission", "spacecraft", "subsystem"]
+    header.auth_id = b"\x01\x02\x03\x04"
+    return mal.MALMessage(header=header, msg_parts=b"<body/>")
+
+
+def clear_caches():
+    http._constant_http_headers.cache_clear()
+    http._constant_mal_header.cache_clear()
+
+
+def timeit(function, argument, clear):
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        if clear:
+            clear_caches()
+        function(argument)
+    return (time.perf_counter() - start) / RUNS
+
+
+if __name__ == "__main__":
+    msg = message()
+    headers = http._header_mal_to_http(msg)
+    raw = "".join("{}: {}\r\n".format(key, value) for key, value in headers.items())
+    received = email.parser.Parser(_class=http.http.client.HTTPMessage).parsestr(raw)
+
+    for name, function, argument in [
+            ("MAL -> HTTP", http._header_mal_to_http, msg),
+            ("HTTP -> MAL", http._header_http_to_mal, received)]:
+        first = timeit(function, argument, True)
+        next_ = timeit(function, argument, False)
+        print("{:12} first message {:6.1f} us, next ones {:6.1f} us".format(name, first * 1e6, next_ * 1e6))
@@ -0,0 +1,70 @@
+#! /bin/python3
+
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Startup time of short-lived processes using malpy.
+
+Each scenario runs in a new python interpreter, the best time of several
+runs is printed.
+"""
+
+import os
+import subprocess
+import sys
+
+SRC = os.path.abspath('../../src/')
+RUNS = 10
+
+SCENARIOS = [
+    ("import malpy.encoding",
+     "from malpy import encoding"),
+    ("encode a mal.String",
+     "from malpy.mo import mal\n"
+     "from malpy import encoding\n"
+     "encoding.BinaryEncoder().encode_body([mal.String('hello')])"),
+    ("decode a check.CheckResult",
+     "from malpy.mo import mal\n"
+     "from malpy import encoding\n"
+     "encoding.BinaryEncoder().decode_body(BODY)"),
+    ("import all the services",
+     "from malpy import encoding\n"
+     "from malpy.mo.com.services import *\n"
+     "from malpy.mo.mc.services import *"),
+    ]
+
+TIMER = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "{}\n"
+    "print(time.perf_counter() - start)\n"
+    )
+
+
+def check_result_body():
+    sys.path.insert(0, SRC)
+    from malpy.mo import mal
+    from malpy.mo.mc.services import check
+    from malpy import encoding
+    body = [check.CheckResult([check.CheckStateEnum(1), check.CheckStateEnum(2), 1, mal.Double(1.5)])]
+    return encoding.BinaryEncoder().encode_body(body)
+
+
+def run(code):
+    env = dict(os.environ, PYTHONPATH=SRC)
+    best = None
+    for _ in range(RUNS):
+        output = subprocess.run([sys.executable, '-c', TIMER.format(code)], env=env,
+                                check=True, capture_output=True, text=True).stdout
+        elapsed = float(output)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+if __name__ == "__main__":
+    body = check_result_body()
+    for name, code in SCENARIOS:
+        code = code.replace('BODY', repr(body))
+        print("{:30} {:7.1f} ms".format(name, run(code) * 1000))
@@ -5,6 +5,7 @@
 #
 # SPDX-License-Identifier: MIT
 
+import ssl
 import sys
 sys.path.append('../../src')
 
@@ -25,9 +26,11 @@ def main():
     host = '127.0.0.1'
     port = 8009
 
-    s = http.HTTPSocket()
+    # The certificate of the provider
+    context = ssl.create_default_context(cafile='cert.pem')
+    s = http.HTTPSocket(CONTEXT=context)
     enc = encoding.XMLEncoder()
-    request = MyRequestConsumerHandler(s, enc, "myprovider", mal.SessionType.LIVE)
+    request = MyRequestConsumerHandler(s, enc, "https://%s:%d/myprovider" % (host, port))
     request.connect((host, port))
     print("[*] Connected to %s %d" % (host, port))
     request.request(mal.String("Hello world!"))
@@ -8,12 +8,18 @@
 import sys
 sys.path.append('../../src')
 
+import ssl
 import threading
 
 from malpy.mo import mal
 from malpy.transport import http
 from malpy import encoding
 
+# Certificate of the server, ex: generated with
+# openssl req -x509 -newkey rsa:2048 -nodes -keyout key.pem -out cert.pem -subj "/CN=127.0.0.1" -addext "subjectAltName=IP:127.0.0.1"
+CERTFILE = 'cert.pem'
+KEYFILE = 'key.pem'
+
 
 class MyRequestProviderHandler(mal.RequestProviderHandler):
     AREA = 100
@@ -38,14 +44,16 @@ def main():
         host = '127.0.0.1'
         port = 8009
 
-        s = http.HTTPSocket()
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(CERTFILE, KEYFILE)
+        s = http.HTTPServerSocket(context)
         s.bind((host, port))
         s.listen(10)
         print("[*] Server listening on %s %d" % (host, (port)))
 
         while True:
             newsocket = s.waitforconnection()
-            print("[**] Incoming connection from %s %d"
+            print("[**] Incoming interaction from %s %d"
                   % (newsocket.uri[0], newsocket.uri[1]))
             threading.Thread(target=clientthread,
                              args=(newsocket,)
@@ -0,0 +1,40 @@
+#! /bin/python3
+
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+import sys
+sys.path.append('../../src')
+
+import asyncio
+
+from malpy.mo import mal
+from malpy.transport import tcp
+from malpy import encoding
+
+
+async def send_request(host, port, i):
+    s = tcp.AsyncMALTCPSocket()
+    enc = encoding.BinaryEncoder()
+    request = mal.AsyncRequestConsumerHandler(s, enc, "myprovider", "live_session")
+    await request.connect((host, port))
+    await request.request(mal.String("Hello world #{}!".format(i)))
+    message = await request.receive_response()
+    print("[*] Received '{}'".format(message.msg_parts[0].internal_value))
+    await s.disconnect()
+
+
+async def run(host, port, nb_requests):
+    await asyncio.gather(*[send_request(host, port, i) for i in range(nb_requests)])
+
+
+def main():
+    host = '127.0.0.1'
+    port = 8009
+    asyncio.run(run(host, port, 100))
+
+
+if __name__ == "__main__":
+    main()
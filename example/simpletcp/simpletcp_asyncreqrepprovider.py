@@ -0,0 +1,48 @@
+#! /bin/python3
+
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+import sys
+sys.path.append('../../src')
+
+import asyncio
+
+from malpy.mo import mal
+from malpy.transport import tcp
+from malpy import encoding
+
+
+async def clientcoroutine(socket):
+    enc = encoding.BinaryEncoder()
+    request = mal.AsyncRequestProviderHandler(socket, enc)
+    message = await request.receive_request()
+    print("[**] Received '{}'".format(message.msg_parts[0].internal_value))
+    await request.response(mal.String("I got it!"))
+    print("[**] Closing connection with %s %d." % (socket.uri[0], socket.uri[1]))
+    await socket.disconnect()
+
+
+async def serve(host, port):
+    s = tcp.AsyncMALTCPSocket()
+    await s.bind((host, port))
+    print("[*] Server listening on %s %d" % (host, (port)))
+
+    while True:
+        newsocket = await s.waitforconnection()
+        print("[**] Incoming connection from %s %d" % (newsocket.uri[0], newsocket.uri[1]))
+        asyncio.ensure_future(clientcoroutine(newsocket))
+    await s.unbind()
+
+
+def main():
+    try:
+        asyncio.run(serve('127.0.0.1', 8009))
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
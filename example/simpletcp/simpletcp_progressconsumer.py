@@ -18,22 +18,22 @@ def main():
     host = '127.0.0.1'
     port = 8009
 
-    s = tcp.TCPSocket()
-    enc = encoding.PickleEncoder()
+    s = tcp.MALTCPSocket()
+    enc = encoding.BinaryEncoder()
     progress = mal.ProgressConsumerHandler(s, enc, "myprovider", "live_session")
     progress.connect((host, port))
     print("[*] Connected to %s %d" % (host, port))
-    progress.progress("value1".encode('utf8'))
+    progress.progress(mal.String("value1"))
     progress.receive_ack()
     result = b""
     while True:
         partial_result = progress.receive_update()
         if progress.interaction_terminated:
-            print("[**] Response: {}".format(partial_result.msg_parts))
+            print("[**] Response: {}".format(partial_result.msg_parts[0].internal_value))
             break
         else:
-            print("[**] Received part: {}".format(partial_result.msg_parts))
-            result += partial_result.msg_parts
+            print("[**] Received part: {}".format(partial_result.msg_parts[0].internal_value))
+            result += partial_result.msg_parts[0].internal_value
     print("[*] Received:\n{}\n{}\n{}".format('-'*10, result.decode('utf8'), '-'*10))
 
 if __name__ == "__main__":
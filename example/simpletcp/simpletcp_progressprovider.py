@@ -18,21 +18,21 @@ CONTENT_TO_SEND = "../../README.md"
 
 
 def clientthread(socket):
-    enc = encoding.PickleEncoder()
+    enc = encoding.BinaryEncoder()
     progress = mal.ProgressProviderHandler(socket, enc)
     message = progress.receive_progress()
-    print("[**] Received '{}'".format(message.msg_parts.decode('utf8')))
-    progress.ack("Coming!")
+    print("[**] Received '{}'".format(message.msg_parts[0].internal_value))
+    progress.ack(mal.String("Coming!"))
     with open(CONTENT_TO_SEND, 'rb') as f:
         content_size = 0
         while True:
             datatosend = f.readline()
             if len(datatosend) > 0:
                 content_size += len(datatosend)
-                progress.update(datatosend)
+                progress.update(mal.Blob(datatosend))
                 print("[***] Sending: {}".format(datatosend))
             else:
-                progress.response(content_size)
+                progress.response(mal.ULong(content_size))
                 break
     print("[**] Closing connection with %s %d." % (socket.uri[0], socket.uri[1]))
     socket.disconnect()
@@ -43,7 +43,7 @@ def main():
         host = '127.0.0.1'
         port = 8009
 
-        s = tcp.TCPSocket()
+        s = tcp.MALTCPSocket()
         s.bind((host, port))
         s.listen(10)
         print("[*] Server listening on %s %d" % (host, (port)))
@@ -18,14 +18,14 @@ def main():
     host = '127.0.0.1'
     port = 8009
 
-    s = tcp.TCPSocket()
-    enc = encoding.PickleEncoder()
+    s = tcp.MALTCPSocket()
+    enc = encoding.BinaryEncoder()
     request = mal.RequestConsumerHandler(s, enc, "myprovider", "live_session")
     request.connect((host, port))
     print("[*] Connected to %s %d" % (host, port))
-    request.request("Hello world!".encode('utf8'))
+    request.request(mal.String("Hello world!"))
     message = request.receive_response()
-    print("[*] Received '{}'".format(message.msg_parts.decode('utf8')))
+    print("[*] Received '{}'".format(message.msg_parts[0].internal_value))
 
 
 if __name__ == "__main__":
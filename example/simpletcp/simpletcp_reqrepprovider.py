@@ -16,11 +16,11 @@ from malpy import encoding
 
 
 def clientthread(socket):
-    enc = encoding.PickleEncoder()
+    enc = encoding.BinaryEncoder()
     request = mal.RequestProviderHandler(socket, enc)
     message = request.receive_request()
-    print("[**] Received '{}'".format(message.msg_parts.decode('utf8')))
-    request.response("I got it!".encode('utf8'))
+    print("[**] Received '{}'".format(message.msg_parts[0].internal_value))
+    request.response(mal.String("I got it!"))
     print("[**] Closing connection with %s %d." % (socket.uri[0], socket.uri[1]))
     socket.disconnect()
 
@@ -30,7 +30,7 @@ def main():
         host = '127.0.0.1'
         port = 8009
 
-        s = tcp.TCPSocket()
+        s = tcp.MALTCPSocket()
         s.bind((host, port))
         s.listen(10)
         print("[*] Server listening on %s %d" % (host, (port)))
@@ -20,7 +20,11 @@ OUTFILE = "../src/malpy/mo"
 IMPORTS = {
     'MAL': [
         'from enum import IntEnum',
-        'from abc import ABC'
+        'from abc import ABC',
+        'from array import array',
+        'from collections.abc import MutableSequence, Sequence',
+        'from . import registry',
+        'from . import schema'
         ],
     'COM': [
         'from enum import IntEnum',
@@ -34,7 +38,14 @@ IMPORTS = {
     }
 PARAMFILE = 'parameters.yaml'
 
+LICENSE_HEADER = \
+"# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>\n" + \
+"# SPDX-FileCopyrightText: 2025 CNES\n" + \
+"#\n" + \
+"# SPDX-License-Identifier: MIT\n\n"
+
 DO_NOT_EDIT = \
+LICENSE_HEADER + \
 "#####################################################\n" + \
 "# Generated by generators/generator.py              #\n" + \
 "# This file is generated. Do NOT edit it by hand.   #\n" + \
@@ -534,20 +545,27 @@ class MALBuffer(object):
     "class {}({}):\n".format(d.name, self._element_completename(enumType)) +
     "    \"\"\"{classdoc}\"\"\"\n".format(classdoc=d.comment) +
     "\n" +
+    "    __slots__ = []\n" +
     "    shortForm = {namespace}.{name}\n".format(namespace="MALShortForm",name=d.name.upper()) +
     "    value_type = {}\n".format(d.name + 'Enum') +
     "\n\n"
         )
 
-    def write_element_class(self, d, blocks=[]):
+    def write_element_class(self, d, blocks=[], slots=[], polymorphic=False):
         parentclass = self._element_parentclass(d)
 
         self.write(
     "class {}({}):\n".format(d.name, parentclass) +
     "    \"\"\"{classdoc}\"\"\"\n".format(classdoc=d.comment) +
-    "\n"
+    "\n" +
+    "    __slots__ = {}\n".format(slots)
     )
-        if d.shortFormPart:
+        if polymorphic:
+            self.write(
+    "    shortForm = _Polymorphic('_shortForm')\n" +
+    "    value_type = _Polymorphic('_value_type')\n"
+            )
+        elif d.shortFormPart:
             self.write(
     "    shortForm = {namespace}.{name}\n".format(namespace="MALShortForm",name=d.name.upper())
             )
@@ -556,16 +574,19 @@ class MALBuffer(object):
     "    shortForm = None\n"
             )
 
-        if d.name in self.generator.typedict:
+        if d.name in self.generator.typedict and not polymorphic:
             self.write(
     "    value_type = {typename}\n".format(typename=self.generator.typedict[d.name])
             )
 
         if d.name in self.generator.ctrldict:
-            self.write("\n")
             minvalue = self.generator.ctrldict[d.name][0]
             maxvalue = self.generator.ctrldict[d.name][1]
             self.write(
+    "    value_range = ({}, {})\n".format(minvalue, maxvalue) +
+    "\n"
+            )
+            self.write(
     "    def __init__(self, value=None, canBeNull=True, attribName=None):\n" +
     "        super().__init__(value, canBeNull, attribName)\n" +
     "        if type(value) == int and ( value < {} or value > {} ):\n".format(minvalue, maxvalue) +
@@ -593,61 +614,172 @@ class MALBuffer(object):
     "            return None\n"
     "        else:\n"
     "            return self._internal_value\n"
+        ,
+    "    def _shared_value(self):\n"
+    "        \"\"\" internal_value, without unsharing the value of a copy. It is\n"
+    "        read by the encoders and must not be modified.\n"
+    "        \"\"\"\n"
+    "        if self._isNull:\n"
+    "            return None\n"
+    "        else:\n"
+    "            return self._internal_value\n"
+        ,
+    "    def _cow_copy(self):\n"
+    "        \"\"\" Copy keeping the attribName. The value of an attribute is\n"
+    "        immutable, so the attribute itself is shared.\n"
+    "        \"\"\"\n"
+    "        return self\n"
         ]
-        self.write_element_class(d, blockelement)
+        self.write_element_class(d, blockelement, slots=['_isNull', '_canBeNull', 'attribName', '_internal_value'])
 
     def write_abstractelementlist_class(self):
         self.write(
     "class {}({}):\n".format("ElementList", "Element") +
+    "    \"\"\" A copy shares the list of items with the original until one of\n" +
+    "    them reads internal_value, which may be modified in place. Once the\n" +
+    "    list has been handed out, the copies get their own list.\n" +
+    "    \"\"\"\n" +
+    "\n" +
+    "    __slots__ = ['_shared', '_exposed']\n" +
     "    shortForm = None\n" +
     "\n" +
     "    def __init__(self, value=None, canBeNull=True, attribName=None):\n" +
     "        super().__init__(value, canBeNull, attribName)\n"+
+    "        self._shared = False\n" +
+    "        self._exposed = False\n" +
+    "        if type(value) == type(self):\n" +
+    "            if value._isNull and not self._canBeNull:\n" +
+    "                raise ValueError(\"This {} cannot be Null\".format(type(self)))\n" +
+    "            self._share(value)\n" +
+    "        else:\n" +
+    "            itemClass = schema.list_item_type(type(self))\n" +
+    "            listvalue = value if type(value) == list else [value]\n" +
+    "            self._internal_value = [itemClass(v) for v in listvalue]\n" +
     "\n" +
     "    @property\n" +
     "    def internal_value(self):\n" +
-    "       return self._internal_value\n" +
+    "        if self._shared:\n" +
+    "            self._unshare()\n" +
+    "        self._exposed = True\n" +
+    "        return self._internal_value\n" +
     "\n" +
-    "    def copy(self):\n" +
-    "        if self._isNull:\n" +
-    "            value = None\n" +
+    "    def _shared_value(self):\n" +
+    "        return self._internal_value\n" +
+    "\n" +
+    "    def _share(self, other):\n" +
+    "        \"\"\" Take the items of other, of the same type, until one of them is\n" +
+    "        modified.\n" +
+    "        \"\"\"\n" +
+    "        self._isNull = other._isNull\n" +
+    "        self._exposed = False\n" +
+    "        if other._exposed:\n" +
+    "            # The list of other may be modified through a reference handed\n" +
+    "            # out before\n" +
+    "            self._internal_value = [v if v is None else v._cow_copy() for v in other._internal_value]\n" +
+    "            self._shared = False\n" +
     "        else:\n" +
-    "            value = []\n"
-    "            for v in self.internal_value:\n"
-    "                value.append(v.copy())\n"
-    "        return self.__class__(value)\n"
+    "            self._internal_value = other._internal_value\n" +
+    "            self._shared = other._shared = True\n" +
+    "\n" +
+    "    def _unshare(self):\n" +
+    "        self._internal_value = [v if v is None else v._cow_copy() for v in self._internal_value]\n" +
+    "        self._shared = False\n" +
+    "\n" +
+    "    def _cow_copy(self):\n" +
+    "        instance = self.__class__.__new__(self.__class__)\n" +
+    "        instance._canBeNull = self._canBeNull\n" +
+    "        instance.attribName = self.attribName\n" +
+    "        instance._share(self)\n" +
+    "        return instance\n" +
+    "\n" +
+    "    def copy(self):\n" +
+    "        instance = self.__class__.__new__(self.__class__)\n" +
+    "        instance._canBeNull = True\n" +
+    "        instance.attribName = None\n" +
+    "        instance._share(self)\n" +
+    "        return instance\n" +
+    "\n"
+    "    @classmethod\n"
+    "    def _from_items(cls, items, canBeNull=True, attribName=None):\n"
+    "        \"\"\" Trusted constructor: the list of item elements is used as is,\n"
+    "        without checks nor copies.\n"
+    "        \"\"\"\n"
+    "        self = cls.__new__(cls)\n"
+    "        self._isNull = False\n"
+    "        self._canBeNull = canBeNull\n"
+    "        self.attribName = attribName\n"
+    "        self._internal_value = items\n"
+    "        self._shared = False\n"
+    "        self._exposed = False\n"
+    "        return self\n"
         )
         self.write("\n")
         self.write("\n")
 
     def write_attribute_class(self, d):
+        self.write(
+    "class _Polymorphic(object):\n"
+    "    \"\"\" Class attribute of Attribute which is overridden by the instances\n"
+    "    built from another attribute, ex: Attribute(Long(1)).\n"
+    "    \"\"\"\n"
+    "\n"
+    "    def __init__(self, slot):\n"
+    "        self.slot = slot\n"
+    "\n"
+    "    def __get__(self, instance, owner):\n"
+    "        if instance is None:\n"
+    "            return None\n"
+    "        return getattr(instance, self.slot, None)\n"
+    "\n"
+    "    def __set__(self, instance, value):\n"
+    "        setattr(instance, self.slot, value)\n"
+    "\n\n"
+        )
         blockattribute = [
-    "    value_type = None\n"
-        ,
     "    def __init__(self, value=None, canBeNull=True, attribName=None):\n"
     "        super().__init__(value, canBeNull, attribName)\n"
     "        if value is None and self._canBeNull:\n"
     "            self._isNull = True\n"
     "        elif type(value) == type(self):\n"
-    "            self._internal_value = value.copy().internal_value\n"
+    "            self._internal_value = value._internal_value\n"
+    "            if type(self) == Attribute:\n"
+    "                # Attribute built from another attribute, ex: Attribute(Long(1))\n"
+    "                self.shortForm = value.shortForm\n"
+    "                self.value_type = value.value_type\n"
     "        elif type(value) == type(self).value_type:\n"
     "            self._internal_value = value\n"
     "        elif type(self) == type(Attribute(None)) and value.shortForm in range(1,19):\n" +
-    "            self._internal_value = value.copy().internal_value\n" +
+    "            self._internal_value = value._internal_value\n" +
     "            self.shortForm = value.shortForm\n" +
     "            self.value_type = value.value_type\n" +
     "        else:\n"
     "            raise TypeError(\"Expected {}, got {}.\".format(type(self).value_type, type(value)))\n"
         ,
     "    def copy(self):\n"
+    "        if type(self) == Attribute and not self._isNull:\n"
+    "            # Keep the type of the attribute it was built from\n"
+    "            return Attribute(self, self._canBeNull)\n"
     "        return self.__class__(self.internal_value, self._canBeNull)\n"
+        ,
+    "    @classmethod\n"
+    "    def _from_value(cls, value, canBeNull=True, attribName=None):\n"
+    "        \"\"\" Trusted constructor: value is a python value of value_type, or\n"
+    "        None, and is used without checks.\n"
+    "        \"\"\"\n"
+    "        self = cls.__new__(cls)\n"
+    "        self._isNull = value is None\n"
+    "        self._canBeNull = canBeNull\n"
+    "        self.attribName = attribName\n"
+    "        self._internal_value = value\n"
+    "        return self\n"
         ]
-        self.write_element_class(d, blockattribute)
+        self.write_element_class(d, blockattribute, slots=['_shortForm', '_value_type'], polymorphic=True)
 
     def write_abstract_enum_class(self):
         self.write(
     "class AbstractEnum(Attribute):\n"
     "\n"
+    "    __slots__ = []\n"
     "    value_type = None\n"
     "\n"
     "    def __init__(self, value=None, canBeNull=True, attribName=None):\n"
@@ -667,25 +799,398 @@ class MALBuffer(object):
     "\n\n"
         )
 
+    def write_abstractarraylist_class(self):
+        self.write(
+    "def _is_native_buffer(view, typecode):\n"
+    "    \"\"\" True if the memoryview holds numbers which can be copied as is in\n"
+    "    an array of typecode.\n"
+    "    \"\"\"\n"
+    "    if view.ndim != 1 or not view.c_contiguous or view.itemsize != array(typecode).itemsize:\n"
+    "        return False\n"
+    "    return any(view.format in kind and typecode in kind for kind in ('bhilq', 'BHILQ', 'fd'))\n"
+    "\n"
+    "\n"
+    "class _ArrayItems(MutableSequence):\n"
+    "    \"\"\" View of the items of an ArrayElementList, as the list of the items\n"
+    "    of the other ElementLists. The attribute elements are built when they\n"
+    "    are accessed, the items set are stored as python values.\n"
+    "    \"\"\"\n"
+    "\n"
+    "    __slots__ = ['_list']\n"
+    "\n"
+    "    def __init__(self, elementlist):\n"
+    "        self._list = elementlist\n"
+    "\n"
+    "    def __len__(self):\n"
+    "        return len(self._list)\n"
+    "\n"
+    "    def __getitem__(self, index):\n"
+    "        if isinstance(index, slice):\n"
+    "            return [self[i] for i in range(*index.indices(len(self)))]\n"
+    "        return self._list.item_type(self._list.value(index))\n"
+    "\n"
+    "    def __iter__(self):\n"
+    "        item_type = self._list.item_type\n"
+    "        for value in self._list.values():\n"
+    "            yield item_type(value)\n"
+    "\n"
+    "    def __setitem__(self, index, value):\n"
+    "        if isinstance(index, slice):\n"
+    "            values = list(self._list.values())\n"
+    "            values[index] = list(value)\n"
+    "            self._list._replace(values)\n"
+    "        else:\n"
+    "            self._list._set(index, value)\n"
+    "\n"
+    "    def __delitem__(self, index):\n"
+    "        if isinstance(index, slice):\n"
+    "            values = list(self._list.values())\n"
+    "            del values[index]\n"
+    "            self._list._replace(values)\n"
+    "        else:\n"
+    "            self._list._delete(index)\n"
+    "\n"
+    "    def insert(self, index, value):\n"
+    "        self._list._insert(index, value)\n"
+    "\n"
+    "    def append(self, value):\n"
+    "        self._list._append(value)\n"
+    "\n"
+    "\n"
+    "class ArrayElementList(ElementList):\n"
+    "    \"\"\" ElementList of a numeric attribute. The values are stored in an\n"
+    "    array.array and the null items in a bitmap. internal_value is a\n"
+    "    mutable sequence building the attribute elements on access, values()\n"
+    "    gives the python values.\n"
+    "    \"\"\"\n"
+    "\n"
+    "    __slots__ = ['_nulls']\n"
+    "    shortForm = None\n"
+    "    item_type = None\n"
+    "    typecode = None\n"
+    "    # Typecode whose range the values must fit in, when they are stored\n"
+    "    # with a wider typecode (ex: Float values stored as doubles)\n"
+    "    narrow_typecode = None\n"
+    "\n"
+    "    def __init__(self, value=None, canBeNull=True, attribName=None):\n"
+    "        # The items are not built by ElementList\n"
+    "        Element.__init__(self, value, canBeNull, attribName)\n"
+    "        self._shared = False\n"
+    "        self._nulls = None\n"
+    "        if type(value) == type(self):\n"
+    "            if value._isNull:\n"
+    "                if self._canBeNull:\n"
+    "                    self._isNull = True\n"
+    "                else:\n"
+    "                    raise ValueError(\"This {} cannot be Null\".format(type(self)))\n"
+    "                self._internal_value = array(self.typecode)\n"
+    "            else:\n"
+    "                self._internal_value = array(self.typecode, value._internal_value)\n"
+    "                if value._nulls is not None:\n"
+    "                    self._nulls = bytearray(value._nulls)\n"
+    "        else:\n"
+    "            listvalue = value if type(value) in (list, _ArrayItems) else [value]\n"
+    "            try:\n"
+    "                self._internal_value = array(self.typecode, listvalue)\n"
+    "            except (TypeError, OverflowError):\n"
+    "                # Null items or elements\n"
+    "                self._internal_value = array(self.typecode)\n"
+    "                for v in listvalue:\n"
+    "                    self._append(v)\n"
+    "            else:\n"
+    "                self._check_narrow_range(self._internal_value)\n"
+    "\n"
+    "    def _checked_value(self, value):\n"
+    "        \"\"\" Return the python value of an item given as an attribute\n"
+    "        element, a number or None, after checking its range.\n"
+    "        \"\"\"\n"
+    "        if isinstance(value, Element):\n"
+    "            value = self.item_type(value).internal_value\n"
+    "        if value is None:\n"
+    "            return None\n"
+    "        try:\n"
+    "            array(self.typecode, (value,))\n"
+    "        except TypeError:\n"
+    "            raise TypeError(\"Expected {}, got {}.\".format(self.item_type.value_type, type(value)))\n"
+    "        except OverflowError:\n"
+    "            pass\n"
+    "        if not self._is_valid(value):\n"
+    "            raise ValueError(\"{} is out of the range of {}.\".format(value, self.item_type.__name__))\n"
+    "        return value\n"
+    "\n"
+    "    def _set_null(self, index, null=True):\n"
+    "        if null:\n"
+    "            if self._nulls is None:\n"
+    "                self._nulls = bytearray()\n"
+    "            if len(self._nulls) <= index >> 3:\n"
+    "                self._nulls.extend(bytes((index >> 3) + 1 - len(self._nulls)))\n"
+    "            self._nulls[index >> 3] |= 1 << (index & 7)\n"
+    "        elif self.is_null(index):\n"
+    "            self._nulls[index >> 3] &= ~(1 << (index & 7))\n"
+    "\n"
+    "    def _null_indices(self):\n"
+    "        if self._nulls is None:\n"
+    "            return []\n"
+    "        return [i for i in range(len(self._internal_value)) if self.is_null(i)]\n"
+    "\n"
+    "    def _reset_nulls(self, indices):\n"
+    "        self._nulls = None\n"
+    "        for index in indices:\n"
+    "            self._set_null(index)\n"
+    "\n"
+    "    def _append(self, value):\n"
+    "        value = self._checked_value(value)\n"
+    "        self._internal_value.append(0 if value is None else value)\n"
+    "        if value is None:\n"
+    "            self._set_null(len(self._internal_value) - 1)\n"
+    "\n"
+    "    def _set(self, index, value):\n"
+    "        index = range(len(self._internal_value))[index]\n"
+    "        value = self._checked_value(value)\n"
+    "        self._internal_value[index] = 0 if value is None else value\n"
+    "        self._set_null(index, value is None)\n"
+    "\n"
+    "    def _insert(self, index, value):\n"
+    "        # Same bounds as list.insert\n"
+    "        length = len(self._internal_value)\n"
+    "        index = min(max(index + length if index < 0 else index, 0), length)\n"
+    "        if index == length:\n"
+    "            self._append(value)\n"
+    "            return\n"
+    "        value = self._checked_value(value)\n"
+    "        nulls = [i + (i >= index) for i in self._null_indices()]\n"
+    "        self._internal_value.insert(index, 0 if value is None else value)\n"
+    "        if value is None:\n"
+    "            nulls.append(index)\n"
+    "        if nulls:\n"
+    "            self._reset_nulls(nulls)\n"
+    "\n"
+    "    def _delete(self, index):\n"
+    "        index = range(len(self._internal_value))[index]\n"
+    "        nulls = [i - (i > index) for i in self._null_indices() if i != index]\n"
+    "        del self._internal_value[index]\n"
+    "        if self._nulls is not None:\n"
+    "            self._reset_nulls(nulls)\n"
+    "\n"
+    "    def _replace(self, values):\n"
+    "        # All the values are checked before the list is modified\n"
+    "        other = self.__class__(values)\n"
+    "        self._internal_value = other._internal_value\n"
+    "        self._nulls = other._nulls\n"
+    "\n"
+    "    def __len__(self):\n"
+    "        return len(self._internal_value)\n"
+    "\n"
+    "    def is_null(self, index):\n"
+    "        nulls = self._nulls\n"
+    "        return nulls is not None and (index >> 3) < len(nulls) and bool(nulls[index >> 3] & (1 << (index & 7)))\n"
+    "\n"
+    "    def value(self, index):\n"
+    "        index = range(len(self._internal_value))[index]\n"
+    "        return None if self.is_null(index) else self._internal_value[index]\n"
+    "\n"
+    "    def values(self):\n"
+    "        \"\"\" Iterate over the python values of the items, None for the null ones \"\"\"\n"
+    "        if self._nulls is None:\n"
+    "            return iter(self._internal_value)\n"
+    "        return (None if self.is_null(i) else v for i, v in enumerate(self._internal_value))\n"
+    "\n"
+    "    @property\n"
+    "    def internal_value(self):\n"
+    "        return _ArrayItems(self)\n"
+    "\n"
+    "    def _shared_value(self):\n"
+    "        return _ArrayItems(self)\n"
+    "\n"
+    "    def copy(self):\n"
+    "        return self.__class__(self, self._canBeNull)\n"
+    "\n"
+    "    def _cow_copy(self):\n"
+    "        return self.__class__(self, self._canBeNull, self.attribName)\n"
+    "\n"
+    "    @classmethod\n"
+    "    def _from_items(cls, items, canBeNull=True, attribName=None):\n"
+    "        \"\"\" items are python values or None \"\"\"\n"
+    "        return cls(items, canBeNull, attribName)\n"
+    "\n"
+    "    @classmethod\n"
+    "    def from_values(cls, values, canBeNull=True, attribName=None):\n"
+    "        \"\"\" Bulk constructor from python numbers, without null items.\n"
+    "\n"
+    "        values is any iterable, or an object exposing a buffer of numbers of\n"
+    "        the kind and size of the typecode (ex: an array.array or a numpy\n"
+    "        array), which is copied at once. The whole input is checked in a\n"
+    "        single pass, the ValueError gives every offending index.\n"
+    "        \"\"\"\n"
+    "        self = cls.__new__(cls)\n"
+    "        Element.__init__(self, values, canBeNull, attribName)\n"
+    "        self._shared = False\n"
+    "        self._nulls = None\n"
+    "        self._internal_value = array(cls.typecode)\n"
+    "        if values is None:\n"
+    "            self._isNull = True\n"
+    "            return self\n"
+    "        try:\n"
+    "            view = memoryview(values)\n"
+    "        except TypeError:\n"
+    "            view = None\n"
+    "        if view is not None and _is_native_buffer(view, cls.typecode):\n"
+    "            self._internal_value.frombytes(view.cast('B'))\n"
+    "        else:\n"
+    "            if not isinstance(values, Sequence):\n"
+    "                values = list(values)\n"
+    "            try:\n"
+    "                self._internal_value = array(cls.typecode, values)\n"
+    "            except (TypeError, OverflowError):\n"
+    "                raise ValueError(cls._invalid_values_message(values))\n"
+    "        cls._check_narrow_range(self._internal_value)\n"
+    "        return self\n"
+    "\n"
+    "    @classmethod\n"
+    "    def _check_narrow_range(cls, values):\n"
+    "        \"\"\" Check that values, an array of the typecode, fit in the range of\n"
+    "        the narrow typecode.\n"
+    "        \"\"\"\n"
+    "        if cls.narrow_typecode is None:\n"
+    "            return\n"
+    "        # The numbers out of the range are narrowed to infinities\n"
+    "        inf = float('inf')\n"
+    "        narrowed = array(cls.narrow_typecode, values)\n"
+    "        if narrowed.count(inf) != values.count(inf) or narrowed.count(-inf) != values.count(-inf):\n"
+    "            raise ValueError(cls._invalid_values_message(values))\n"
+    "\n"
+    "    @classmethod\n"
+    "    def _is_valid(cls, value):\n"
+    "        try:\n"
+    "            stored = array(cls.typecode, (value,))\n"
+    "        except (TypeError, OverflowError):\n"
+    "            return False\n"
+    "        if cls.narrow_typecode is not None:\n"
+    "            inf = float('inf')\n"
+    "            return abs(array(cls.narrow_typecode, stored)[0]) != inf or abs(stored[0]) == inf\n"
+    "        return True\n"
+    "\n"
+    "    @classmethod\n"
+    "    def _invalid_values_message(cls, values):\n"
+    "        value_range = getattr(cls.item_type, 'value_range', None)\n"
+    "        minvalue, maxvalue = value_range or (None, None)\n"
+    "\n"
+    "        def is_valid(value):\n"
+    "            if type(value) is int and value_range is not None:\n"
+    "                return minvalue <= value <= maxvalue\n"
+    "            return cls._is_valid(value)\n"
+    "\n"
+    "        indices = [i for i, v in enumerate(values) if not is_valid(v)]\n"
+    "        if value_range is not None:\n"
+    "            expected = \"integers between {} and {}\".format(minvalue, maxvalue)\n"
+    "        elif cls.narrow_typecode is not None:\n"
+    "            expected = \"numbers in the {}-bit range\".format(8 * array(cls.narrow_typecode).itemsize)\n"
+    "        else:\n"
+    "            expected = \"numbers\"\n"
+    "        return \"{} values must be {}, invalid at the indices {}.\".format(cls.item_type.__name__, expected, indices)\n"
+    "\n\n"
+        )
+
     def write_abstractcomposite_class(self, d):
         blockcomposite = [
     "    _fieldNumber = 0\n"
+    "    _fields = ()\n"
+        ,
+    "    def __init_subclass__(cls, **kwargs):\n"
+    "        super().__init_subclass__(**kwargs)\n"
+    "        schema.declare_fields(cls)\n"
         ,
     "    def __init__(self, value=None, canBeNull=True, attribName=None):\n"
     "        super().__init__(value, canBeNull, attribName)\n"
-    "        self._internal_value = []\n"
+    "        self._internal_value = [None]*self._fieldNumber\n"
+    "        self._shared = False\n"
+    "        self._exposed = False\n"
+    "        if value is None and self._canBeNull:\n"
+    "            self._isNull = True\n"
+    "        elif type(value) == type(self):\n"
+    "            if value._isNull:\n"
+    "                if self._canBeNull:\n"
+    "                    self._isNull = True\n"
+    "                else:\n"
+    "                    raise ValueError(\"This {} cannot be Null\".format(type(self)))\n"
+    "            else:\n"
+    "                self._share(value)\n"
+    "        elif not self._fields:\n"
+    "            raise RuntimeError(\"This class is abstract and should not be directly called\")\n"
+    "        else:\n"
+    "            for index in range(self._fieldNumber):\n"
+    "                self._set_field(index, value[index])\n"
         ,
-    "    def copy(self):\n"
-    "        if self._isNull:\n"
-    "            value = None\n"
+    "    def _set_field(self, index, value):\n"
+    "        name, fieldClass, canBeNull = schema.field_types(type(self))[index]\n"
+    "        if fieldClass is Attribute and value is not None:\n"
+    "            fieldClass = type(value)\n"
+    "        self._internal_value[index] = fieldClass(value, canBeNull=canBeNull, attribName=name)\n"
+        ,
+    "    @property\n"
+    "    def internal_value(self):\n"
+    "        if self._shared:\n"
+    "            self._unshare()\n"
+    "        self._exposed = True\n"
+    "        return super().internal_value\n"
+        ,
+    "    def _share(self, other):\n"
+    "        \"\"\" Take the fields of other, of the same type, until one of them is\n"
+    "        modified. If a field or the list of the fields of other has been\n"
+    "        handed out, it may be modified through this reference: the fields\n"
+    "        are then copied right away.\n"
+    "        \"\"\"\n"
+    "        self._isNull = other._isNull\n"
+    "        self._exposed = False\n"
+    "        if other._exposed:\n"
+    "            self._internal_value = [v if v is None else v._cow_copy() for v in other._internal_value]\n"
+    "            self._shared = False\n"
     "        else:\n"
-    "            value = []\n"
-    "            for v in self.internal_value:\n"
-    "                value.append(v.copy())\n"
-    "        return self.__class__(value, self._canBeNull)\n"
+    "            self._internal_value = other._internal_value\n"
+    "            self._shared = other._shared = True\n"
+        ,
+    "    def _unshare(self):\n"
+    "        \"\"\" Called before the fields are read or written through the\n"
+    "        properties: the composite and list fields get their own copies, so\n"
+    "        that they can be modified too.\n"
+    "        \"\"\"\n"
+    "        self._internal_value = [v if v is None else v._cow_copy() for v in self._internal_value]\n"
+    "        self._shared = False\n"
+        ,
+    "    def _cow_copy(self):\n"
+    "        instance = self.__class__.__new__(self.__class__)\n"
+    "        instance._canBeNull = self._canBeNull\n"
+    "        instance.attribName = self.attribName\n"
+    "        instance._share(self)\n"
+    "        return instance\n"
+        ,
+    "    def copy(self):\n"
+    "        \"\"\" The copy shares the fields until one of the composites is\n"
+    "        modified.\n"
+    "        \"\"\"\n"
+    "        instance = self.__class__.__new__(self.__class__)\n"
+    "        instance._canBeNull = self._canBeNull\n"
+    "        instance.attribName = None\n"
+    "        instance._share(self)\n"
+    "        return instance\n"
+        ,
+    "    @classmethod\n"
+    "    def _from_fields(cls, fields, canBeNull=True, attribName=None):\n"
+    "        \"\"\" Trusted constructor: fields is the list of the field elements,\n"
+    "        in the order of _fields, each with its attribName. It is used as is,\n"
+    "        without checks nor copies.\n"
+    "        \"\"\"\n"
+    "        self = cls.__new__(cls)\n"
+    "        self._isNull = False\n"
+    "        self._canBeNull = canBeNull\n"
+    "        self.attribName = attribName\n"
+    "        self._internal_value = fields\n"
+    "        self._shared = False\n"
+    "        self._exposed = False\n"
+    "        return self\n"
         ]
 
-        self.write_element_class(d, blockcomposite)
+        self.write_element_class(d, blockcomposite, slots=['_shared', '_exposed'])
 
     def write_composite_class(self, d, blocks=[]):
         parentclass = self._element_parentclass(d)
@@ -698,6 +1203,9 @@ class MALBuffer(object):
     "    \"\"\"{classdoc}\"\"\"\n".format(classdoc=d.comment)
         )
         self.write("\n")
+        self.write(
+    "    __slots__ = []\n"
+        )
         if d.shortFormPart:
             self.write(
     "    shortForm = {}.{}\n".format("MALShortForm", d.name.upper())
@@ -706,74 +1214,23 @@ class MALBuffer(object):
             self.write(
     "    shortForm = None\n"
             )
-        fieldNumber = "{}._fieldNumber + {}".format(parentclass, len(d.fields))
-        self.write(
-    "    _fieldNumber = {}\n".format(fieldNumber)
-            )
-
-        self.write("\n")
-        self.write(
-    "    def __init__(self, value=None, canBeNull=True, attribName=None):\n" +
-    "        super().__init__(value, canBeNull, attribName)\n" +
-    "        self._internal_value += [None]*{}\n".format(len(d.fields)) +
-    "        if value is None and self._canBeNull:\n" +
-    "            self._isNull = True\n" +
-    "        elif type(value) == type(self):\n" +
-    "            if value.internal_value is None:\n" +
-    "                if self._canBeNull:\n" +
-    "                    self._isNull = True\n" +
-    "                else:\n"
-    "                    raise ValueError(\"This {} cannot be Null\".format(type(self)))\n" +
-    "            else:\n" +
-    "                self._internal_value = value.copy().internal_value\n" +
-    "        else:\n"
-        )
         if len(d.fields) == 0:
-            # In this case it's an abstract composite
-            self.write(
-    "            raise RuntimeError(\"This class is abstract and should not be directly called\")\n"
-        )
-
-        for i, field in enumerate(d.fields):
-            index = "{}._fieldNumber + {}".format(parentclass, i)
             self.write(
-    "            self.{} = value[{}]\n".format(field.name, index)
+    "    _fields = {}._fields\n".format(parentclass)
             )
-
-        for i, field in enumerate(d.fields):
-            index = "{}._fieldNumber + {}".format(parentclass, i)
-            fieldtype = self._element_completename(field.maltype)
-            fieldtype_known = True
-
-            if field.maltype.isList:
-                fieldtype += 'List'
-
-            if fieldtype == 'mal.Attribute' or fieldtype == 'Attribute':
-                fieldtype_runtime = "type({})".format(field.name)
-                fieldtype_known = False
-
-            self.write("\n")
+        else:
             self.write(
-    "    @property\n" +
-    "    def {}(self):\n".format(field.name) +
-    "        return self._internal_value[{}]\n".format(index) +
-    "\n" +
-    "    @{}.setter\n".format(field.name) +
-    "    def {0}(self, {0}):\n".format(field.name)
+    "    _fields = {}._fields + (\n".format(parentclass)
             )
-            if fieldtype_known:
+            for field in d.fields:
+                fieldtype = self._element_completename(field.maltype)
+                if field.maltype.isList:
+                    fieldtype += 'List'
                 self.write(
-    "        self._internal_value[{0}] = {1}({2}, canBeNull={3}, attribName='{2}')\n".format(index, fieldtype, field.name, field.canBeNull)
-                )
-            else:
-                self.write(
-    "        if {0} is None:\n".format(field.name) +
-    "            self._internal_value[{0}] = {1}({2}, canBeNull={3}, attribName='{2}')\n".format(index, fieldtype, field.name, field.canBeNull) +
-    "        else:\n" +
-    "            self._internal_value[{0}] = {1}({2}, canBeNull={3}, attribName='{2}')\n".format(index, fieldtype_runtime, field.name, field.canBeNull)
+    "        ('{}', '{}', {}),\n".format(field.name, fieldtype, field.canBeNull)
                 )
             self.write(
-    "        self._isNull = False\n"
+    "    )\n"
             )
 
         self.write("\n")
@@ -784,8 +1241,12 @@ class MALBuffer(object):
             parentclass = "ElementList"
         else:
             parentclass = "mal.ElementList"
+        if self.generator.area.name == "MAL" and d.name in self.generator.arraydict:
+            self.write_arraylist_class(d)
+            return
         self.write(
-    "class {}({}):\n".format(d.name+"List", parentclass)
+    "class {}({}):\n".format(d.name+"List", parentclass) +
+    "    __slots__ = []\n"
         )
 
         if d.shortFormPart:
@@ -796,29 +1257,25 @@ class MALBuffer(object):
             self.write(
     "    shortForm = None\n"
             )
-        self.write(
-    "\n" +
-    "    def __init__(self, value=None, canBeNull=True, attribName=None):\n" +
-    "        super().__init__(value, canBeNull, attribName)\n" +
-    "        self._internal_value = []\n" +
-    "        if type(value) == type(self):\n" +
-    "            if value.internal_value is None:\n" +
-    "                if self._canBeNull:\n" +
-    "                    self._isNull = True\n" +
-    "                else:\n"
-    "                    raise ValueError(\"This {} cannot be Null\".format(type(self)))\n" +
-    "            else:\n" +
-    "                self._internal_value = value.copy().internal_value\n" +
-    "        else:\n" +
-    "            listvalue = value if type(value) == list else [value]\n" +
-    "            for v in listvalue:\n" +
-    "                 self._internal_value.append({}(v))\n".format(d.name)
-                )
+        self.write("\n")
+        self.write("\n")
 
+    def write_arraylist_class(self, d):
+        self.write(
+    "class {}({}):\n".format(d.name+"List", "ArrayElementList") +
+    "    __slots__ = []\n" +
+    "    shortForm = -{}.{}\n".format("MALShortForm", d.name.upper()) +
+    "    item_type = {}\n".format(d.name) +
+    "    typecode = '{}'\n".format(self.generator.arraydict[d.name])
+        )
+        if d.name in self.generator.narrowtypedict:
+            self.write(
+    "    narrow_typecode = '{}'\n".format(self.generator.narrowtypedict[d.name])
+            )
         self.write("\n")
         self.write("\n")
 
-    def write_datatypes(self, data_types):
+    def write_datatypes(self, data_types, service_number=0):
         self.write_shortforms(data_types)
 
         # Abstract ElementList is needed for EnumerationLists
@@ -831,6 +1288,7 @@ class MALBuffer(object):
             if 'Attribute' in data_types['Element']:
                 self.write_attribute_class(data_types['Element']['Attribute'])
                 self.write_abstract_enum_class()
+                self.write_abstractarraylist_class()
             if 'Composite' in data_types['Element']:
                 self.write_abstractcomposite_class(data_types['Element']['Composite'])
 
@@ -850,6 +1308,33 @@ class MALBuffer(object):
                 self.write_composite_class(d)
                 self.write_elementlist_class(d)
 
+        self.write_registration(data_types, service_number)
+
+    def write_registration(self, data_types, service_number):
+        if not data_types:
+            return
+        typenames = []
+        for dname in data_types.get('Element', {}):
+            typenames.append(dname)
+            if dname == 'Element':
+                typenames.append('ElementList')
+            elif dname == 'Attribute':
+                typenames += ['AbstractEnum', 'ArrayElementList']
+            elif dname != 'Composite':
+                typenames.append(dname + 'List')
+        for group in ('Enumeration', 'Composite'):
+            for dname in data_types.get(group, {}):
+                typenames += [dname, dname + 'List']
+        if not typenames:
+            return
+        registry = "registry" if self.generator.area.name == "MAL" else "mal.registry"
+        self.write(
+    "{}.register({}, {}, {}, (\n".format(registry, self.generator.area.number, service_number, self.generator.area.version) +
+    "".join("    {},\n".format(typename) for typename in typenames) +
+    "    ))\n"
+    "\n\n"
+        )
+
     def write_serviceprovider_module(self, service):
 
         self.write(
@@ -881,7 +1366,7 @@ class MALBuffer(object):
                 #for message in operation.messages:
                 #    print('..', message.fields)
 
-        self.write_datatypes(service.datatypes)
+        self.write_datatypes(service.datatypes, service.number)
 
 class MALTypeModuleGenerator(object):
     def __init__(self, module, xml_def_filepath, outpath):
@@ -894,6 +1379,8 @@ class MALTypeModuleGenerator(object):
             parameters = yaml.load(pf, Loader=yaml.SafeLoader)
         self.typedict = parameters['typedict']
         self.ctrldict = parameters['controldict']
+        self.arraydict = parameters['arraydict']
+        self.narrowtypedict = parameters['narrowtypedict']
 
     def save_services(self):
         if not self.service_buffers:
@@ -905,7 +1392,17 @@ class MALTypeModuleGenerator(object):
         service_string_list = ', '.join(["'{}'".format(s) for s in self.service_buffers.keys()])
         with open(initpath, 'w') as f:
             f.write(
-    "__all__ = [{}]\n".format(service_string_list)
+    LICENSE_HEADER +
+    "import importlib\n" +
+    "\n" +
+    "__all__ = [{}]\n".format(service_string_list) +
+    "\n" +
+    "\n" +
+    "def __getattr__(name):\n" +
+    "    # The service modules are imported on first use\n" +
+    "    if name in __all__:\n" +
+    "        return importlib.import_module('.' + name, __name__)\n" +
+    "    raise AttributeError(\"module {!r} has no attribute {!r}\".format(__name__, name))\n"
             )
         for service in self.service_buffers:
             servicemodulepath = os.path.join(dirpath, service + '.py')
@@ -922,14 +1419,29 @@ class MALTypeModuleGenerator(object):
         with open(initpath, 'w') as f:
             if self.module == 'mal':
                 f.write(
+    LICENSE_HEADER +
     "__all__ = ['maltypes']\n" +
     "from .maltypes import *\n" +
-    "from .malinteractions import *\n"
+    "from . import registry\n" +
+    "from . import schema\n" +
+    "from .malinteractions import *\n" +
+    "from .asyncinteractions import *\n" +
+    "from .pubsubbroker import PubSubBroker\n"
                 )
             else:
                 f.write(
+    LICENSE_HEADER +
+    "import importlib\n" +
+    "\n" +
     "__all__ = ['maltypes', 'services']\n" +
-    "from .maltypes import *\n"
+    "from .maltypes import *\n" +
+    "\n" +
+    "\n" +
+    "def __getattr__(name):\n" +
+    "    # The services package is imported on first use\n" +
+    "    if name == 'services':\n" +
+    "        return importlib.import_module('.services', __name__)\n" +
+    "    raise AttributeError(\"module {!r} has no attribute {!r}\".format(__name__, name))\n"
                 )
         with open(maltypespath, 'w') as f:
             f.write(self.datatype_buffer.content)
@@ -3,17 +3,17 @@
 #
 # SPDX-License-Identifier: MIT
 
-import datetime
+import json
 import pickle
 import xml.dom.minidom
+import xml.parsers.expat
 import re
-import sys
+import struct
 from enum import IntEnum
 
+from malpy import timecodec
 from malpy.malpydefinitions import MALPY_ENCODING
-from malpy.mo import mal, com, mc
-from malpy.mo.com.services import *
-from malpy.mo.mc.services import *
+from malpy.mo import mal
 
 LOG_LEVEL = "INFO"
 
@@ -54,6 +54,38 @@ MAL_MODULES = [
     'malpy.mo.mc.services.statistic'
     ]
 
+# The other areas and the services are imported when their types are needed
+mal.registry.declare_modules(MAL_MODULES[1:])
+
+
+# How the XML decoder handles the content of a node of a given class
+_XML_LIST = 'list'
+_XML_COMPOSITE = 'composite'
+_XML_ATTRIBUTE = 'attribute'
+
+
+class _XMLKinds(dict):
+    """ {class: kind}, filled on first use. The kind of None, the class of
+    the nodes named after a composite field, is None.
+    """
+
+    def __missing__(self, objectClass):
+        if objectClass is None:
+            kind = None
+        elif issubclass(objectClass, mal.ElementList):
+            kind = _XML_LIST
+        elif issubclass(objectClass, mal.Composite):
+            kind = _XML_COMPOSITE
+        else:
+            kind = _XML_ATTRIBUTE
+        self[objectClass] = kind
+        return kind
+
+
+# Names of the MAL classes, as used for the XML tags and JSON keys
+XML_TYPES = mal.registry.types_by_name()
+_XML_KINDS = _XMLKinds()
+
 
 class Encoder(object):
     encoding = None
@@ -67,6 +99,16 @@ class Encoder(object):
         raise NotImplementedError("This is to be implemented.")
         return message
 
+    def decode_lazy(self, message):
+        """ Return the message with a body decoded on access (see MALMessage) """
+        return mal.MALMessage(header=message.header,
+                              msg_parts=message.msg_parts,
+                              encoding=self)
+
+    def iter_body(self, body):
+        """ Decode the parts of a non-empty body, one by one """
+        yield from self.decode_body(body)
+
 
 class PickleEncoder(Encoder):
     encoding = MALPY_ENCODING.PICKLE
@@ -77,6 +119,592 @@ class PickleEncoder(Encoder):
     def decode(self, message):
         return pickle.loads(message)
 
+    def decode_lazy(self, message):
+        # The header is pickled with the body
+        return self.decode(message)
+
+
+field_types = mal.schema.field_types
+list_item_type = mal.schema.list_item_type
+
+
+def absolute_short_form(objectClass):
+    """ Return the MAL absolute short form (64 bits) of a class. """
+    return mal.registry.type_absolute_short_form(objectClass)
+
+
+class_from_absolute_short_form = mal.registry.type_from_absolute_short_form
+attribute_from_short_form = mal.registry.attribute_from_short_form
+
+
+def _element_class(element):
+    """ Class of an element, or of the attribute it was built from for an
+    Attribute built from another attribute, ex: Attribute(Long(1)).
+    """
+    objectClass = type(element)
+    if objectClass is mal.Attribute:
+        return attribute_from_short_form(element.shortForm)
+    return objectClass
+
+
+def _is_abstract(objectClass):
+    return objectClass.shortForm is None and not issubclass(objectClass, mal.ElementList)
+
+
+# How the binary decoder builds an element of a given class
+_BINARY_ARRAY_LIST = 0
+_BINARY_LIST = 1
+_BINARY_COMPOSITE = 2
+_BINARY_ENUM = 3
+_BINARY_ATTRIBUTE = 4
+_BINARY_KINDS = {}
+_ENUM_MEMBERS = {}
+_ENUM_ORDINALS = {}
+
+
+def _binary_kind(objectClass):
+    try:
+        return _BINARY_KINDS[objectClass]
+    except KeyError:
+        if issubclass(objectClass, mal.ArrayElementList):
+            kind = _BINARY_ARRAY_LIST
+        elif issubclass(objectClass, mal.ElementList):
+            kind = _BINARY_LIST
+        elif issubclass(objectClass, mal.Composite):
+            kind = _BINARY_COMPOSITE
+        elif issubclass(objectClass, mal.AbstractEnum):
+            kind = _BINARY_ENUM
+            _ENUM_MEMBERS[objectClass] = list(objectClass.value_type)
+            _ENUM_ORDINALS[objectClass] = {v: i for i, v in enumerate(_ENUM_MEMBERS[objectClass])}
+        else:
+            kind = _BINARY_ATTRIBUTE
+        _BINARY_KINDS[objectClass] = kind
+        return kind
+
+
+_FLOAT = struct.Struct('>f')
+_DOUBLE = struct.Struct('>d')
+_OCTET = struct.Struct('>b')
+
+
+class BinaryWriter(object):
+    """ Output stream of the MAL binary encoding.
+
+    Octets are written as is, floats as IEEE 754 big-endian and all the
+    other integers as variable-length integers (zig-zag for signed ones).
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def getvalue(self):
+        return bytes(self.buffer)
+
+    def write_boolean(self, value):
+        self.buffer.append(1 if value else 0)
+
+    def write_presence(self, value):
+        self.write_boolean(value)
+
+    def write_octet(self, value):
+        self.buffer += _OCTET.pack(value)
+
+    def write_uoctet(self, value):
+        self.buffer.append(value)
+
+    def write_uvarint(self, value):
+        buffer = self.buffer
+        while value > 0x7F:
+            buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    def write_varint(self, value):
+        # zig-zag encoding: 0, -1, 1, -2... -> 0, 1, 2, 3...
+        self.write_uvarint((value << 1) if value >= 0 else ((-value << 1) - 1))
+
+    def write_float(self, value):
+        self.buffer += _FLOAT.pack(value)
+
+    def write_double(self, value):
+        self.buffer += _DOUBLE.pack(value)
+
+    def write_blob(self, value):
+        self.write_uvarint(len(value))
+        self.buffer += value
+
+    def write_string(self, value):
+        self.write_blob(value.encode('utf-8'))
+
+
+class BinaryReader(object):
+    """ Input stream of the MAL binary encoding.
+
+    The data is read through a memoryview, so that decoding a bytearray
+    or a memoryview does not copy the message first.
+    """
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def read_boolean(self):
+        value = self.data[self.offset]
+        self.offset += 1
+        return value != 0
+
+    def read_presence(self):
+        return self.read_boolean()
+
+    def read_octet(self):
+        value = _OCTET.unpack_from(self.data, self.offset)[0]
+        self.offset += 1
+        return value
+
+    def read_uoctet(self):
+        value = self.data[self.offset]
+        self.offset += 1
+        return value
+
+    def read_uvarint(self):
+        data = self.data
+        offset = self.offset
+        value = 0
+        shift = 0
+        while True:
+            b = data[offset]
+            offset += 1
+            value |= (b & 0x7F) << shift
+            if b < 0x80:
+                break
+            shift += 7
+        self.offset = offset
+        return value
+
+    def read_varint(self):
+        value = self.read_uvarint()
+        return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+    def read_float(self):
+        value = _FLOAT.unpack_from(self.data, self.offset)[0]
+        self.offset += 4
+        return value
+
+    def read_double(self):
+        value = _DOUBLE.unpack_from(self.data, self.offset)[0]
+        self.offset += 8
+        return value
+
+    def _read_slice(self):
+        size = self.read_uvarint()
+        start = self.offset
+        self.offset += size
+        if self.offset > len(self.data):
+            raise ValueError("Truncated binary message.")
+        return self.data[start:self.offset]
+
+    def read_blob(self):
+        return self._read_slice().tobytes()
+
+    def read_string(self):
+        return str(self._read_slice(), 'utf-8')
+
+    def at_end(self):
+        """ True when all the parts of the body are read """
+        return self.offset >= len(self.data)
+
+
+def _write_boolean(stream, value):
+    # Through the stream, so that the split-binary one packs it in its bitfield
+    stream.write_boolean(value)
+
+
+def _read_boolean(stream):
+    return stream.read_boolean()
+
+
+def _write_time(stream, value):
+    # milliseconds since the epoch
+    stream.write_varint(int(round(value * 1000)))
+
+
+def _read_time(stream):
+    return stream.read_varint() / 1000
+
+
+def _write_finetime(stream, value):
+    # nanoseconds since the epoch
+    stream.write_varint(int(round(value * 1000000000)))
+
+
+def _read_finetime(stream):
+    return stream.read_varint() / 1000000000
+
+
+_ATTRIBUTE_WRITERS = {
+    mal.MALShortForm.BLOB: BinaryWriter.write_blob,
+    mal.MALShortForm.BOOLEAN: _write_boolean,
+    mal.MALShortForm.DURATION: BinaryWriter.write_double,
+    mal.MALShortForm.FLOAT: BinaryWriter.write_float,
+    mal.MALShortForm.DOUBLE: BinaryWriter.write_double,
+    mal.MALShortForm.IDENTIFIER: BinaryWriter.write_string,
+    mal.MALShortForm.OCTET: BinaryWriter.write_octet,
+    mal.MALShortForm.UOCTET: BinaryWriter.write_uoctet,
+    mal.MALShortForm.SHORT: BinaryWriter.write_varint,
+    mal.MALShortForm.USHORT: BinaryWriter.write_uvarint,
+    mal.MALShortForm.INTEGER: BinaryWriter.write_varint,
+    mal.MALShortForm.UINTEGER: BinaryWriter.write_uvarint,
+    mal.MALShortForm.LONG: BinaryWriter.write_varint,
+    mal.MALShortForm.ULONG: BinaryWriter.write_uvarint,
+    mal.MALShortForm.STRING: BinaryWriter.write_string,
+    mal.MALShortForm.TIME: _write_time,
+    mal.MALShortForm.FINETIME: _write_finetime,
+    mal.MALShortForm.URI: BinaryWriter.write_string,
+    }
+
+_ATTRIBUTE_READERS = {
+    mal.MALShortForm.BLOB: BinaryReader.read_blob,
+    mal.MALShortForm.BOOLEAN: _read_boolean,
+    mal.MALShortForm.DURATION: BinaryReader.read_double,
+    mal.MALShortForm.FLOAT: BinaryReader.read_float,
+    mal.MALShortForm.DOUBLE: BinaryReader.read_double,
+    mal.MALShortForm.IDENTIFIER: BinaryReader.read_string,
+    mal.MALShortForm.OCTET: BinaryReader.read_octet,
+    mal.MALShortForm.UOCTET: BinaryReader.read_uoctet,
+    mal.MALShortForm.SHORT: BinaryReader.read_varint,
+    mal.MALShortForm.USHORT: BinaryReader.read_uvarint,
+    mal.MALShortForm.INTEGER: BinaryReader.read_varint,
+    mal.MALShortForm.UINTEGER: BinaryReader.read_uvarint,
+    mal.MALShortForm.LONG: BinaryReader.read_varint,
+    mal.MALShortForm.ULONG: BinaryReader.read_uvarint,
+    mal.MALShortForm.STRING: BinaryReader.read_string,
+    mal.MALShortForm.TIME: _read_time,
+    mal.MALShortForm.FINETIME: _read_finetime,
+    mal.MALShortForm.URI: BinaryReader.read_string,
+    }
+
+
+# Compiled binary codecs
+#
+# The first time a Composite or an ElementList class is encoded or decoded,
+# its field table (_fields, written by the generator) is compiled into
+# straight-line functions: each field is written and read with the writer,
+# reader and class of its type, without looking them up for each element.
+# Abstract fields and nested composites and lists go through the encoder,
+# which uses their own compiled functions.
+_BINARY_ENCODERS = {}
+_BINARY_DECODERS = {}
+
+
+def _is_polymorphic(fieldClass):
+    return fieldClass is mal.Attribute or _is_abstract(fieldClass)
+
+
+def _encode_field_source(namespace, i, fieldClass, canBeNull, indent):
+    """ Source encoding the element f, of the class fieldClass """
+    namespace['c{}'.format(i)] = fieldClass
+    if _is_polymorphic(fieldClass):
+        return [indent + "encoder._encode_field(stream, f, c{}, {})".format(i, canBeNull)]
+    lines = [indent + "v = None if f is None else f._shared_value()",
+             indent + "if v is None:"]
+    if canBeNull:
+        lines.append(indent + "    write_presence(False)")
+    else:
+        lines.append(indent + "    raise ValueError('This {} cannot be Null.')".format(fieldClass.__name__))
+    lines.append(indent + "else:")
+    if canBeNull:
+        lines.append(indent + "    write_presence(True)")
+    kind = _binary_kind(fieldClass)
+    if kind == _BINARY_ATTRIBUTE:
+        namespace['w{}'.format(i)] = _ATTRIBUTE_WRITERS[fieldClass.shortForm]
+        lines.append(indent + "    w{}(stream, v)".format(i))
+    elif kind == _BINARY_ENUM:
+        namespace['o{}'.format(i)] = _ENUM_ORDINALS[fieldClass]
+        write = 'write_uoctet' if len(_ENUM_ORDINALS[fieldClass]) <= 0x100 else 'write_uvarint'
+        lines.append(indent + "    stream.{}(o{}[v])".format(write, i))
+    else:
+        lines.append(indent + "    encoder._encode_value(stream, f)")
+    return lines
+
+
+def _decode_field_source(namespace, i, fieldClass, canBeNull, name, indent):
+    """ Source decoding the element f, of the class fieldClass. Null fields
+    are null elements, as built by the setters.
+    """
+    namespace['c{}'.format(i)] = fieldClass
+    if _is_polymorphic(fieldClass):
+        return [indent + "f = encoder._decode_field(stream, c{0}, {1}, {2!r})".format(i, canBeNull, name),
+                indent + "if f is None:",
+                indent + "    f = c{0}(None, True, {1!r})".format(i, name)]
+    kind = _binary_kind(fieldClass)
+    if kind == _BINARY_ATTRIBUTE:
+        namespace['r{}'.format(i)] = _ATTRIBUTE_READERS[fieldClass.shortForm]
+        value = "c{0}._from_value(r{0}(stream), {1}, {2!r})".format(i, canBeNull, name)
+    elif kind == _BINARY_ENUM:
+        namespace['m{}'.format(i)] = _ENUM_MEMBERS[fieldClass]
+        read = 'read_uoctet' if len(_ENUM_MEMBERS[fieldClass]) <= 0x100 else 'read_uvarint'
+        value = "c{0}._from_value(m{0}[stream.{1}()], {2}, {3!r})".format(i, read, canBeNull, name)
+    else:
+        value = "encoder._decode_value(stream, c{0}, {1}, {2!r})".format(i, canBeNull, name)
+    if canBeNull:
+        value = "{} if read_presence() else c{}(None, True, {!r})".format(value, i, name)
+    return [indent + "f = " + value]
+
+
+def _compile(name, lines, namespace):
+    exec(compile("\n".join(lines) + "\n", "<codec {}>".format(name), "exec"), namespace)
+    return namespace[name]
+
+
+def _binary_encoder(objectClass):
+    """ Return the function encoding the internal value of a Composite or
+    an ElementList of the given class.
+    """
+    try:
+        return _BINARY_ENCODERS[objectClass]
+    except KeyError:
+        pass
+    namespace = {}
+    lines = ["def encode(encoder, stream, value):",
+             "    write_presence = stream.write_presence"]
+    if _binary_kind(objectClass) == _BINARY_LIST:
+        lines += ["    stream.write_uvarint(len(value))",
+                  "    for f in value:"]
+        lines += _encode_field_source(namespace, 0, list_item_type(objectClass), True, "        ")
+    else:
+        for i, (_, fieldClass, canBeNull) in enumerate(field_types(objectClass)):
+            lines.append("    f = value[{}]".format(i))
+            lines += _encode_field_source(namespace, i, fieldClass, canBeNull, "    ")
+    encode = _compile('encode', lines, namespace)
+    _BINARY_ENCODERS[objectClass] = encode
+    return encode
+
+
+def _binary_decoder(objectClass):
+    """ Return the function decoding a Composite or an ElementList of the
+    given class.
+    """
+    try:
+        return _BINARY_DECODERS[objectClass]
+    except KeyError:
+        pass
+    namespace = {'cls': objectClass}
+    lines = ["def decode(encoder, stream, canBeNull, attribName):",
+             "    read_presence = stream.read_presence"]
+    if _binary_kind(objectClass) == _BINARY_LIST:
+        lines += ["    items = []",
+                  "    for _ in range(stream.read_uvarint()):"]
+        lines += _decode_field_source(namespace, 0, list_item_type(objectClass), True, None, "        ")
+        lines += ["        items.append(f)",
+                  "    return cls._from_items(items, canBeNull, attribName)"]
+    else:
+        fields = field_types(objectClass)
+        for i, (name, fieldClass, canBeNull) in enumerate(fields):
+            lines += _decode_field_source(namespace, i, fieldClass, canBeNull, name, "    ")
+            lines.append("    f{} = f".format(i))
+        lines.append("    return cls._from_fields([{}], canBeNull, attribName)".format(
+            ", ".join("f{}".format(i) for i in range(len(fields)))))
+    decode = _compile('decode', lines, namespace)
+    _BINARY_DECODERS[objectClass] = decode
+    return decode
+
+
+class BinaryEncoder(Encoder):
+    """ MAL Binary encoding.
+
+    Each part of the body is encoded as a nullable abstract Element: a
+    presence flag, the absolute short form of its type, then its value.
+    Nullable fields of composites are preceded by a presence flag and
+    Attribute fields (ex: Pair.first) by the short form of their type.
+    """
+    encoding = MALPY_ENCODING.BINARY
+    writer_class = BinaryWriter
+    reader_class = BinaryReader
+
+    def encode(self, message):
+        encoded_body = message.encoded_body(self)
+        if encoded_body is None:
+            encoded_body = self.encode_body(message.msg_parts)
+        encoded_message = mal.MALMessage(header=message.header,
+                                         msg_parts=encoded_body)
+        return encoded_message
+
+    def decode(self, message):
+        decoded_body = self.decode_body(message.msg_parts)
+        decoded_message = mal.MALMessage(header=message.header,
+                                         msg_parts=decoded_body)
+        return decoded_message
+
+    def encode_body(self, body):
+        if body is None:
+            return b""
+        if type(body) is not list:
+            body = [body]
+        stream = self.writer_class()
+        for element in body:
+            self._encode_field(stream, element, mal.Element, True)
+        return stream.getvalue()
+
+    def decode_body(self, body):
+        if len(body) == 0:
+            return None
+        return list(self.iter_body(body))
+
+    def iter_body(self, body):
+        stream = self.reader_class(body)
+        while not stream.at_end():
+            yield self._decode_field(stream, mal.Element, True)
+
+    def _encode_field(self, stream, element, fieldClass, canBeNull):
+        isNull = element is None or element._shared_value() is None
+        if canBeNull:
+            stream.write_presence(not isNull)
+            if isNull:
+                return
+        elif isNull:
+            raise ValueError("This {} cannot be Null.".format(fieldClass.__name__))
+
+        if fieldClass is mal.Attribute:
+            stream.write_uoctet(element.shortForm - 1)
+        elif _is_abstract(fieldClass):
+            stream.write_varint(absolute_short_form(_element_class(element)))
+        self._encode_value(stream, element)
+
+    def _encode_value(self, stream, element):
+        objectClass = type(element)
+        kind = _binary_kind(objectClass)
+        if kind == _BINARY_ARRAY_LIST:
+            # The values are written from the array, without building the items
+            write = _ATTRIBUTE_WRITERS[objectClass.item_type.shortForm]
+            write_presence = stream.write_presence
+            stream.write_uvarint(len(element))
+            for value in element.values():
+                write_presence(value is not None)
+                if value is not None:
+                    write(stream, value)
+            return
+        value = element._shared_value()
+        if kind == _BINARY_ATTRIBUTE:
+            _ATTRIBUTE_WRITERS[element.shortForm](stream, value)
+        elif kind == _BINARY_ENUM:
+            self._encode_enum(stream, objectClass, _ENUM_ORDINALS[objectClass][value])
+        else:
+            _binary_encoder(objectClass)(self, stream, value)
+
+    def _encode_enum(self, stream, objectClass, ordinal):
+        size = len(objectClass.value_type)
+        if size <= 0x100:
+            stream.write_uoctet(ordinal)
+        else:
+            stream.write_uvarint(ordinal)
+
+    def _decode_enum(self, stream, objectClass):
+        members = _ENUM_MEMBERS[objectClass]
+        if len(members) <= 0x100:
+            ordinal = stream.read_uoctet()
+        else:
+            ordinal = stream.read_uvarint()
+        return members[ordinal]
+
+    def _decode_field(self, stream, fieldClass, canBeNull, attribName=None):
+        """ Decode a field into an element, or None if it is null. The
+        decoded values are already checked by the readers, so the elements
+        are built with the trusted constructors.
+        """
+        if canBeNull and not stream.read_presence():
+            return None
+
+        if fieldClass is mal.Attribute:
+            objectClass = attribute_from_short_form(stream.read_uoctet() + 1)
+        elif _is_abstract(fieldClass):
+            objectClass = class_from_absolute_short_form(stream.read_varint())
+        else:
+            objectClass = fieldClass
+        return self._decode_value(stream, objectClass, canBeNull, attribName)
+
+    def _decode_value(self, stream, objectClass, canBeNull=True, attribName=None):
+        kind = _binary_kind(objectClass)
+        if kind == _BINARY_ATTRIBUTE:
+            return objectClass._from_value(_ATTRIBUTE_READERS[objectClass.shortForm](stream), canBeNull, attribName)
+        elif kind == _BINARY_ARRAY_LIST:
+            read = _ATTRIBUTE_READERS[objectClass.item_type.shortForm]
+            read_presence = stream.read_presence
+            values = [read(stream) if read_presence() else None for _ in range(stream.read_uvarint())]
+            return objectClass._from_items(values, canBeNull, attribName)
+        elif kind == _BINARY_ENUM:
+            return objectClass._from_value(self._decode_enum(stream, objectClass), canBeNull, attribName)
+        else:
+            return _binary_decoder(objectClass)(self, stream, canBeNull, attribName)
+
+
+class SplitBinaryWriter(BinaryWriter):
+    """ Output stream of the MAL split-binary encoding.
+
+    Booleans and presence flags are packed in a bitfield (least significant
+    bit first) which is written before the data, prefixed by its size. The
+    unused bits of its last byte are set, so that the presence flags of the
+    null parts ending a body are not taken for padding.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.bits = 0
+        self.bitcount = 0
+
+    def getvalue(self):
+        size = (self.bitcount + 7) // 8
+        padding = (1 << (8 * size)) - (1 << self.bitcount)
+        bitfield = (self.bits | padding).to_bytes(size, 'little')
+        header = BinaryWriter()
+        header.write_blob(bitfield)
+        return bytes(header.buffer + self.buffer)
+
+    def write_boolean(self, value):
+        if value:
+            self.bits |= 1 << self.bitcount
+        self.bitcount += 1
+
+    def write_presence(self, value):
+        self.write_boolean(value)
+
+
+class SplitBinaryReader(BinaryReader):
+    """ Input stream of the MAL split-binary encoding. """
+
+    def __init__(self, data):
+        super().__init__(data)
+        bitfield = self._read_slice()
+        self.bits = int.from_bytes(bitfield, 'little')
+        self.bitsize = 8 * len(bitfield)
+        self.bitcount = 0
+
+    def read_boolean(self):
+        value = (self.bits >> self.bitcount) & 1
+        self.bitcount += 1
+        return value == 1
+
+    def read_presence(self):
+        return self.read_boolean()
+
+    def at_end(self):
+        # Every part but a null one writes data: once the data is read,
+        # the parts left are null ones, until the padding bits (set)
+        if self.offset < len(self.data) or self.bitcount >= self.bitsize:
+            return self.offset >= len(self.data)
+        return (self.bits >> self.bitcount) & 1 == 1
+
+
+class SplitBinaryEncoder(BinaryEncoder):
+    """ MAL Split-Binary encoding.
+
+    Same layout as the binary encoding, except that booleans and presence
+    flags are gathered in a leading bitfield. The body can be decoded
+    directly from a memoryview.
+    """
+    encoding = MALPY_ENCODING.SPLITBINARY
+    writer_class = SplitBinaryWriter
+    reader_class = SplitBinaryReader
+
 
 MAL_XML_NAMESPACE_URL = "http://www.ccsds.org/schema/malxml/MAL"
 MAL_XML = "xmlns:malxml"
@@ -85,13 +713,140 @@ XML_XSI_NAMESPACE_URL = "http://www.w3.org/2001/XMLSchema-instance"
 XML_NAMESPACE = "http://www.w3.org/2000/xmlns/"
 XMLNS_XSI = "xmlns:xsi"
 XMLNS = "xmlns"
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+
+def _escape_xml(text):
+    # Same as xml.sax.saxutils.escape(text, {'"': "&quot;"}), whose import
+    # pulls urllib and http
+    return text.replace("&", "&amp;").replace(">", "&gt;").replace("<", "&lt;").replace('"', "&quot;")
+
+
+def _parse_boolean(text):
+    return text in ('True', 'true')
+
+
+_XML_TEXT_PARSERS = {
+    mal.Time: timecodec.parse_time,
+    mal.FineTime: timecodec.parse_finetime,
+    }
+
+
+def _xml_text_parser(objectClass):
+    """ Return the function converting the text of an XML leaf to the
+    python value of the given Attribute class.
+    """
+    try:
+        return _XML_TEXT_PARSERS[objectClass]
+    except KeyError:
+        pass
+    value_type = objectClass.value_type
+    if issubclass(value_type, IntEnum):
+        parser = value_type.__getitem__
+    elif value_type is bytes:
+        parser = bytes.fromhex
+    elif value_type is bool:
+        parser = _parse_boolean
+    else:
+        parser = value_type
+    _XML_TEXT_PARSERS[objectClass] = parser
+    return parser
+
+
+def _typed_value(declaredClass, node):
+    """ Value of a typed node (ex: <Long>1</Long>) for a field or a list
+    item of type declaredClass.
+    """
+    objectClass, payload = node
+    if payload is None:
+        return None
+    if objectClass is declaredClass:
+        return payload
+    # Polymorphic field (ex: Pair.first), the setter needs an Element
+    return objectClass(payload)
+
+
+def _field_value(declaredClass, node):
+    """ Value of a node named after a composite field. """
+    objectClass, payload = node
+    if objectClass is not None:
+        return _typed_value(declaredClass, node)
+    if payload is None:
+        return None
+    if issubclass(declaredClass, mal.ElementList):
+        itemClass = list_item_type(declaredClass)
+        return [_typed_value(itemClass, child) for child in payload]
+    if len(payload) == 1 and payload[0][0] is not None:
+        return _typed_value(declaredClass, payload[0])
+    # A composite written without its type tag: its children are its fields
+    return [_field_value(fieldClass, child) for (_, fieldClass, _), child
+            in zip(field_types(declaredClass), payload)]
+
+
+# Compiled XML writers of the composites and lists, as for the binary
+# encoding: the attribute fields of a known type are written inline, the
+# other fields go through the generic writer.
+_XML_WRITERS = {}
+
+
+def _xml_text_source(fieldClass):
+    """ Source converting the value v of an attribute of the given class to
+    the escaped text of its node.
+    """
+    if _binary_kind(fieldClass) == _BINARY_ENUM:
+        return "v.name"
+    elif fieldClass is mal.Blob:
+        return "v.hex()"
+    elif fieldClass in (mal.Time, mal.FineTime):
+        return "escape(attribute_to_text(f))"
+    elif fieldClass.value_type is str:
+        return "escape(v)"
+    else:
+        return "str(v)"
+
+
+def _xml_writer(objectClass):
+    """ Return the function writing the child nodes of a Composite or an
+    ElementList of the given class.
+    """
+    try:
+        return _XML_WRITERS[objectClass]
+    except KeyError:
+        pass
+    namespace = {'escape': _escape_xml, 'attribute_to_text': XMLEncoder._attribute_to_text}
+    lines = ["def write_children(write, value, newline, tab, encode_internal):"]
+    if _binary_kind(objectClass) in (_BINARY_LIST, _BINARY_ARRAY_LIST):
+        lines.append("    for f in value:")
+        fields = [(None, list_item_type(objectClass))]
+    else:
+        fields = [("value[{}]".format(i), fieldClass) for i, (_, fieldClass, _) in enumerate(field_types(objectClass))]
+    indent = "        " if fields and fields[0][0] is None else "    "
+    for field, fieldClass in fields:
+        if field is not None:
+            lines.append(indent + "f = " + field)
+        if _is_polymorphic(fieldClass) or _binary_kind(fieldClass) not in (_BINARY_ATTRIBUTE, _BINARY_ENUM):
+            lines.append(indent + "encode_internal(f, newline)")
+            continue
+        typename = fieldClass.__name__
+        lines += [indent + "if f is not None:",
+                  indent + "    v = f._shared_value()",
+                  indent + "    if v is None:",
+                  indent + "        write('{{}}<{{}} xsi:nil=\"true\"/>'.format(newline, f.attribName or {!r}))".format(typename),
+                  indent + "    else:",
+                  indent + "        write('{{0}}<{{1}}>{{0}}{{2}}<{0}>{{3}}</{0}>{{0}}</{{1}}>'.format(newline, f.attribName or {0!r}, tab, {1}))".format(
+                      typename, _xml_text_source(fieldClass))]
+    write_children = _compile('write_children', lines, namespace)
+    _XML_WRITERS[objectClass] = write_children
+    return write_children
 
 
 class XMLEncoder(Encoder):
     encoding = MALPY_ENCODING.XML
 
     def encode(self, message):
-        encoded_body = self.encode_body(message.msg_parts)
+        encoded_body = message.encoded_body(self)
+        if encoded_body is None:
+            encoded_body = self.encode_body(message.msg_parts)
         encoded_message = mal.MALMessage(header=message.header,
                                          msg_parts=encoded_body)
         return encoded_message
@@ -102,7 +857,84 @@ class XMLEncoder(Encoder):
                                          msg_parts=decoded_body)
         return decoded_message
 
+    def __init__(self, indent=False, use_dom=False):
+        """ @param indent: indent the encoded document with tabs
+            @param use_dom: build the document with xml.dom.minidom (slower,
+                            always indented), for debugging purposes
+        """
+        self.indent = indent
+        self.use_dom = use_dom
+
+    @staticmethod
+    def _attribute_to_text(element):
+        # Special case for IntEnum (the encoded message is a string that we convert to enums)
+        if issubclass(type(element.internal_value), IntEnum):
+            value = element.internal_value.name
+        # Special case for Blob (the value is b'toto' and we want 'toto')
+        elif _element_class(element) is mal.maltypes.Blob:
+            value = element.internal_value.hex()
+        # Special case for Time (value is a timestamp and we want YYYY-MM-DDThh:mm:ss.sss)
+        elif _element_class(element) is mal.maltypes.Time:
+            value = timecodec.format_time(element.internal_value)
+        # Special case for FineTime (value is a timestamp and we want YYYY-MM-DDThh:mm:ss.sssssssss)
+        elif _element_class(element) is mal.maltypes.FineTime:
+            value = timecodec.format_finetime(element.internal_value)
+        # Normal case
+        else:
+            value = str(element.internal_value)
+        return value
+
     def encode_body(self, body):
+        # Recursively go through the object to encode it (a composite is a list of list)
+        if type(body) is not list:
+            body = [body]
+
+        if self.use_dom:
+            return self._encode_body_dom(body)
+        else:
+            return self._encode_body_stream(body)
+
+    def _encode_body_stream(self, body):
+        """ Write the document in a single pass over the elements, without
+        building a DOM. The chunks are joined and encoded once at the end.
+        """
+        chunks = [XML_DECLARATION, '<{} {}="{}" {}="{}">'.format(
+            MAL_XML_BODY, XMLNS_XSI, XML_XSI_NAMESPACE_URL, MAL_XML, MAL_XML_NAMESPACE_URL)]
+        write = chunks.append
+        indent = self.indent
+        tab = '\t' if indent else ''
+        attribute_to_text = self._attribute_to_text
+
+        def _encode_internal(element, newline):
+            if element is None:
+                return
+
+            # The node name is attribName if it exists, otherwise its type
+            nodename = element.attribName or _element_class(element).__name__
+            value = element._shared_value()
+
+            # Deal with the Null type: <longElement xsi:nil="true"/>
+            if value is None:
+                write('{}<{} xsi:nil="true"/>'.format(newline, nodename))
+            # if it's a composite or a list of thing
+            elif _binary_kind(type(element)) not in (_BINARY_ATTRIBUTE, _BINARY_ENUM):
+                write('{}<{}>'.format(newline, nodename))
+                subnewline = newline + '\t' if indent else ''
+                _xml_writer(type(element))(write, value, subnewline, tab, _encode_internal)
+                write('{}</{}>'.format(newline, nodename))
+            # else it's an attribute: <longElement><Long>9</Long></longElement>
+            else:
+                typename = _element_class(element).__name__
+                write('{0}<{1}>{2}<{3}>{4}</{3}>{0}</{1}>'.format(
+                    newline, nodename, newline + '\t' if indent else '',
+                    typename, _escape_xml(attribute_to_text(element))))
+
+        for element in body:
+            _encode_internal(element, '\n\t' if indent else '')
+        write('\n</{}>\n'.format(MAL_XML_BODY) if indent else '</{}>'.format(MAL_XML_BODY))
+        return ''.join(chunks).encode('utf-8')
+
+    def _encode_body_dom(self, body):
 
         def _encode_internal(element, parent):
             domdoc = parent.ownerDocument
@@ -112,53 +944,30 @@ class XMLEncoder(Encoder):
 
             # The node name is attribName if it exists, otherwise its type
             # ex: <longElement> ?? </longElement> or <Identifier> ?? </Identifier>
-            nodename = element.attribName or type(element).__name__
+            nodename = element.attribName or _element_class(element).__name__
             subnode = parent.appendChild(domdoc.createElement(nodename))
 
             # Deal with the Null type:
-            if element.internal_value is None:
+            if element._shared_value() is None:
                 # ex: <longElement xsi:nul="True" /> or <Identifier xsi:nul="True" />
                 # It's a leaf, we don't recurse deeper.
                 subnode.setAttribute('xsi:nil', 'true')
             # if it's a list, it means this is a composite or a list of thing
-            elif type(element.internal_value) is list:
+            elif isinstance(element, (mal.Composite, mal.ElementList)):
                 # so we recurse over each item and append them below the objects
                 # ex: the ?? is defined with the same algorithm
-                for subelement in element.internal_value:
+                for subelement in element._shared_value():
                     _encode_internal(subelement, subnode)
             # else it's an attribute we add a subnode
             else:
                 if issubclass(type(element), mal.Composite):
                     # it's a composite, so we recurse
-                    _encode_internal(element.internal_value, subnode)
+                    _encode_internal(element._shared_value(), subnode)
                 else:
                     # ex: <longElement><Long>9</Long><longElement> or <Identifier><Identifier>LIVE</Identifier></Identifier>
                     # It's a leaf, we don't recurse deeper.
-                    attributenode = subnode.appendChild(domdoc.createElement(type(element).__name__))
-                    # Special case for IntEnum (the encoded message is a string that we convert to enums)
-                    if issubclass(type(element.internal_value), IntEnum):
-                        value = element.internal_value.name
-                    # Special case for Blob (the value is b'toto' and we want 'toto')
-                    elif type(element) is mal.maltypes.Blob:
-                        value = element.internal_value.hex()
-                    # Special case for Time (value is a timestamp and we want YYYY-MM-DDThh:mm:ss.sss)
-                    elif type(element) is mal.maltypes.Time:
-                        value = datetime.datetime.fromtimestamp(element.internal_value).isoformat()
-                        if '.' in value:  # it means we have microsecond
-                            value = value[:-3]  # we reduce to millisecond
-                        else:
-                            value += ".000"
-                    # Special case for FineTime (value is a timestamp and we want YYYY-MM-DDThh:mm:ss.sssssssss)
-                    elif type(element) is mal.maltypes.FineTime:
-                        # get YYYY-MM-DDThh:mm:ss.ssssss
-                        value = datetime.datetime.fromtimestamp(element.internal_value).isoformat()
-                        if '.' in value:  # it means we have microsecond
-                            value += 000   # we add zeroes to nanoseconds
-                        else:
-                            value += ".000000000"
-                    # Normal case
-                    else:
-                        value = str(element.internal_value)
+                    attributenode = subnode.appendChild(domdoc.createElement(_element_class(element).__name__))
+                    value = self._attribute_to_text(element)
                     attributenode.appendChild(domdoc.createTextNode(value))
 
         dom = xml.dom.getDOMImplementation()
@@ -170,23 +979,90 @@ class XMLEncoder(Encoder):
         rootElement.setAttributeNS(XML_NAMESPACE, XMLNS_XSI, XML_XSI_NAMESPACE_URL)
         rootElement.setAttributeNS(XML_NAMESPACE, MAL_XML, MAL_XML_NAMESPACE_URL)
 
-        # Recursively go through the object to encode it (a composite is a list of list)
-        if type(body) is not list:
-            body = [body]
-
         for element in body:
             _encode_internal(element, rootElement)
         encoded_body = d.toprettyxml(encoding="UTF-8")
         return encoded_body
 
     def decode_body(self, body):
+        if body == b"":
+            return None
+        # A node is named after a type or a field, so all the types must be
+        # known to tell them apart
+        mal.registry.load_modules()
+        if self.use_dom:
+            return self._decode_body_dom(body)
+        else:
+            return self._decode_body_stream(body)
+
+    def _decode_body_stream(self, body):
+        """ Build the body directly from the expat events.
+
+        Each closed node gives a (class, payload) pair: the class is None for
+        the nodes named after a composite field, and the payload is None for
+        the xsi:nil nodes. Nested values are kept as python values and lists,
+        in the form the composite setters expect, so that each element is
+        only instantiated once.
+        """
+        stack = []
+        xml_types = XML_TYPES
+        xml_kinds = _XML_KINDS
+
+        def _start(tag, attributes):
+            objectClass = xml_types.get(tag)
+            stack.append((objectClass, xml_kinds[objectClass], attributes.get('xsi:nil') == 'true', [], []))
+
+        def _end(tag):
+            objectClass, kind, isNil, children, text = stack.pop()
+            if isNil:
+                node = (objectClass, None)
+            elif objectClass is None:
+                node = (None, children)
+            elif kind is _XML_LIST:
+                itemClass = list_item_type(objectClass)
+                node = (objectClass, [_typed_value(itemClass, child) for child in children])
+            elif kind is _XML_COMPOSITE:
+                node = (objectClass, [_field_value(fieldClass, child) for (_, fieldClass, _), child
+                                      in zip(field_types(objectClass), children)])
+            elif children:
+                # An attribute without attribName: <Long><Long>1</Long></Long>
+                node = (objectClass, _typed_value(objectClass, children[0]))
+            else:
+                node = (objectClass, _xml_text_parser(objectClass)(''.join(text)))
+            stack[-1][3].append(node) if stack else root.append(node)
+
+        def _characters(data):
+            frame = stack[-1]
+            if frame[1] is _XML_ATTRIBUTE:
+                frame[4].append(data)
+
+        root = []
+        parser = xml.parsers.expat.ParserCreate()
+        parser.buffer_text = True
+        parser.StartElementHandler = _start
+        parser.EndElementHandler = _end
+        parser.CharacterDataHandler = _characters
+        parser.Parse(body, True)
+
+        # The root node is the body, each of its children is a message part
+        decoded_body = []
+        for objectClass, payload in root[0][1]:
+            if objectClass is None:
+                # A named node: only its content can tell its type
+                if payload is not None and len(payload) == 1 and payload[0][0] is not None:
+                    objectClass, payload = payload[0]
+                else:
+                    decoded_body.append(payload)
+                    continue
+            decoded_body.append(objectClass(payload))
+        return decoded_body
+
+    def _decode_body_dom(self, body):
 
         # If the XML document was indented, there will be text node made of tabs
         # and newline characters. Those are not relevant for decoding.
         emptyNodePattern = re.compile(r"^[\n\t]*$")
-        maltypes = []
-        for module in MAL_MODULES:
-            maltypes.extend(dir(sys.modules[module]))
+        maltypes = XML_TYPES
 
         def _cleanupEmptyChildNodes(node):
 
@@ -198,14 +1074,6 @@ class XMLEncoder(Encoder):
                     _cleanupEmptyChildNodes(element)
             node.childNodes = clean_childNodes
 
-        def str_to_class(classname):
-            for module in MAL_MODULES:
-                try:
-                    return getattr(sys.modules[module], classname)
-                except AttributeError:
-                    pass
-            raise RuntimeError("I don't know this object")
-
         def _decode_internal(node, elementName=None):
             DEBUG_IN("IN", node, elementName)
 
@@ -214,7 +1082,7 @@ class XMLEncoder(Encoder):
             # Either the node name is a MAL class or the name of the attribute
             # If it's a MAL class we recurse in its children and build the MALElement
             if node.nodeName in maltypes:
-                objectClass = str_to_class(node.nodeName)
+                objectClass = mal.registry.type_from_name(node.nodeName)
 
                 # First case: it's Null and we reached a leaf
                 if node.hasAttribute('xsi:nil') and node.getAttribute('xsi:nil'):
@@ -240,11 +1108,10 @@ class XMLEncoder(Encoder):
                                     value = bytes.fromhex(element.nodeValue)
                                 # Special case for Time (value is a timestamp and we want YYYY-MM-DDThh:mm:ss.sss)
                                 elif objectClass.value_type == float and type(element.nodeValue) == str and len(element.nodeValue) == len('YYYY-MM-DDThh:mm:ss.sss'):
-                                    value = datetime.datetime.strptime(element.nodeValue, '%Y-%m-%dT%H:%M:%S.%f').timestamp()
+                                    value = timecodec.parse_time(element.nodeValue)
                                 # Special case for FineTime (value is a timestamp and we want YYYY-MM-DDThh:mm:ss.sssssssss)
                                 elif objectClass.value_type == float and type(element.nodeValue) == str and len(element.nodeValue) == len('YYYY-MM-DDThh:mm:ss.sssssssss'):
-                                    value = datetime.datetime.strptime(element.nodeValue[:-3], '%Y-%m-%dT%H:%M:%S.%f').timestamp()
-                                    value += int(element.nodeValue[-3:]) * 1e-9
+                                    value = timecodec.parse_finetime(element.nodeValue)
                                 else:
                                     value = element.nodeValue
                                 castedValue = objectClass.value_type(value)
@@ -307,8 +1174,6 @@ class XMLEncoder(Encoder):
                             DEBUG_OUT("Return composite or list", "value={}".format(elementName))
                             return internal
 
-        if body == b"":
-            return None
         d = xml.dom.minidom.parseString(body)
         rootElement = d.firstChild
         _cleanupEmptyChildNodes(rootElement)
@@ -318,10 +1183,20 @@ class XMLEncoder(Encoder):
 
 
 class JSONEncoder(Encoder):
-    encoding = MALPY_ENCODING.XML
+    """ MAL/JSON encoding.
+
+    The body is a JSON array with one {"TypeName": value} object per part.
+    Composites are objects keyed by field name, lists are arrays and
+    attributes are JSON values (enumerations by name, Blob in hexadecimal,
+    Time and FineTime as in MAL/XML). Fields of an abstract type, such as
+    Pair.first, are wrapped in a {"TypeName": value} object too.
+    """
+    encoding = MALPY_ENCODING.JSON
 
     def encode(self, message):
-        encoded_body = self.encode_body(message.msg_parts)
+        encoded_body = message.encoded_body(self)
+        if encoded_body is None:
+            encoded_body = self.encode_body(message.msg_parts)
         encoded_message = mal.MALMessage(header=message.header,
                                          msg_parts=encoded_body)
         return encoded_message
@@ -333,62 +1208,74 @@ class JSONEncoder(Encoder):
         return decoded_message
 
     def encode_body(self, body):
+        if type(body) is not list:
+            body = [body]
+        document = [self._encode_field(element, mal.Element) for element in body]
+        return json.dumps(document, separators=(',', ':')).encode('utf-8')
 
-        def _encode_internal(element,isInList):
-            doc=''
-            # The node name is attribName if it exists, otherwise its type
-            nodename = element.attribName or type(element).__name__
-
-            # Deal with the Null type:
-            if element.internal_value is None:
-                # It's a leaf, we don't recurse deeper.
-               doc = doc +  "\"{}\" : ".format(nodename) + "null,"
-               if isInList:
-                  doc = '{' + doc[0:-1] + '},' # Remove last caractere (comma) of doc String befor add }
-
-            # if it's a list, it means this is a composite or a list of thing
-            elif type(element.internal_value) is list:
-                # so we recurse over each item and append them below the objects
-                # ex: the ?? is defined with se same algorithm
-                if nodename.find('List') > 0:
-                    doc = doc + "\"{}\" : [".format(nodename)
-                    for subelement in element.internal_value:
-                        doc = doc + _encode_internal(subelement, True)
-                    doc = doc[0:-1] + '],' # Remove last caractere (comma) of doc String befor add }
-                else:
-                    if isInList:
-                        doc = doc + ' {'
-                    else:
-                        doc = doc + "\"{}\" : ".format(nodename) +' {'
-                    for subelement in element.internal_value:
-                        doc = doc + _encode_internal(subelement, False)
-                    doc = doc[0:-1] + '},' # Remove last caractere (comma) of doc String befor add }
+    def decode_body(self, body):
+        if len(body) == 0:
+            return None
+        return list(self.iter_body(body))
 
-            # else it's an attribute we add a subnode
+    def iter_body(self, body):
+        if isinstance(body, memoryview):
+            body = body.tobytes()
+        for part in json.loads(body):
+            if part is None:
+                yield None
             else:
-                # It's a leaf, we don't recurse deeper.
-                # Special case for IntEnum (the encoding message is a string that we convert to enums)
-                if issubclass(type(element.internal_value), IntEnum):
-                    value = element.internal_value.name
-                # Normal case
-                else:
-                    value = str(element.internal_value)
-                doc = doc +  "\"{}\" : ".format(nodename) + "\"{}\",".format(value)
-
-                if isInList:
-                    doc = '{' + doc[0:-1] + '}' # Remove last caractere (comma) of doc String befor add }
-
-            return doc
+                (typename, value), = part.items()
+                objectClass = XML_TYPES[typename]
+                yield objectClass(self._decode_value(objectClass, value))
 
-        rootElement=''
+    def _encode_field(self, element, fieldClass):
+        if element is None or element._shared_value() is None:
+            return None
+        if fieldClass is mal.Attribute or _is_abstract(fieldClass):
+            return {_element_class(element).__name__: self._encode_value(element)}
+        return self._encode_value(element)
 
-        # Recursively go through the object to encode it (a composite is a list of list)
-        if type(body) is not list:
-            body = [body]
+    def _encode_value(self, element):
+        objectClass = _element_class(element)
+        if issubclass(objectClass, mal.ArrayElementList) and objectClass.item_type not in (mal.Time, mal.FineTime):
+            return list(element.values())
+        value = element._shared_value()
+        if issubclass(objectClass, mal.ElementList):
+            itemClass = list_item_type(objectClass)
+            return [self._encode_field(item, itemClass) for item in value]
+        elif issubclass(objectClass, mal.Composite):
+            return {name: self._encode_field(field, fieldClass)
+                    for (name, fieldClass, _), field in zip(field_types(objectClass), value)}
+        elif isinstance(value, IntEnum):
+            return value.name
+        elif objectClass in (mal.Blob, mal.Time, mal.FineTime):
+            return XMLEncoder._attribute_to_text(element)
+        else:
+            return value
 
-        rootElement = rootElement + '{'
-        for element in body:
-            rootElement = rootElement + _encode_internal(element, False)
-        rootElement = rootElement[0:-1] + '}' # Remove last caractere (comma) of doc String befor add }
+    def _decode_field(self, fieldClass, value):
+        if value is None:
+            return None
+        if fieldClass is mal.Attribute or _is_abstract(fieldClass):
+            (typename, value), = value.items()
+            objectClass = XML_TYPES[typename]
+            # The setters need an Element to know the actual type
+            return objectClass(self._decode_value(objectClass, value))
+        return self._decode_value(fieldClass, value)
 
-        return rootElement
+    def _decode_value(self, objectClass, value):
+        if issubclass(objectClass, mal.ElementList):
+            itemClass = list_item_type(objectClass)
+            return [self._decode_field(itemClass, item) for item in value]
+        elif issubclass(objectClass, mal.Composite):
+            return [self._decode_field(fieldClass, value.get(name))
+                    for name, fieldClass, _ in field_types(objectClass)]
+        elif objectClass.value_type is float:
+            if type(value) is str:
+                return _xml_text_parser(objectClass)(value)
+            return float(value)
+        elif type(value) is str:
+            return _xml_text_parser(objectClass)(value)
+        else:
+            return value
@@ -9,4 +9,5 @@ class MALPY_ENCODING(IntEnum):
     BINARY = 1
     SPLITBINARY = 2
     XML = 3
+    JSON = 4
     PICKLE = 50
@@ -3,5 +3,14 @@
 #
 # SPDX-License-Identifier: MIT
 
+import importlib
+
 __all__ = ['maltypes', 'services']
 from .maltypes import *
+
+
+def __getattr__(name):
+    # The services package is imported on first use
+    if name == 'services':
+        return importlib.import_module('.services', __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
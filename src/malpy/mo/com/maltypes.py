@@ -28,331 +28,97 @@ class MALShortForm(IntEnum):
 class ObjectType(mal.Composite):
     """The ObjectType structure uniquely identifies the type of an object. It is the combination of the area number, service number, area version, and service object type number. The combined parts are able to fit inside a MAL::Long (for implementations that prefer to index on a single numeric field rather than a structure)."""
 
+    __slots__ = []
     shortForm = MALShortForm.OBJECTTYPE
-    _fieldNumber = mal.Composite._fieldNumber + 4
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*4
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.area = value[mal.Composite._fieldNumber + 0]
-            self.service = value[mal.Composite._fieldNumber + 1]
-            self.version = value[mal.Composite._fieldNumber + 2]
-            self.number = value[mal.Composite._fieldNumber + 3]
-
-    @property
-    def area(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @area.setter
-    def area(self, area):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.UShort(area, canBeNull=False, attribName='area')
-        self._isNull = False
-
-    @property
-    def service(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @service.setter
-    def service(self, service):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.UShort(service, canBeNull=False, attribName='service')
-        self._isNull = False
-
-    @property
-    def version(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @version.setter
-    def version(self, version):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mal.UOctet(version, canBeNull=False, attribName='version')
-        self._isNull = False
-
-    @property
-    def number(self):
-        return self._internal_value[mal.Composite._fieldNumber + 3]
-
-    @number.setter
-    def number(self, number):
-        self._internal_value[mal.Composite._fieldNumber + 3] = mal.UShort(number, canBeNull=False, attribName='number')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('area', 'mal.UShort', False),
+        ('service', 'mal.UShort', False),
+        ('version', 'mal.UOctet', False),
+        ('number', 'mal.UShort', False),
+    )
 
 
 class ObjectTypeList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.OBJECTTYPE
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ObjectType(v))
-
 
 class ObjectKey(mal.Composite):
     """The ObjectKey structure combines a domain and an object instance identifier such that it identifies the instance of an object for a specific domain."""
 
+    __slots__ = []
     shortForm = MALShortForm.OBJECTKEY
-    _fieldNumber = mal.Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.domain = value[mal.Composite._fieldNumber + 0]
-            self.instId = value[mal.Composite._fieldNumber + 1]
-
-    @property
-    def domain(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @domain.setter
-    def domain(self, domain):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.IdentifierList(domain, canBeNull=False, attribName='domain')
-        self._isNull = False
-
-    @property
-    def instId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @instId.setter
-    def instId(self, instId):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.Long(instId, canBeNull=False, attribName='instId')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('domain', 'mal.IdentifierList', False),
+        ('instId', 'mal.Long', False),
+    )
 
 
 class ObjectKeyList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.OBJECTKEY
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ObjectKey(v))
-
 
 class ObjectId(mal.Composite):
     """The ObjectId structure combines an object type and an object key such that it identifies the instance and type of an object for a specific domain."""
 
+    __slots__ = []
     shortForm = MALShortForm.OBJECTID
-    _fieldNumber = mal.Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.type = value[mal.Composite._fieldNumber + 0]
-            self.key = value[mal.Composite._fieldNumber + 1]
-
-    @property
-    def type(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @type.setter
-    def type(self, type):
-        self._internal_value[mal.Composite._fieldNumber + 0] = ObjectType(type, canBeNull=False, attribName='type')
-        self._isNull = False
-
-    @property
-    def key(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @key.setter
-    def key(self, key):
-        self._internal_value[mal.Composite._fieldNumber + 1] = ObjectKey(key, canBeNull=False, attribName='key')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('type', 'ObjectType', False),
+        ('key', 'ObjectKey', False),
+    )
 
 
 class ObjectIdList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.OBJECTID
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ObjectId(v))
-
 
 class ObjectDetails(mal.Composite):
     """The ObjectDetails type is used to hold the extra information associated with an object instance, namely the related and source links."""
 
+    __slots__ = []
     shortForm = MALShortForm.OBJECTDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.related = value[mal.Composite._fieldNumber + 0]
-            self.source = value[mal.Composite._fieldNumber + 1]
-
-    @property
-    def related(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @related.setter
-    def related(self, related):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Long(related, canBeNull=True, attribName='related')
-        self._isNull = False
-
-    @property
-    def source(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @source.setter
-    def source(self, source):
-        self._internal_value[mal.Composite._fieldNumber + 1] = ObjectId(source, canBeNull=True, attribName='source')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('related', 'mal.Long', True),
+        ('source', 'ObjectId', True),
+    )
 
 
 class ObjectDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.OBJECTDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ObjectDetails(v))
-
 
 class InstanceBooleanPair(mal.Composite):
     """Simple pair of an object instance identifier and a Boolean value."""
 
+    __slots__ = []
     shortForm = MALShortForm.INSTANCEBOOLEANPAIR
-    _fieldNumber = mal.Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.id = value[mal.Composite._fieldNumber + 0]
-            self.value = value[mal.Composite._fieldNumber + 1]
-
-    @property
-    def id(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @id.setter
-    def id(self, id):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Long(id, canBeNull=False, attribName='id')
-        self._isNull = False
-
-    @property
-    def value(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @value.setter
-    def value(self, value):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.Boolean(value, canBeNull=False, attribName='value')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('id', 'mal.Long', False),
+        ('value', 'mal.Boolean', False),
+    )
 
 
 class InstanceBooleanPairList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.INSTANCEBOOLEANPAIR
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(InstanceBooleanPair(v))
+
+mal.registry.register(2, 0, 1, (
+    ObjectType,
+    ObjectTypeList,
+    ObjectKey,
+    ObjectKeyList,
+    ObjectId,
+    ObjectIdList,
+    ObjectDetails,
+    ObjectDetailsList,
+    InstanceBooleanPair,
+    InstanceBooleanPairList,
+    ))
 
 
 class Errors(IntEnum):
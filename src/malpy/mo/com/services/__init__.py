@@ -3,4 +3,13 @@
 #
 # SPDX-License-Identifier: MIT
 
+import importlib
+
 __all__ = ['event', 'archive', 'activitytracking']
+
+
+def __getattr__(name):
+    # The service modules are imported on first use
+    if name in __all__:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -25,248 +25,76 @@ class MALShortForm(IntEnum):
 class ActivityTransfer(mal.Composite):
     """The structure holds details for a Release, Reception, or Forward event of an activity."""
 
+    __slots__ = []
     shortForm = MALShortForm.ACTIVITYTRANSFER
-    _fieldNumber = mal.Composite._fieldNumber + 3
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*3
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.success = value[mal.Composite._fieldNumber + 0]
-            self.estimateDuration = value[mal.Composite._fieldNumber + 1]
-            self.nextDestination = value[mal.Composite._fieldNumber + 2]
-
-    @property
-    def success(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @success.setter
-    def success(self, success):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Boolean(success, canBeNull=False, attribName='success')
-        self._isNull = False
-
-    @property
-    def estimateDuration(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @estimateDuration.setter
-    def estimateDuration(self, estimateDuration):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.Duration(estimateDuration, canBeNull=True, attribName='estimateDuration')
-        self._isNull = False
-
-    @property
-    def nextDestination(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @nextDestination.setter
-    def nextDestination(self, nextDestination):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mal.URI(nextDestination, canBeNull=True, attribName='nextDestination')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('success', 'mal.Boolean', False),
+        ('estimateDuration', 'mal.Duration', True),
+        ('nextDestination', 'mal.URI', True),
+    )
 
 
 class ActivityTransferList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ACTIVITYTRANSFER
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ActivityTransfer(v))
-
 
 class ActivityAcceptance(mal.Composite):
     """The structure is used to hold details of an Acceptance event."""
 
+    __slots__ = []
     shortForm = MALShortForm.ACTIVITYACCEPTANCE
-    _fieldNumber = mal.Composite._fieldNumber + 1
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*1
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.success = value[mal.Composite._fieldNumber + 0]
-
-    @property
-    def success(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @success.setter
-    def success(self, success):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Boolean(success, canBeNull=False, attribName='success')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('success', 'mal.Boolean', False),
+    )
 
 
 class ActivityAcceptanceList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ACTIVITYACCEPTANCE
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ActivityAcceptance(v))
-
 
 class ActivityExecution(mal.Composite):
     """The structure is used to report the execution status of an activity in the final destination."""
 
+    __slots__ = []
     shortForm = MALShortForm.ACTIVITYEXECUTION
-    _fieldNumber = mal.Composite._fieldNumber + 3
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*3
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.success = value[mal.Composite._fieldNumber + 0]
-            self.executionStage = value[mal.Composite._fieldNumber + 1]
-            self.stageCount = value[mal.Composite._fieldNumber + 2]
-
-    @property
-    def success(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @success.setter
-    def success(self, success):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Boolean(success, canBeNull=False, attribName='success')
-        self._isNull = False
-
-    @property
-    def executionStage(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @executionStage.setter
-    def executionStage(self, executionStage):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.UInteger(executionStage, canBeNull=False, attribName='executionStage')
-        self._isNull = False
-
-    @property
-    def stageCount(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @stageCount.setter
-    def stageCount(self, stageCount):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mal.UInteger(stageCount, canBeNull=False, attribName='stageCount')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('success', 'mal.Boolean', False),
+        ('executionStage', 'mal.UInteger', False),
+        ('stageCount', 'mal.UInteger', False),
+    )
 
 
 class ActivityExecutionList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ACTIVITYEXECUTION
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ActivityExecution(v))
-
 
 class OperationActivity(mal.Composite):
     """The OperationActivity structure contains the details of a MAL operation activity."""
 
+    __slots__ = []
     shortForm = MALShortForm.OPERATIONACTIVITY
-    _fieldNumber = mal.Composite._fieldNumber + 1
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*1
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.interactionType = value[mal.Composite._fieldNumber + 0]
-
-    @property
-    def interactionType(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @interactionType.setter
-    def interactionType(self, interactionType):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.InteractionType(interactionType, canBeNull=False, attribName='interactionType')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('interactionType', 'mal.InteractionType', False),
+    )
 
 
 class OperationActivityList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.OPERATIONACTIVITY
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(OperationActivity(v))
+
+mal.registry.register(2, 3, 1, (
+    ActivityTransfer,
+    ActivityTransferList,
+    ActivityAcceptance,
+    ActivityAcceptanceList,
+    ActivityExecution,
+    ActivityExecutionList,
+    OperationActivity,
+    OperationActivityList,
+    ))
 
 
@@ -92,421 +92,116 @@ class ExpressionOperatorEnum(IntEnum):
 class ExpressionOperator(mal.AbstractEnum):
     """The ExpressionOperator enumeration holds a set of possible expression operators."""
 
+    __slots__ = []
     shortForm = MALShortForm.EXPRESSIONOPERATOR
     value_type = ExpressionOperatorEnum
 
 
 class ExpressionOperatorList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.EXPRESSIONOPERATOR
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ExpressionOperator(v))
-
 
 class QueryFilter(mal.Composite):
     """The base structure for archive filters."""
 
+    __slots__ = []
     shortForm = None
-    _fieldNumber = mal.Composite._fieldNumber + 0
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*0
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            raise RuntimeError("This class is abstract and should not be directly called")
+    _fields = mal.Composite._fields
 
 
 class QueryFilterList(mal.ElementList):
+    __slots__ = []
     shortForm = None
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(QueryFilter(v))
-
 
 class ArchiveDetails(mal.Composite):
     """The ArchiveDetails structure is used to hold information about a single entry in an Archive."""
 
+    __slots__ = []
     shortForm = MALShortForm.ARCHIVEDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 5
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*5
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.instId = value[mal.Composite._fieldNumber + 0]
-            self.details = value[mal.Composite._fieldNumber + 1]
-            self.network = value[mal.Composite._fieldNumber + 2]
-            self.timestamp = value[mal.Composite._fieldNumber + 3]
-            self.provider = value[mal.Composite._fieldNumber + 4]
-
-    @property
-    def instId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @instId.setter
-    def instId(self, instId):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Long(instId, canBeNull=False, attribName='instId')
-        self._isNull = False
-
-    @property
-    def details(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @details.setter
-    def details(self, details):
-        self._internal_value[mal.Composite._fieldNumber + 1] = com.ObjectDetails(details, canBeNull=False, attribName='details')
-        self._isNull = False
-
-    @property
-    def network(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @network.setter
-    def network(self, network):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mal.Identifier(network, canBeNull=True, attribName='network')
-        self._isNull = False
-
-    @property
-    def timestamp(self):
-        return self._internal_value[mal.Composite._fieldNumber + 3]
-
-    @timestamp.setter
-    def timestamp(self, timestamp):
-        self._internal_value[mal.Composite._fieldNumber + 3] = mal.FineTime(timestamp, canBeNull=True, attribName='timestamp')
-        self._isNull = False
-
-    @property
-    def provider(self):
-        return self._internal_value[mal.Composite._fieldNumber + 4]
-
-    @provider.setter
-    def provider(self, provider):
-        self._internal_value[mal.Composite._fieldNumber + 4] = mal.URI(provider, canBeNull=True, attribName='provider')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('instId', 'mal.Long', False),
+        ('details', 'com.ObjectDetails', False),
+        ('network', 'mal.Identifier', True),
+        ('timestamp', 'mal.FineTime', True),
+        ('provider', 'mal.URI', True),
+    )
 
 
 class ArchiveDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ARCHIVEDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ArchiveDetails(v))
-
 
 class ArchiveQuery(mal.Composite):
     """The ArchiveQuery structure is used to specify filters on the common parts of an object in an archive."""
 
+    __slots__ = []
     shortForm = MALShortForm.ARCHIVEQUERY
-    _fieldNumber = mal.Composite._fieldNumber + 9
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*9
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.domain = value[mal.Composite._fieldNumber + 0]
-            self.network = value[mal.Composite._fieldNumber + 1]
-            self.provider = value[mal.Composite._fieldNumber + 2]
-            self.related = value[mal.Composite._fieldNumber + 3]
-            self.source = value[mal.Composite._fieldNumber + 4]
-            self.startTime = value[mal.Composite._fieldNumber + 5]
-            self.endTime = value[mal.Composite._fieldNumber + 6]
-            self.sortOrder = value[mal.Composite._fieldNumber + 7]
-            self.sortFieldName = value[mal.Composite._fieldNumber + 8]
-
-    @property
-    def domain(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @domain.setter
-    def domain(self, domain):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.IdentifierList(domain, canBeNull=True, attribName='domain')
-        self._isNull = False
-
-    @property
-    def network(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @network.setter
-    def network(self, network):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.Identifier(network, canBeNull=True, attribName='network')
-        self._isNull = False
-
-    @property
-    def provider(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @provider.setter
-    def provider(self, provider):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mal.URI(provider, canBeNull=True, attribName='provider')
-        self._isNull = False
-
-    @property
-    def related(self):
-        return self._internal_value[mal.Composite._fieldNumber + 3]
-
-    @related.setter
-    def related(self, related):
-        self._internal_value[mal.Composite._fieldNumber + 3] = mal.Long(related, canBeNull=False, attribName='related')
-        self._isNull = False
-
-    @property
-    def source(self):
-        return self._internal_value[mal.Composite._fieldNumber + 4]
-
-    @source.setter
-    def source(self, source):
-        self._internal_value[mal.Composite._fieldNumber + 4] = com.ObjectId(source, canBeNull=True, attribName='source')
-        self._isNull = False
-
-    @property
-    def startTime(self):
-        return self._internal_value[mal.Composite._fieldNumber + 5]
-
-    @startTime.setter
-    def startTime(self, startTime):
-        self._internal_value[mal.Composite._fieldNumber + 5] = mal.FineTime(startTime, canBeNull=True, attribName='startTime')
-        self._isNull = False
-
-    @property
-    def endTime(self):
-        return self._internal_value[mal.Composite._fieldNumber + 6]
-
-    @endTime.setter
-    def endTime(self, endTime):
-        self._internal_value[mal.Composite._fieldNumber + 6] = mal.FineTime(endTime, canBeNull=True, attribName='endTime')
-        self._isNull = False
-
-    @property
-    def sortOrder(self):
-        return self._internal_value[mal.Composite._fieldNumber + 7]
-
-    @sortOrder.setter
-    def sortOrder(self, sortOrder):
-        self._internal_value[mal.Composite._fieldNumber + 7] = mal.Boolean(sortOrder, canBeNull=True, attribName='sortOrder')
-        self._isNull = False
-
-    @property
-    def sortFieldName(self):
-        return self._internal_value[mal.Composite._fieldNumber + 8]
-
-    @sortFieldName.setter
-    def sortFieldName(self, sortFieldName):
-        self._internal_value[mal.Composite._fieldNumber + 8] = mal.String(sortFieldName, canBeNull=True, attribName='sortFieldName')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('domain', 'mal.IdentifierList', True),
+        ('network', 'mal.Identifier', True),
+        ('provider', 'mal.URI', True),
+        ('related', 'mal.Long', False),
+        ('source', 'com.ObjectId', True),
+        ('startTime', 'mal.FineTime', True),
+        ('endTime', 'mal.FineTime', True),
+        ('sortOrder', 'mal.Boolean', True),
+        ('sortFieldName', 'mal.String', True),
+    )
 
 
 class ArchiveQueryList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ARCHIVEQUERY
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ArchiveQuery(v))
-
 
 class CompositeFilter(mal.Composite):
     """The CompositeFilter allows an archive query to specify a filter based on the content of the body of an object if that body is specified using the MAL data type specification."""
 
+    __slots__ = []
     shortForm = MALShortForm.COMPOSITEFILTER
-    _fieldNumber = mal.Composite._fieldNumber + 3
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*3
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.fieldName = value[mal.Composite._fieldNumber + 0]
-            self.type = value[mal.Composite._fieldNumber + 1]
-            self.fieldValue = value[mal.Composite._fieldNumber + 2]
-
-    @property
-    def fieldName(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @fieldName.setter
-    def fieldName(self, fieldName):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.String(fieldName, canBeNull=False, attribName='fieldName')
-        self._isNull = False
-
-    @property
-    def type(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @type.setter
-    def type(self, type):
-        self._internal_value[mal.Composite._fieldNumber + 1] = ExpressionOperator(type, canBeNull=False, attribName='type')
-        self._isNull = False
-
-    @property
-    def fieldValue(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @fieldValue.setter
-    def fieldValue(self, fieldValue):
-        if fieldValue is None:
-            self._internal_value[mal.Composite._fieldNumber + 2] = mal.Attribute(fieldValue, canBeNull=True, attribName='fieldValue')
-        else:
-            self._internal_value[mal.Composite._fieldNumber + 2] = type(fieldValue)(fieldValue, canBeNull=True, attribName='fieldValue')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('fieldName', 'mal.String', False),
+        ('type', 'ExpressionOperator', False),
+        ('fieldValue', 'mal.Attribute', True),
+    )
 
 
 class CompositeFilterList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.COMPOSITEFILTER
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(CompositeFilter(v))
-
 
 class CompositeFilterSet(QueryFilter):
     """Contains a list of CompositeFilters that are AND'd together to form a more complex filter."""
 
+    __slots__ = []
     shortForm = MALShortForm.COMPOSITEFILTERSET
-    _fieldNumber = QueryFilter._fieldNumber + 1
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*1
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.filters = value[QueryFilter._fieldNumber + 0]
-
-    @property
-    def filters(self):
-        return self._internal_value[QueryFilter._fieldNumber + 0]
-
-    @filters.setter
-    def filters(self, filters):
-        self._internal_value[QueryFilter._fieldNumber + 0] = CompositeFilterList(filters, canBeNull=False, attribName='filters')
-        self._isNull = False
+    _fields = QueryFilter._fields + (
+        ('filters', 'CompositeFilterList', False),
+    )
 
 
 class CompositeFilterSetList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.COMPOSITEFILTERSET
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(CompositeFilterSet(v))
+
+mal.registry.register(2, 2, 1, (
+    ExpressionOperator,
+    ExpressionOperatorList,
+    QueryFilter,
+    QueryFilterList,
+    ArchiveDetails,
+    ArchiveDetailsList,
+    ArchiveQuery,
+    ArchiveQueryList,
+    CompositeFilter,
+    CompositeFilterList,
+    CompositeFilterSet,
+    CompositeFilterSetList,
+    ))
 
 
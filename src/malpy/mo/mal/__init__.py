@@ -5,4 +5,8 @@
 
 __all__ = ['maltypes']
 from .maltypes import *
+from . import registry
+from . import schema
 from .malinteractions import *
+from .asyncinteractions import *
+from .pubsubbroker import PubSubBroker
@@ -0,0 +1,235 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Awaitable versions of the interaction pattern handlers.
+
+They are used with an AsyncMALSocket. Sending methods and receive_*
+methods are coroutines; the checks of the interaction stages are the
+ones of the synchronous handlers, which are given the received message.
+"""
+
+from .malinteractions import *
+
+
+class AsyncHandler(object):
+    """ Mixin replacing the message I/O of a Handler by coroutines """
+
+    async def send_message(self, message):
+        message = self.encoding.encode(message)
+        return await self.transport.send(message)
+
+    async def receive_message(self):
+        message = await self.transport.recv()
+        if self.lazy_body:
+            return self.encoding.decode_lazy(message)
+        return self.encoding.decode(message)
+
+
+class AsyncConsumerHandler(AsyncHandler):
+
+    async def connect(self, uri):
+        await self.transport.connect(uri)
+
+
+class AsyncProviderHandler(AsyncHandler):
+    pass
+
+
+class AsyncSendProviderHandler(AsyncProviderHandler, SendProviderHandler):
+
+    async def receive_send(self):
+        return super().receive_send(await self.receive_message())
+
+
+class AsyncSendConsumerHandler(AsyncConsumerHandler, SendConsumerHandler):
+
+    async def send(self, body):
+        return await super().send(body)
+
+
+class AsyncSubmitProviderHandler(AsyncProviderHandler, SubmitProviderHandler):
+
+    async def receive_submit(self):
+        return super().receive_submit(await self.receive_message())
+
+    async def ack(self, body, async_send=False):
+        return await super().ack(body, async_send)
+
+    async def error(self, body):
+        return await super().error(body)
+
+
+class AsyncSubmitConsumerHandler(AsyncConsumerHandler, SubmitConsumerHandler):
+
+    async def submit(self, body):
+        return await super().submit(body)
+
+    async def receive_ack(self):
+        return super().receive_ack(await self.receive_message())
+
+
+class AsyncRequestProviderHandler(AsyncProviderHandler, RequestProviderHandler):
+
+    async def receive_request(self):
+        return super().receive_request(await self.receive_message())
+
+    async def response(self, body, async_send=False):
+        return await super().response(body, async_send)
+
+    async def error(self, body):
+        return await super().error(body)
+
+
+class AsyncRequestConsumerHandler(AsyncConsumerHandler, RequestConsumerHandler):
+
+    async def request(self, body):
+        return await super().request(body)
+
+    async def receive_response(self):
+        return super().receive_response(await self.receive_message())
+
+
+class AsyncInvokeProviderHandler(AsyncProviderHandler, InvokeProviderHandler):
+
+    async def receive_invoke(self):
+        return super().receive_invoke(await self.receive_message())
+
+    async def ack(self, body, async_send=False):
+        return await super().ack(body, async_send)
+
+    async def ack_error(self, body):
+        return await super().ack_error(body)
+
+    async def response(self, body, async_send=False):
+        return await super().response(body, async_send)
+
+    async def response_error(self, body):
+        return await super().response_error(body)
+
+
+class AsyncInvokeConsumerHandler(AsyncConsumerHandler, InvokeConsumerHandler):
+
+    async def invoke(self, body):
+        return await super().invoke(body)
+
+    async def receive_ack(self):
+        return super().receive_ack(await self.receive_message())
+
+    async def receive_response(self):
+        return super().receive_response(await self.receive_message())
+
+
+class AsyncProgressProviderHandler(AsyncProviderHandler, ProgressProviderHandler):
+
+    async def receive_progress(self):
+        return super().receive_progress(await self.receive_message())
+
+    async def ack(self, body, async_send=False):
+        return await super().ack(body, async_send)
+
+    async def ack_error(self, body):
+        return await super().ack_error(body)
+
+    async def update(self, body):
+        return await super().update(body)
+
+    async def update_error(self, body):
+        return await super().update_error(body)
+
+    async def response(self, body, async_send=False):
+        return await super().response(body, async_send)
+
+    async def response_error(self, body):
+        return await super().response_error(body)
+
+
+class AsyncProgressConsumerHandler(AsyncConsumerHandler, ProgressConsumerHandler):
+
+    async def progress(self, body):
+        return await super().progress(body)
+
+    async def receive_ack(self):
+        return super().receive_ack(await self.receive_message())
+
+    async def receive_update(self):
+        return super().receive_update(await self.receive_message())
+
+
+class AsyncPubSubProviderHandler(AsyncProviderHandler, PubSubProviderHandler):
+
+    async def publish_register(self, body):
+        return await super().publish_register(body)
+
+    async def receive_publish_register_ack(self):
+        return super().receive_publish_register_ack(await self.receive_message())
+
+    async def publish_deregister(self, body):
+        return await super().publish_deregister(body)
+
+    async def receive_publish_deregister_ack(self):
+        return super().receive_publish_deregister_ack(await self.receive_message())
+
+    async def publish(self, body):
+        return await super().publish(body)
+
+
+class AsyncPubSubBrokerHandler(AsyncProviderHandler, PubSubBrokerHandler):
+
+    async def receive_registration_message(self):
+        return super().receive_registration_message(await self.receive_message())
+
+    async def register_ack(self, body):
+        return await super().register_ack(body)
+
+    async def register_error(self, body):
+        return await super().register_error(body)
+
+    async def deregister_ack(self, body):
+        return await super().deregister_ack(body)
+
+    async def deregister_error(self, body):
+        return await super().deregister_error(body)
+
+    async def receive_deregister(self):
+        return super().receive_deregister(await self.receive_message())
+
+    async def notify(self, body, uri_to):
+        return await super().notify(body, uri_to)
+
+    async def receive_publish_registration_message(self):
+        return super().receive_publish_registration_message(await self.receive_message())
+
+    async def publish_register_ack(self, body):
+        return await super().publish_register_ack(body)
+
+    async def publish_register_error(self, body):
+        return await super().publish_register_error(body)
+
+    async def receive_publish_deregister(self):
+        return super().receive_publish_deregister(await self.receive_message())
+
+    async def publish_deregister_ack(self, body):
+        return await super().publish_deregister_ack(body)
+
+    async def receive_publish(self):
+        return super().receive_publish(await self.receive_message())
+
+
+class AsyncPubSubConsumerHandler(AsyncConsumerHandler, PubSubConsumerHandler):
+
+    async def register(self, body):
+        return await super().register(body)
+
+    async def receive_register_ack(self):
+        return super().receive_register_ack(await self.receive_message())
+
+    async def deregister(self, body):
+        return await super().deregister(body)
+
+    async def receive_deregister_ack(self):
+        return super().receive_deregister_ack(await self.receive_message())
+
+    async def receive_notify(self):
+        return super().receive_notify(await self.receive_message())
@@ -152,11 +152,67 @@ class MALMessage(object):
     """
     A simple structure to hold a decoded MAL header
     and a set of encoded message parts.
+
+    With a lazy body (see Handler.lazy_body), the message keeps the encoded
+    body and its encoder, and the parts are decoded when they are accessed:
+    part(index) decodes the parts up to index, msg_parts all of them. As
+    long as the body is not accessed, encoding the message again with the
+    same encoding reuses the encoded body, so that it can be forwarded or
+    filtered on its header alone.
     """
 
-    def __init__(self, header=None, msg_parts=[]):
+    def __init__(self, header=None, msg_parts=[], encoding=None):
+        """ @param encoding: if set, msg_parts is the encoded body and this
+                             encoder decodes it on access
+        """
         self.header = header or MALHeader()
         self.msg_parts = msg_parts
+        if encoding is not None and len(msg_parts) > 0:
+            self._encoded_body = msg_parts
+            self._encoding = encoding
+            self._parts = encoding.iter_body(msg_parts)
+            self._msg_parts = []
+        elif encoding is not None:
+            # As a body without parts, whatever the encoding
+            self._msg_parts = []
+
+    @property
+    def msg_parts(self):
+        if self._parts is not None:
+            self._accessed = True
+            self._msg_parts.extend(self._parts)
+            self._parts = None
+        return self._msg_parts
+
+    @msg_parts.setter
+    def msg_parts(self, msg_parts):
+        self._msg_parts = msg_parts
+        self._parts = None
+        self._encoded_body = None
+        self._encoding = None
+        self._accessed = False
+
+    def part(self, index):
+        """ Return a part of the body, only decoding the parts before it """
+        if self._parts is not None and index >= 0:
+            self._accessed = True
+            while len(self._msg_parts) <= index:
+                try:
+                    self._msg_parts.append(next(self._parts))
+                except StopIteration:
+                    self._parts = None
+                    break
+            if index < len(self._msg_parts):
+                return self._msg_parts[index]
+        return self.msg_parts[index]
+
+    def encoded_body(self, encoding):
+        """ Return the encoded body if it was not accessed and is encoded
+        with the same encoding, otherwise None.
+        """
+        if self._accessed or self._encoding is None or self._encoding.encoding != encoding.encoding:
+            return None
+        return self._encoded_body
 
     def __len__(self):
         def _sublen(k):
@@ -165,8 +221,14 @@ class MALMessage(object):
             else:
                 return len(k)
 
+        # Once accessed, the parts may have been modified
+        if self._encoded_body is not None and not self._accessed:
+            return len(self._encoded_body)
         return _sublen(self.msg_parts)
 
+    def __reduce__(self):
+        return (self.__class__, (self.header, self.msg_parts))
+
 
 class Handler(object):
     AREA = None
@@ -174,6 +236,9 @@ class Handler(object):
     SERVICE = None
     OPERATION = None
 
+    # Received bodies are decoded when they are accessed (see MALMessage)
+    lazy_body = False
+
     def __init__(self, transport, encoding):
         self.transport = transport
         self.encoding = encoding
@@ -186,6 +251,8 @@ class Handler(object):
 
     def receive_message(self):
         message = self.transport.recv()
+        if self.lazy_body:
+            return self.encoding.decode_lazy(message)
         return self.encoding.decode(message)
 
 
@@ -342,8 +409,9 @@ class SendProviderHandler(ProviderHandler):
 
     IP_TYPE = InteractionTypeEnum.SEND
 
-    def receive_send(self):
-        message = self.receive_message()
+    def receive_send(self, message=None):
+        if message is None:
+            message = self.receive_message()
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
         is_error_message = message.header.is_error_message
@@ -365,8 +433,8 @@ class SendConsumerHandler(ConsumerHandler):
     def send(self, body):
         header = self.create_message_header(MAL_IP_STAGES.SEND)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
         self.interaction_terminated = True
+        return self.send_message(message)
 
 
 class SubmitProviderHandler(ProviderHandler):
@@ -377,8 +445,9 @@ class SubmitProviderHandler(ProviderHandler):
 
     IP_TYPE = InteractionTypeEnum.SUBMIT
 
-    def receive_submit(self):
-        message = self.receive_message()
+    def receive_submit(self, message=None):
+        if message is None:
+            message = self.receive_message()
         self.define_header(message.header)
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
@@ -413,10 +482,11 @@ class SubmitConsumerHandler(ConsumerHandler):
     def submit(self, body):
         header = self.create_message_header(MAL_IP_STAGES.SUBMIT)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
-    def receive_ack(self):
-        message = self.receive_message()
+    def receive_ack(self, message=None):
+        if message is None:
+            message = self.receive_message()
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
         is_error_message = message.header.is_error_message
@@ -438,8 +508,9 @@ class RequestProviderHandler(ProviderHandler):
 
     IP_TYPE = InteractionTypeEnum.REQUEST
 
-    def receive_request(self):
-        message = self.receive_message()
+    def receive_request(self, message=None):
+        if message is None:
+            message = self.receive_message()
         self.define_header(message.header)
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
@@ -476,8 +547,9 @@ class RequestConsumerHandler(ConsumerHandler):
         message = MALMessage(header=header, msg_parts=body)
         return self.send_message(message)
 
-    def receive_response(self):
-        message = self.receive_message()
+    def receive_response(self, message=None):
+        if message is None:
+            message = self.receive_message()
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
         is_error_message = message.header.is_error_message
@@ -499,8 +571,9 @@ class InvokeProviderHandler(ProviderHandler):
 
     IP_TYPE = InteractionTypeEnum.INVOKE
 
-    def receive_invoke(self):
-        message = self.receive_message()
+    def receive_invoke(self, message=None):
+        if message is None:
+            message = self.receive_message()
         self.define_header(message.header)
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
@@ -546,11 +619,12 @@ class InvokeConsumerHandler(ConsumerHandler):
     def invoke(self, body):
         header = self.create_message_header(MAL_IP_STAGES.INVOKE)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
         self.interaction_terminated = True
+        return self.send_message(message)
 
-    def receive_ack(self):
-        message = self.receive_message()
+    def receive_ack(self, message=None):
+        if message is None:
+            message = self.receive_message()
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
         is_error_message = message.header.is_error_message
@@ -561,8 +635,9 @@ class InvokeConsumerHandler(ConsumerHandler):
         else:
             raise InvalidIPStageError(classname=self.__class__.__name__, expected_ip=(self.IP_TYPE, MAL_IP_STAGES.INVOKE_ACK), ip=(ip_type, ip_stage))
 
-    def receive_response(self):
-        message = self.receive_message()
+    def receive_response(self, message=None):
+        if message is None:
+            message = self.receive_message()
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
         is_error_message = message.header.is_error_message
@@ -584,8 +659,9 @@ class ProgressProviderHandler(ProviderHandler):
 
     IP_TYPE = InteractionTypeEnum.PROGRESS
 
-    def receive_progress(self):
-        message = self.receive_message()
+    def receive_progress(self, message=None):
+        if message is None:
+            message = self.receive_message()
         self.define_header(message.header)
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
@@ -642,10 +718,11 @@ class ProgressConsumerHandler(ConsumerHandler):
     def progress(self, body):
         header = self.create_message_header(MAL_IP_STAGES.PROGRESS)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
-    def receive_ack(self):
-        message = self.receive_message()
+    def receive_ack(self, message=None):
+        if message is None:
+            message = self.receive_message()
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
         is_error_message = message.header.is_error_message
@@ -656,12 +733,13 @@ class ProgressConsumerHandler(ConsumerHandler):
         else:
             raise InvalidIPStageError(classname=self.__class__.__name__, expected_ip=(self.IP_TYPE, MAL_IP_STAGES.PROGRESS_ACK), ip=(ip_type, ip_stage))
 
-    def receive_update(self):
+    def receive_update(self, message=None):
         """ As it is not possible to know beforehand if the received message is
         an update or the final response, we only do receive_update. The content of
         the header message will let us know te corresponding state.
         """
-        message = self.receive_message()
+        if message is None:
+            message = self.receive_message()
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
         is_error_message = message.header.is_error_message
@@ -699,10 +777,11 @@ class PubSubProviderHandler(ProviderHandler):
     def publish_register(self, body):
         header = self.create_message_header(MAL_IP_STAGES.PUBSUB_PUBLISH_REGISTER)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
-    def receive_publish_register_ack(self):
-        message = self.receive_message()
+    def receive_publish_register_ack(self, message=None):
+        if message is None:
+            message = self.receive_message()
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
         is_error_message = message.header.is_error_message
@@ -716,10 +795,11 @@ class PubSubProviderHandler(ProviderHandler):
     def publish_deregister(self, body):
         header = self.create_message_header(MAL_IP_STAGES.PUBSUB_PUBLISH_DEREGISTER)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
-    def receive_publish_deregister_ack(self):
-        message = self.receive_message()
+    def receive_publish_deregister_ack(self, message=None):
+        if message is None:
+            message = self.receive_message()
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
         is_error_message = message.header.is_error_message
@@ -731,7 +811,7 @@ class PubSubProviderHandler(ProviderHandler):
     def publish(self, body):
         header = self.create_message_header(MAL_IP_STAGES.PUBSUB_PUBLISH)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
     # def receive_publish_error(self):
     #     message = self.receive_message()
@@ -747,8 +827,9 @@ class PubSubBrokerHandler(ProviderHandler):
 
     IP_TYPE = InteractionTypeEnum.PUBSUB
 
-    def receive_registration_message(self):
-        message = self.receive_message()
+    def receive_registration_message(self, message=None):
+        if message is None:
+            message = self.receive_message()
         self.define_header(message.header)
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
@@ -764,30 +845,31 @@ class PubSubBrokerHandler(ProviderHandler):
         header = self.create_message_header(MAL_IP_STAGES.PUBSUB_REGISTER_ACK)
         self.define_header(header)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
     def register_error(self, body):
         header = self.create_message_header(MAL_IP_STAGES.PUBSUB_REGISTER_ACK_ERROR)
         header.is_error_message = True
         self.define_header(header)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
     def deregister_ack(self, body):
         header = self.create_message_header(MAL_IP_STAGES.PUBSUB_DEREGISTER_ACK)
         self.define_header(header)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
     def deregister_error(self, body):
         header = self.create_message_header(MAL_IP_STAGES.PUBSUB_DEREGISTER_ACK_ERROR)
         header.is_error_message = True
         self.define_header(header)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
-    def receive_deregister(self):
-        message = self.receive_message()
+    def receive_deregister(self, message=None):
+        if message is None:
+            message = self.receive_message()
         self.define_header(message.header)
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
@@ -800,7 +882,7 @@ class PubSubBrokerHandler(ProviderHandler):
     def notify(self, body, uri_to):
         header = self.create_message_header(MAL_IP_STAGES.PUBSUB_NOTIFY, uri_to=uri_to)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
     # def notify_error(self, body):
     #     header = self.create_message_header(MAL_IP_STAGES.PUBSUB_NOTIFY_ERROR)
@@ -808,8 +890,9 @@ class PubSubBrokerHandler(ProviderHandler):
     #     message = MALMessage(header=header, msg_parts=body)
     #     self.send_message(message)
 
-    def receive_publish_registration_message(self):
-        message = self.receive_message()
+    def receive_publish_registration_message(self, message=None):
+        if message is None:
+            message = self.receive_message()
         self.define_header(message.header)
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
@@ -825,17 +908,18 @@ class PubSubBrokerHandler(ProviderHandler):
         header = self.create_message_header(MAL_IP_STAGES.PUBSUB_PUBLISH_REGISTER_ACK)
         self.define_header(header)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
     def publish_register_error(self, body):
         header = self.create_message_header(MAL_IP_STAGES.PUBSUB_PUBLISH_REGISTER_ERROR)
         header.is_error_message = True
         self.define_header(header)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
-    def receive_publish_deregister(self):
-        message = self.receive_message()
+    def receive_publish_deregister(self, message=None):
+        if message is None:
+            message = self.receive_message()
         self.define_header(message.header)
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
@@ -849,10 +933,11 @@ class PubSubBrokerHandler(ProviderHandler):
         header = self.create_message_header(MAL_IP_STAGES.PUBSUB_PUBLISH_DEREGISTER_ACK)
         self.define_header(header)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
-    def receive_publish(self):
-        message = self.receive_message()
+    def receive_publish(self, message=None):
+        if message is None:
+            message = self.receive_message()
         self.define_header(message.header)
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
@@ -876,10 +961,11 @@ class PubSubConsumerHandler(ConsumerHandler):
     def register(self, body):
         header = self.create_message_header(MAL_IP_STAGES.PUBSUB_REGISTER)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
-    def receive_register_ack(self):
-        message = self.receive_message()
+    def receive_register_ack(self, message=None):
+        if message is None:
+            message = self.receive_message()
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
         is_error_message = message.header.is_error_message
@@ -893,10 +979,11 @@ class PubSubConsumerHandler(ConsumerHandler):
     def deregister(self, body):
         header = self.create_message_header(MAL_IP_STAGES.PUBSUB_DEREGISTER)
         message = MALMessage(header=header, msg_parts=body)
-        self.send_message(message)
+        return self.send_message(message)
 
-    def receive_deregister_ack(self):
-        message = self.receive_message()
+    def receive_deregister_ack(self, message=None):
+        if message is None:
+            message = self.receive_message()
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
         is_error_message = message.header.is_error_message
@@ -907,8 +994,9 @@ class PubSubConsumerHandler(ConsumerHandler):
         else:
             raise InvalidIPStageError(classname=self.__class__.__name__, expected_ip=(self.IP_TYPE, MAL_IP_STAGES.PUBSUB_DEREGISTER_ACK), ip=(ip_type, ip_stage))
 
-    def receive_notify(self):
-        message = self.receive_message()
+    def receive_notify(self, message=None):
+        if message is None:
+            message = self.receive_message()
         ip_type = message.header.ip_type
         ip_stage = message.header.ip_stage
         is_error_message = message.header.is_error_message
@@ -12,6 +12,10 @@
 
 from enum import IntEnum
 from abc import ABC
+from array import array
+from collections.abc import MutableSequence, Sequence
+from . import registry
+from . import schema
 
 name = "MAL"
 number = 1
@@ -53,6 +57,7 @@ class MALShortForm(IntEnum):
 class Element(ABC):
     """Element is the base type of all data constructs. All types that make up the MAL data model are derived from it."""
 
+    __slots__ = ['_isNull', '_canBeNull', 'attribName', '_internal_value']
     shortForm = None
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
@@ -69,55 +74,167 @@ class Element(ABC):
         else:
             return self._internal_value
 
+    def _shared_value(self):
+        """ internal_value, without unsharing the value of a copy. It is
+        read by the encoders and must not be modified.
+        """
+        if self._isNull:
+            return None
+        else:
+            return self._internal_value
+
+    def _cow_copy(self):
+        """ Copy keeping the attribName. The value of an attribute is
+        immutable, so the attribute itself is shared.
+        """
+        return self
+
 
 class ElementList(Element):
+    """ A copy shares the list of items with the original until one of
+    them reads internal_value, which may be modified in place. Once the
+    list has been handed out, the copies get their own list.
+    """
+
+    __slots__ = ['_shared', '_exposed']
     shortForm = None
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
         super().__init__(value, canBeNull, attribName)
+        self._shared = False
+        self._exposed = False
+        if type(value) == type(self):
+            if value._isNull and not self._canBeNull:
+                raise ValueError("This {} cannot be Null".format(type(self)))
+            self._share(value)
+        else:
+            itemClass = schema.list_item_type(type(self))
+            listvalue = value if type(value) == list else [value]
+            self._internal_value = [itemClass(v) for v in listvalue]
 
     @property
     def internal_value(self):
-       return self._internal_value
+        if self._shared:
+            self._unshare()
+        self._exposed = True
+        return self._internal_value
+
+    def _shared_value(self):
+        return self._internal_value
+
+    def _share(self, other):
+        """ Take the items of other, of the same type, until one of them is
+        modified.
+        """
+        self._isNull = other._isNull
+        self._exposed = False
+        if other._exposed:
+            # The list of other may be modified through a reference handed
+            # out before
+            self._internal_value = [v if v is None else v._cow_copy() for v in other._internal_value]
+            self._shared = False
+        else:
+            self._internal_value = other._internal_value
+            self._shared = other._shared = True
+
+    def _unshare(self):
+        self._internal_value = [v if v is None else v._cow_copy() for v in self._internal_value]
+        self._shared = False
+
+    def _cow_copy(self):
+        instance = self.__class__.__new__(self.__class__)
+        instance._canBeNull = self._canBeNull
+        instance.attribName = self.attribName
+        instance._share(self)
+        return instance
 
     def copy(self):
-        if self._isNull:
-            value = None
-        else:
-            value = []
-            for v in self.internal_value:
-                value.append(v.copy())
-        return self.__class__(value)
+        instance = self.__class__.__new__(self.__class__)
+        instance._canBeNull = True
+        instance.attribName = None
+        instance._share(self)
+        return instance
+
+    @classmethod
+    def _from_items(cls, items, canBeNull=True, attribName=None):
+        """ Trusted constructor: the list of item elements is used as is,
+        without checks nor copies.
+        """
+        self = cls.__new__(cls)
+        self._isNull = False
+        self._canBeNull = canBeNull
+        self.attribName = attribName
+        self._internal_value = items
+        self._shared = False
+        self._exposed = False
+        return self
+
+
+class _Polymorphic(object):
+    """ Class attribute of Attribute which is overridden by the instances
+    built from another attribute, ex: Attribute(Long(1)).
+    """
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return None
+        return getattr(instance, self.slot, None)
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, value)
 
 
 class Attribute(Element):
     """Attribute is the base type of all attributes of the MAL data model. Attributes are contained within Composites and are used to build complex structures that make the data model."""
 
-    shortForm = None
-
-    value_type = None
+    __slots__ = ['_shortForm', '_value_type']
+    shortForm = _Polymorphic('_shortForm')
+    value_type = _Polymorphic('_value_type')
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
         super().__init__(value, canBeNull, attribName)
         if value is None and self._canBeNull:
             self._isNull = True
         elif type(value) == type(self):
-            self._internal_value = value.copy().internal_value
+            self._internal_value = value._internal_value
+            if type(self) == Attribute:
+                # Attribute built from another attribute, ex: Attribute(Long(1))
+                self.shortForm = value.shortForm
+                self.value_type = value.value_type
         elif type(value) == type(self).value_type:
             self._internal_value = value
         elif type(self) == type(Attribute(None)) and value.shortForm in range(1,19):
-            self._internal_value = value.copy().internal_value
+            self._internal_value = value._internal_value
             self.shortForm = value.shortForm
             self.value_type = value.value_type
         else:
             raise TypeError("Expected {}, got {}.".format(type(self).value_type, type(value)))
 
     def copy(self):
+        if type(self) == Attribute and not self._isNull:
+            # Keep the type of the attribute it was built from
+            return Attribute(self, self._canBeNull)
         return self.__class__(self.internal_value, self._canBeNull)
 
+    @classmethod
+    def _from_value(cls, value, canBeNull=True, attribName=None):
+        """ Trusted constructor: value is a python value of value_type, or
+        None, and is used without checks.
+        """
+        self = cls.__new__(cls)
+        self._isNull = value is None
+        self._canBeNull = canBeNull
+        self.attribName = attribName
+        self._internal_value = value
+        return self
+
 
 class AbstractEnum(Attribute):
 
+    __slots__ = []
     value_type = None
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
@@ -136,196 +253,492 @@ class AbstractEnum(Attribute):
         super().__init__(value, canBeNull, attribName)
 
 
-class Composite(Element):
-    """Composite is the base structure for composite structures that contain a set of elements."""
+def _is_native_buffer(view, typecode):
+    """ True if the memoryview holds numbers which can be copied as is in
+    an array of typecode.
+    """
+    if view.ndim != 1 or not view.c_contiguous or view.itemsize != array(typecode).itemsize:
+        return False
+    return any(view.format in kind and typecode in kind for kind in ('bhilq', 'BHILQ', 'fd'))
 
-    shortForm = None
 
-    _fieldNumber = 0
+class _ArrayItems(MutableSequence):
+    """ View of the items of an ArrayElementList, as the list of the items
+    of the other ElementLists. The attribute elements are built when they
+    are accessed, the items set are stored as python values.
+    """
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
+    __slots__ = ['_list']
 
-    def copy(self):
-        if self._isNull:
-            value = None
+    def __init__(self, elementlist):
+        self._list = elementlist
+
+    def __len__(self):
+        return len(self._list)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._list.item_type(self._list.value(index))
+
+    def __iter__(self):
+        item_type = self._list.item_type
+        for value in self._list.values():
+            yield item_type(value)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            values = list(self._list.values())
+            values[index] = list(value)
+            self._list._replace(values)
         else:
-            value = []
-            for v in self.internal_value:
-                value.append(v.copy())
-        return self.__class__(value, self._canBeNull)
+            self._list._set(index, value)
 
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            values = list(self._list.values())
+            del values[index]
+            self._list._replace(values)
+        else:
+            self._list._delete(index)
 
-class Blob(Attribute):
-    """The Blob structure is used to store binary object attributes. It is a variable-length, unbounded, octet array. The distinction between this type and a list of Octet attributes is that this type may allow language mappings and encodings to use more efficient or appropriate representations."""
+    def insert(self, index, value):
+        self._list._insert(index, value)
 
-    shortForm = MALShortForm.BLOB
-    value_type = bytes
+    def append(self, value):
+        self._list._append(value)
 
 
-class BlobList(ElementList):
-    shortForm = -MALShortForm.BLOB
+class ArrayElementList(ElementList):
+    """ ElementList of a numeric attribute. The values are stored in an
+    array.array and the null items in a bitmap. internal_value is a
+    mutable sequence building the attribute elements on access, values()
+    gives the python values.
+    """
+
+    __slots__ = ['_nulls']
+    shortForm = None
+    item_type = None
+    typecode = None
+    # Typecode whose range the values must fit in, when they are stored
+    # with a wider typecode (ex: Float values stored as doubles)
+    narrow_typecode = None
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
+        # The items are not built by ElementList
+        Element.__init__(self, value, canBeNull, attribName)
+        self._shared = False
+        self._nulls = None
         if type(value) == type(self):
-            if value.internal_value is None:
+            if value._isNull:
                 if self._canBeNull:
                     self._isNull = True
                 else:
                     raise ValueError("This {} cannot be Null".format(type(self)))
+                self._internal_value = array(self.typecode)
             else:
-                self._internal_value = value.copy().internal_value
+                self._internal_value = array(self.typecode, value._internal_value)
+                if value._nulls is not None:
+                    self._nulls = bytearray(value._nulls)
         else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(Blob(v))
+            listvalue = value if type(value) in (list, _ArrayItems) else [value]
+            try:
+                self._internal_value = array(self.typecode, listvalue)
+            except (TypeError, OverflowError):
+                # Null items or elements
+                self._internal_value = array(self.typecode)
+                for v in listvalue:
+                    self._append(v)
+            else:
+                self._check_narrow_range(self._internal_value)
+
+    def _checked_value(self, value):
+        """ Return the python value of an item given as an attribute
+        element, a number or None, after checking its range.
+        """
+        if isinstance(value, Element):
+            value = self.item_type(value).internal_value
+        if value is None:
+            return None
+        try:
+            array(self.typecode, (value,))
+        except TypeError:
+            raise TypeError("Expected {}, got {}.".format(self.item_type.value_type, type(value)))
+        except OverflowError:
+            pass
+        if not self._is_valid(value):
+            raise ValueError("{} is out of the range of {}.".format(value, self.item_type.__name__))
+        return value
+
+    def _set_null(self, index, null=True):
+        if null:
+            if self._nulls is None:
+                self._nulls = bytearray()
+            if len(self._nulls) <= index >> 3:
+                self._nulls.extend(bytes((index >> 3) + 1 - len(self._nulls)))
+            self._nulls[index >> 3] |= 1 << (index & 7)
+        elif self.is_null(index):
+            self._nulls[index >> 3] &= ~(1 << (index & 7))
+
+    def _null_indices(self):
+        if self._nulls is None:
+            return []
+        return [i for i in range(len(self._internal_value)) if self.is_null(i)]
+
+    def _reset_nulls(self, indices):
+        self._nulls = None
+        for index in indices:
+            self._set_null(index)
+
+    def _append(self, value):
+        value = self._checked_value(value)
+        self._internal_value.append(0 if value is None else value)
+        if value is None:
+            self._set_null(len(self._internal_value) - 1)
+
+    def _set(self, index, value):
+        index = range(len(self._internal_value))[index]
+        value = self._checked_value(value)
+        self._internal_value[index] = 0 if value is None else value
+        self._set_null(index, value is None)
+
+    def _insert(self, index, value):
+        # Same bounds as list.insert
+        length = len(self._internal_value)
+        index = min(max(index + length if index < 0 else index, 0), length)
+        if index == length:
+            self._append(value)
+            return
+        value = self._checked_value(value)
+        nulls = [i + (i >= index) for i in self._null_indices()]
+        self._internal_value.insert(index, 0 if value is None else value)
+        if value is None:
+            nulls.append(index)
+        if nulls:
+            self._reset_nulls(nulls)
+
+    def _delete(self, index):
+        index = range(len(self._internal_value))[index]
+        nulls = [i - (i > index) for i in self._null_indices() if i != index]
+        del self._internal_value[index]
+        if self._nulls is not None:
+            self._reset_nulls(nulls)
+
+    def _replace(self, values):
+        # All the values are checked before the list is modified
+        other = self.__class__(values)
+        self._internal_value = other._internal_value
+        self._nulls = other._nulls
+
+    def __len__(self):
+        return len(self._internal_value)
+
+    def is_null(self, index):
+        nulls = self._nulls
+        return nulls is not None and (index >> 3) < len(nulls) and bool(nulls[index >> 3] & (1 << (index & 7)))
+
+    def value(self, index):
+        index = range(len(self._internal_value))[index]
+        return None if self.is_null(index) else self._internal_value[index]
+
+    def values(self):
+        """ Iterate over the python values of the items, None for the null ones """
+        if self._nulls is None:
+            return iter(self._internal_value)
+        return (None if self.is_null(i) else v for i, v in enumerate(self._internal_value))
 
+    @property
+    def internal_value(self):
+        return _ArrayItems(self)
 
-class Boolean(Attribute):
-    """The Boolean structure is used to store Boolean attributes. Possible values are 'True' or 'False'."""
+    def _shared_value(self):
+        return _ArrayItems(self)
 
-    shortForm = MALShortForm.BOOLEAN
-    value_type = bool
+    def copy(self):
+        return self.__class__(self, self._canBeNull)
+
+    def _cow_copy(self):
+        return self.__class__(self, self._canBeNull, self.attribName)
+
+    @classmethod
+    def _from_items(cls, items, canBeNull=True, attribName=None):
+        """ items are python values or None """
+        return cls(items, canBeNull, attribName)
+
+    @classmethod
+    def from_values(cls, values, canBeNull=True, attribName=None):
+        """ Bulk constructor from python numbers, without null items.
+
+        values is any iterable, or an object exposing a buffer of numbers of
+        the kind and size of the typecode (ex: an array.array or a numpy
+        array), which is copied at once. The whole input is checked in a
+        single pass, the ValueError gives every offending index.
+        """
+        self = cls.__new__(cls)
+        Element.__init__(self, values, canBeNull, attribName)
+        self._shared = False
+        self._nulls = None
+        self._internal_value = array(cls.typecode)
+        if values is None:
+            self._isNull = True
+            return self
+        try:
+            view = memoryview(values)
+        except TypeError:
+            view = None
+        if view is not None and _is_native_buffer(view, cls.typecode):
+            self._internal_value.frombytes(view.cast('B'))
+        else:
+            if not isinstance(values, Sequence):
+                values = list(values)
+            try:
+                self._internal_value = array(cls.typecode, values)
+            except (TypeError, OverflowError):
+                raise ValueError(cls._invalid_values_message(values))
+        cls._check_narrow_range(self._internal_value)
+        return self
+
+    @classmethod
+    def _check_narrow_range(cls, values):
+        """ Check that values, an array of the typecode, fit in the range of
+        the narrow typecode.
+        """
+        if cls.narrow_typecode is None:
+            return
+        # The numbers out of the range are narrowed to infinities
+        inf = float('inf')
+        narrowed = array(cls.narrow_typecode, values)
+        if narrowed.count(inf) != values.count(inf) or narrowed.count(-inf) != values.count(-inf):
+            raise ValueError(cls._invalid_values_message(values))
+
+    @classmethod
+    def _is_valid(cls, value):
+        try:
+            stored = array(cls.typecode, (value,))
+        except (TypeError, OverflowError):
+            return False
+        if cls.narrow_typecode is not None:
+            inf = float('inf')
+            return abs(array(cls.narrow_typecode, stored)[0]) != inf or abs(stored[0]) == inf
+        return True
+
+    @classmethod
+    def _invalid_values_message(cls, values):
+        value_range = getattr(cls.item_type, 'value_range', None)
+        minvalue, maxvalue = value_range or (None, None)
+
+        def is_valid(value):
+            if type(value) is int and value_range is not None:
+                return minvalue <= value <= maxvalue
+            return cls._is_valid(value)
+
+        indices = [i for i, v in enumerate(values) if not is_valid(v)]
+        if value_range is not None:
+            expected = "integers between {} and {}".format(minvalue, maxvalue)
+        elif cls.narrow_typecode is not None:
+            expected = "numbers in the {}-bit range".format(8 * array(cls.narrow_typecode).itemsize)
+        else:
+            expected = "numbers"
+        return "{} values must be {}, invalid at the indices {}.".format(cls.item_type.__name__, expected, indices)
 
 
-class BooleanList(ElementList):
-    shortForm = -MALShortForm.BOOLEAN
+class Composite(Element):
+    """Composite is the base structure for composite structures that contain a set of elements."""
+
+    __slots__ = ['_shared', '_exposed']
+    shortForm = None
+
+    _fieldNumber = 0
+    _fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        schema.declare_fields(cls)
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
         super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
+        self._internal_value = [None]*self._fieldNumber
+        self._shared = False
+        self._exposed = False
+        if value is None and self._canBeNull:
+            self._isNull = True
+        elif type(value) == type(self):
+            if value._isNull:
                 if self._canBeNull:
                     self._isNull = True
                 else:
                     raise ValueError("This {} cannot be Null".format(type(self)))
             else:
-                self._internal_value = value.copy().internal_value
+                self._share(value)
+        elif not self._fields:
+            raise RuntimeError("This class is abstract and should not be directly called")
         else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(Boolean(v))
+            for index in range(self._fieldNumber):
+                self._set_field(index, value[index])
+
+    def _set_field(self, index, value):
+        name, fieldClass, canBeNull = schema.field_types(type(self))[index]
+        if fieldClass is Attribute and value is not None:
+            fieldClass = type(value)
+        self._internal_value[index] = fieldClass(value, canBeNull=canBeNull, attribName=name)
+
+    @property
+    def internal_value(self):
+        if self._shared:
+            self._unshare()
+        self._exposed = True
+        return super().internal_value
+
+    def _share(self, other):
+        """ Take the fields of other, of the same type, until one of them is
+        modified. If a field or the list of the fields of other has been
+        handed out, it may be modified through this reference: the fields
+        are then copied right away.
+        """
+        self._isNull = other._isNull
+        self._exposed = False
+        if other._exposed:
+            self._internal_value = [v if v is None else v._cow_copy() for v in other._internal_value]
+            self._shared = False
+        else:
+            self._internal_value = other._internal_value
+            self._shared = other._shared = True
+
+    def _unshare(self):
+        """ Called before the fields are read or written through the
+        properties: the composite and list fields get their own copies, so
+        that they can be modified too.
+        """
+        self._internal_value = [v if v is None else v._cow_copy() for v in self._internal_value]
+        self._shared = False
+
+    def _cow_copy(self):
+        instance = self.__class__.__new__(self.__class__)
+        instance._canBeNull = self._canBeNull
+        instance.attribName = self.attribName
+        instance._share(self)
+        return instance
+
+    def copy(self):
+        """ The copy shares the fields until one of the composites is
+        modified.
+        """
+        instance = self.__class__.__new__(self.__class__)
+        instance._canBeNull = self._canBeNull
+        instance.attribName = None
+        instance._share(self)
+        return instance
+
+    @classmethod
+    def _from_fields(cls, fields, canBeNull=True, attribName=None):
+        """ Trusted constructor: fields is the list of the field elements,
+        in the order of _fields, each with its attribName. It is used as is,
+        without checks nor copies.
+        """
+        self = cls.__new__(cls)
+        self._isNull = False
+        self._canBeNull = canBeNull
+        self.attribName = attribName
+        self._internal_value = fields
+        self._shared = False
+        self._exposed = False
+        return self
+
+
+class Blob(Attribute):
+    """The Blob structure is used to store binary object attributes. It is a variable-length, unbounded, octet array. The distinction between this type and a list of Octet attributes is that this type may allow language mappings and encodings to use more efficient or appropriate representations."""
+
+    __slots__ = []
+    shortForm = MALShortForm.BLOB
+    value_type = bytes
+
+
+class BlobList(ElementList):
+    __slots__ = []
+    shortForm = -MALShortForm.BLOB
+
+
+class Boolean(Attribute):
+    """The Boolean structure is used to store Boolean attributes. Possible values are 'True' or 'False'."""
+
+    __slots__ = []
+    shortForm = MALShortForm.BOOLEAN
+    value_type = bool
+
+
+class BooleanList(ElementList):
+    __slots__ = []
+    shortForm = -MALShortForm.BOOLEAN
 
 
 class Duration(Attribute):
     """The Duration structure is used to store Duration attributes. It represents a length of time in seconds. It may contain a fractional component."""
 
+    __slots__ = []
     shortForm = MALShortForm.DURATION
     value_type = float
 
 
-class DurationList(ElementList):
+class DurationList(ArrayElementList):
+    __slots__ = []
     shortForm = -MALShortForm.DURATION
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(Duration(v))
+    item_type = Duration
+    typecode = 'd'
 
 
 class Float(Attribute):
     """The Float structure is used to store floating point attributes using the IEEE 754 32-bit range.
 Three special values exist for this type: POSITIVE_INFINITY, NEGATIVE_INFINITY, and NaN (Not A Number)."""
 
+    __slots__ = []
     shortForm = MALShortForm.FLOAT
     value_type = float
 
 
-class FloatList(ElementList):
+class FloatList(ArrayElementList):
+    __slots__ = []
     shortForm = -MALShortForm.FLOAT
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(Float(v))
+    item_type = Float
+    typecode = 'd'
+    narrow_typecode = 'f'
 
 
 class Double(Attribute):
     """The Double structure is used to store floating point attributes using the IEEE 754 64-bit range.
 Three special values exist for this type: POSITIVE_INFINITY, NEGATIVE_INFINITY, and NaN (Not A Number)."""
 
+    __slots__ = []
     shortForm = MALShortForm.DOUBLE
     value_type = float
 
 
-class DoubleList(ElementList):
+class DoubleList(ArrayElementList):
+    __slots__ = []
     shortForm = -MALShortForm.DOUBLE
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(Double(v))
+    item_type = Double
+    typecode = 'd'
 
 
 class Identifier(Attribute):
     """The Identifier structure is used to store an identifier and can be used for indexing. It is a variable-length, unbounded, Unicode string."""
 
+    __slots__ = []
     shortForm = MALShortForm.IDENTIFIER
     value_type = str
 
 
 class IdentifierList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.IDENTIFIER
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(Identifier(v))
-
 
 class Octet(Attribute):
     """The Octet structure is used to store 8-bit signed attributes. The permitted range is -128 to 127."""
 
+    __slots__ = []
     shortForm = MALShortForm.OCTET
     value_type = int
+    value_range = (-128, 127)
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
         super().__init__(value, canBeNull, attribName)
@@ -333,31 +746,20 @@ class Octet(Attribute):
             raise ValueError("Authorized value is between -128 and 127.")
 
 
-class OctetList(ElementList):
+class OctetList(ArrayElementList):
+    __slots__ = []
     shortForm = -MALShortForm.OCTET
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(Octet(v))
+    item_type = Octet
+    typecode = 'b'
 
 
 class UOctet(Attribute):
     """The UOctet structure is used to store 8-bit unsigned attributes. The permitted range is 0 to 255."""
 
+    __slots__ = []
     shortForm = MALShortForm.UOCTET
     value_type = int
+    value_range = (0, 255)
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
         super().__init__(value, canBeNull, attribName)
@@ -365,31 +767,20 @@ class UOctet(Attribute):
             raise ValueError("Authorized value is between 0 and 255.")
 
 
-class UOctetList(ElementList):
+class UOctetList(ArrayElementList):
+    __slots__ = []
     shortForm = -MALShortForm.UOCTET
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(UOctet(v))
+    item_type = UOctet
+    typecode = 'B'
 
 
 class Short(Attribute):
     """The Short structure is used to store 16-bit signed attributes. The permitted range is -32768 to 32767."""
 
+    __slots__ = []
     shortForm = MALShortForm.SHORT
     value_type = int
+    value_range = (-32768, 32767)
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
         super().__init__(value, canBeNull, attribName)
@@ -397,31 +788,20 @@ class Short(Attribute):
             raise ValueError("Authorized value is between -32768 and 32767.")
 
 
-class ShortList(ElementList):
+class ShortList(ArrayElementList):
+    __slots__ = []
     shortForm = -MALShortForm.SHORT
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(Short(v))
+    item_type = Short
+    typecode = 'h'
 
 
 class UShort(Attribute):
     """The UShort structure is used to store 16-bit unsigned attributes. The permitted range is 0 to 65535."""
 
+    __slots__ = []
     shortForm = MALShortForm.USHORT
     value_type = int
+    value_range = (0, 65535)
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
         super().__init__(value, canBeNull, attribName)
@@ -429,63 +809,41 @@ class UShort(Attribute):
             raise ValueError("Authorized value is between 0 and 65535.")
 
 
-class UShortList(ElementList):
+class UShortList(ArrayElementList):
+    __slots__ = []
     shortForm = -MALShortForm.USHORT
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(UShort(v))
+    item_type = UShort
+    typecode = 'H'
 
 
 class Integer(Attribute):
     """The Integer structure is used to store 32-bit signed attributes. The permitted range is -2147483648 to 2147483647."""
 
+    __slots__ = []
     shortForm = MALShortForm.INTEGER
     value_type = int
+    value_range = (-2147483648, 2147483647)
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
         super().__init__(value, canBeNull, attribName)
-        if type(value) == int and ( value < -2147483648 or value > 21474836487 ):
-            raise ValueError("Authorized value is between -2147483648 and 21474836487.")
+        if type(value) == int and ( value < -2147483648 or value > 2147483647 ):
+            raise ValueError("Authorized value is between -2147483648 and 2147483647.")
 
 
-class IntegerList(ElementList):
+class IntegerList(ArrayElementList):
+    __slots__ = []
     shortForm = -MALShortForm.INTEGER
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(Integer(v))
+    item_type = Integer
+    typecode = 'i'
 
 
 class UInteger(Attribute):
     """The UInteger structure is used to store 32-bit unsigned attributes. The permitted range is 0 to 4294967295."""
 
+    __slots__ = []
     shortForm = MALShortForm.UINTEGER
     value_type = int
+    value_range = (0, 4294967295)
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
         super().__init__(value, canBeNull, attribName)
@@ -493,31 +851,20 @@ class UInteger(Attribute):
             raise ValueError("Authorized value is between 0 and 4294967295.")
 
 
-class UIntegerList(ElementList):
+class UIntegerList(ArrayElementList):
+    __slots__ = []
     shortForm = -MALShortForm.UINTEGER
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(UInteger(v))
+    item_type = UInteger
+    typecode = 'I'
 
 
 class Long(Attribute):
     """The Long structure is used to store 64-bit signed attributes. The permitted range is -9223372036854775808 to 9223372036854775807."""
 
+    __slots__ = []
     shortForm = MALShortForm.LONG
     value_type = int
+    value_range = (-9223372036854775808, 9223372036854775807)
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
         super().__init__(value, canBeNull, attribName)
@@ -525,31 +872,20 @@ class Long(Attribute):
             raise ValueError("Authorized value is between -9223372036854775808 and 9223372036854775807.")
 
 
-class LongList(ElementList):
+class LongList(ArrayElementList):
+    __slots__ = []
     shortForm = -MALShortForm.LONG
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(Long(v))
+    item_type = Long
+    typecode = 'q'
 
 
 class ULong(Attribute):
     """The ULong structure is used to store 64-bit unsigned attributes. The permitted range is 0 to 18446744073709551615."""
 
+    __slots__ = []
     shortForm = MALShortForm.ULONG
     value_type = int
+    value_range = (0, 18446744073709551615)
 
     def __init__(self, value=None, canBeNull=True, attribName=None):
         super().__init__(value, canBeNull, attribName)
@@ -557,133 +893,68 @@ class ULong(Attribute):
             raise ValueError("Authorized value is between 0 and 18446744073709551615.")
 
 
-class ULongList(ElementList):
+class ULongList(ArrayElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ULONG
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ULong(v))
+    item_type = ULong
+    typecode = 'Q'
 
 
 class String(Attribute):
     """The String structure is used to store String attributes. It is a variable-length, unbounded, Unicode string."""
 
+    __slots__ = []
     shortForm = MALShortForm.STRING
     value_type = str
 
 
 class StringList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.STRING
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(String(v))
-
 
 class Time(Attribute):
     """The Time structure is used to store absolute time attributes. It represents an absolute date and time to millisecond resolution."""
 
+    __slots__ = []
     shortForm = MALShortForm.TIME
     value_type = float
 
 
-class TimeList(ElementList):
+class TimeList(ArrayElementList):
+    __slots__ = []
     shortForm = -MALShortForm.TIME
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(Time(v))
+    item_type = Time
+    typecode = 'd'
 
 
 class FineTime(Attribute):
     """The FineTime structure is used to store high-resolution absolute time attributes. It represents an absolute date and time to picosecond resolution."""
 
+    __slots__ = []
     shortForm = MALShortForm.FINETIME
     value_type = float
 
 
-class FineTimeList(ElementList):
+class FineTimeList(ArrayElementList):
+    __slots__ = []
     shortForm = -MALShortForm.FINETIME
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(FineTime(v))
+    item_type = FineTime
+    typecode = 'd'
 
 
 class URI(Attribute):
     """The URI structure is used to store URI addresses. It is a variable-length, unbounded, Unicode string."""
 
+    __slots__ = []
     shortForm = MALShortForm.URI
     value_type = str
 
 
 class URIList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.URI
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(URI(v))
-
 
 class InteractionTypeEnum(IntEnum):
     """InteractionType is an enumeration holding the possible interaction pattern types."""
@@ -699,29 +970,15 @@ class InteractionTypeEnum(IntEnum):
 class InteractionType(AbstractEnum):
     """InteractionType is an enumeration holding the possible interaction pattern types."""
 
+    __slots__ = []
     shortForm = MALShortForm.INTERACTIONTYPE
     value_type = InteractionTypeEnum
 
 
 class InteractionTypeList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.INTERACTIONTYPE
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(InteractionType(v))
-
 
 class SessionTypeEnum(IntEnum):
     """SessionType is an enumeration holding the session types."""
@@ -734,29 +991,15 @@ class SessionTypeEnum(IntEnum):
 class SessionType(AbstractEnum):
     """SessionType is an enumeration holding the session types."""
 
+    __slots__ = []
     shortForm = MALShortForm.SESSIONTYPE
     value_type = SessionTypeEnum
 
 
 class SessionTypeList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.SESSIONTYPE
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(SessionType(v))
-
 
 class QoSLevelEnum(IntEnum):
     """QoSLevel is an enumeration holding the possible QoS levels."""
@@ -770,29 +1013,15 @@ class QoSLevelEnum(IntEnum):
 class QoSLevel(AbstractEnum):
     """QoSLevel is an enumeration holding the possible QoS levels."""
 
+    __slots__ = []
     shortForm = MALShortForm.QOSLEVEL
     value_type = QoSLevelEnum
 
 
 class QoSLevelList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.QOSLEVEL
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(QoSLevel(v))
-
 
 class UpdateTypeEnum(IntEnum):
     """UpdateType is an enumeration holding the possible Update types."""
@@ -806,663 +1035,225 @@ class UpdateTypeEnum(IntEnum):
 class UpdateType(AbstractEnum):
     """UpdateType is an enumeration holding the possible Update types."""
 
+    __slots__ = []
     shortForm = MALShortForm.UPDATETYPE
     value_type = UpdateTypeEnum
 
 
 class UpdateTypeList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.UPDATETYPE
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(UpdateType(v))
-
 
 class Subscription(Composite):
     """The Subscription structure is used when subscribing for updates using the PUBSUB interaction pattern. It contains a single identifier that identifies the subscription being defined and a set of entities being requested."""
 
+    __slots__ = []
     shortForm = MALShortForm.SUBSCRIPTION
-    _fieldNumber = Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.subscriptionId = value[Composite._fieldNumber + 0]
-            self.entities = value[Composite._fieldNumber + 1]
-
-    @property
-    def subscriptionId(self):
-        return self._internal_value[Composite._fieldNumber + 0]
-
-    @subscriptionId.setter
-    def subscriptionId(self, subscriptionId):
-        self._internal_value[Composite._fieldNumber + 0] = Identifier(subscriptionId, canBeNull=False, attribName='subscriptionId')
-        self._isNull = False
-
-    @property
-    def entities(self):
-        return self._internal_value[Composite._fieldNumber + 1]
-
-    @entities.setter
-    def entities(self, entities):
-        self._internal_value[Composite._fieldNumber + 1] = EntityRequestList(entities, canBeNull=False, attribName='entities')
-        self._isNull = False
+    _fields = Composite._fields + (
+        ('subscriptionId', 'Identifier', False),
+        ('entities', 'EntityRequestList', False),
+    )
 
 
 class SubscriptionList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.SUBSCRIPTION
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(Subscription(v))
-
 
 class EntityRequest(Composite):
     """The EntityRequest structure is used when subscribing for updates using the PUBSUB interaction pattern."""
 
+    __slots__ = []
     shortForm = MALShortForm.ENTITYREQUEST
-    _fieldNumber = Composite._fieldNumber + 6
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*6
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.subDomain = value[Composite._fieldNumber + 0]
-            self.allAreas = value[Composite._fieldNumber + 1]
-            self.allServices = value[Composite._fieldNumber + 2]
-            self.allOperations = value[Composite._fieldNumber + 3]
-            self.onlyOnChange = value[Composite._fieldNumber + 4]
-            self.entityKeys = value[Composite._fieldNumber + 5]
-
-    @property
-    def subDomain(self):
-        return self._internal_value[Composite._fieldNumber + 0]
-
-    @subDomain.setter
-    def subDomain(self, subDomain):
-        self._internal_value[Composite._fieldNumber + 0] = IdentifierList(subDomain, canBeNull=True, attribName='subDomain')
-        self._isNull = False
-
-    @property
-    def allAreas(self):
-        return self._internal_value[Composite._fieldNumber + 1]
-
-    @allAreas.setter
-    def allAreas(self, allAreas):
-        self._internal_value[Composite._fieldNumber + 1] = Boolean(allAreas, canBeNull=False, attribName='allAreas')
-        self._isNull = False
-
-    @property
-    def allServices(self):
-        return self._internal_value[Composite._fieldNumber + 2]
-
-    @allServices.setter
-    def allServices(self, allServices):
-        self._internal_value[Composite._fieldNumber + 2] = Boolean(allServices, canBeNull=False, attribName='allServices')
-        self._isNull = False
-
-    @property
-    def allOperations(self):
-        return self._internal_value[Composite._fieldNumber + 3]
-
-    @allOperations.setter
-    def allOperations(self, allOperations):
-        self._internal_value[Composite._fieldNumber + 3] = Boolean(allOperations, canBeNull=False, attribName='allOperations')
-        self._isNull = False
-
-    @property
-    def onlyOnChange(self):
-        return self._internal_value[Composite._fieldNumber + 4]
-
-    @onlyOnChange.setter
-    def onlyOnChange(self, onlyOnChange):
-        self._internal_value[Composite._fieldNumber + 4] = Boolean(onlyOnChange, canBeNull=False, attribName='onlyOnChange')
-        self._isNull = False
-
-    @property
-    def entityKeys(self):
-        return self._internal_value[Composite._fieldNumber + 5]
-
-    @entityKeys.setter
-    def entityKeys(self, entityKeys):
-        self._internal_value[Composite._fieldNumber + 5] = EntityKeyList(entityKeys, canBeNull=False, attribName='entityKeys')
-        self._isNull = False
+    _fields = Composite._fields + (
+        ('subDomain', 'IdentifierList', True),
+        ('allAreas', 'Boolean', False),
+        ('allServices', 'Boolean', False),
+        ('allOperations', 'Boolean', False),
+        ('onlyOnChange', 'Boolean', False),
+        ('entityKeys', 'EntityKeyList', False),
+    )
 
 
 class EntityRequestList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ENTITYREQUEST
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(EntityRequest(v))
-
 
 class EntityKey(Composite):
     """The EntityKey structure is used to identify an entity in the PUBSUB interaction pattern."""
 
+    __slots__ = []
     shortForm = MALShortForm.ENTITYKEY
-    _fieldNumber = Composite._fieldNumber + 4
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*4
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.firstSubKey = value[Composite._fieldNumber + 0]
-            self.secondSubKey = value[Composite._fieldNumber + 1]
-            self.thirdSubKey = value[Composite._fieldNumber + 2]
-            self.fourthSubKey = value[Composite._fieldNumber + 3]
-
-    @property
-    def firstSubKey(self):
-        return self._internal_value[Composite._fieldNumber + 0]
-
-    @firstSubKey.setter
-    def firstSubKey(self, firstSubKey):
-        self._internal_value[Composite._fieldNumber + 0] = Identifier(firstSubKey, canBeNull=True, attribName='firstSubKey')
-        self._isNull = False
-
-    @property
-    def secondSubKey(self):
-        return self._internal_value[Composite._fieldNumber + 1]
-
-    @secondSubKey.setter
-    def secondSubKey(self, secondSubKey):
-        self._internal_value[Composite._fieldNumber + 1] = Long(secondSubKey, canBeNull=True, attribName='secondSubKey')
-        self._isNull = False
-
-    @property
-    def thirdSubKey(self):
-        return self._internal_value[Composite._fieldNumber + 2]
-
-    @thirdSubKey.setter
-    def thirdSubKey(self, thirdSubKey):
-        self._internal_value[Composite._fieldNumber + 2] = Long(thirdSubKey, canBeNull=True, attribName='thirdSubKey')
-        self._isNull = False
-
-    @property
-    def fourthSubKey(self):
-        return self._internal_value[Composite._fieldNumber + 3]
-
-    @fourthSubKey.setter
-    def fourthSubKey(self, fourthSubKey):
-        self._internal_value[Composite._fieldNumber + 3] = Long(fourthSubKey, canBeNull=True, attribName='fourthSubKey')
-        self._isNull = False
+    _fields = Composite._fields + (
+        ('firstSubKey', 'Identifier', True),
+        ('secondSubKey', 'Long', True),
+        ('thirdSubKey', 'Long', True),
+        ('fourthSubKey', 'Long', True),
+    )
 
 
 class EntityKeyList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ENTITYKEY
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(EntityKey(v))
-
 
 class UpdateHeader(Composite):
     """The UpdateHeader structure is used by updates using the PUBSUB interaction pattern. It holds information that identifies a single update."""
 
+    __slots__ = []
     shortForm = MALShortForm.UPDATEHEADER
-    _fieldNumber = Composite._fieldNumber + 4
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*4
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.timestamp = value[Composite._fieldNumber + 0]
-            self.sourceURI = value[Composite._fieldNumber + 1]
-            self.updateType = value[Composite._fieldNumber + 2]
-            self.key = value[Composite._fieldNumber + 3]
-
-    @property
-    def timestamp(self):
-        return self._internal_value[Composite._fieldNumber + 0]
-
-    @timestamp.setter
-    def timestamp(self, timestamp):
-        self._internal_value[Composite._fieldNumber + 0] = Time(timestamp, canBeNull=False, attribName='timestamp')
-        self._isNull = False
-
-    @property
-    def sourceURI(self):
-        return self._internal_value[Composite._fieldNumber + 1]
-
-    @sourceURI.setter
-    def sourceURI(self, sourceURI):
-        self._internal_value[Composite._fieldNumber + 1] = URI(sourceURI, canBeNull=False, attribName='sourceURI')
-        self._isNull = False
-
-    @property
-    def updateType(self):
-        return self._internal_value[Composite._fieldNumber + 2]
-
-    @updateType.setter
-    def updateType(self, updateType):
-        self._internal_value[Composite._fieldNumber + 2] = UpdateType(updateType, canBeNull=False, attribName='updateType')
-        self._isNull = False
-
-    @property
-    def key(self):
-        return self._internal_value[Composite._fieldNumber + 3]
-
-    @key.setter
-    def key(self, key):
-        self._internal_value[Composite._fieldNumber + 3] = EntityKey(key, canBeNull=False, attribName='key')
-        self._isNull = False
+    _fields = Composite._fields + (
+        ('timestamp', 'Time', False),
+        ('sourceURI', 'URI', False),
+        ('updateType', 'UpdateType', False),
+        ('key', 'EntityKey', False),
+    )
 
 
 class UpdateHeaderList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.UPDATEHEADER
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(UpdateHeader(v))
-
 
 class IdBooleanPair(Composite):
     """IdBooleanPair is a simple pair type of an identifier and Boolean value."""
 
+    __slots__ = []
     shortForm = MALShortForm.IDBOOLEANPAIR
-    _fieldNumber = Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.id = value[Composite._fieldNumber + 0]
-            self.value = value[Composite._fieldNumber + 1]
-
-    @property
-    def id(self):
-        return self._internal_value[Composite._fieldNumber + 0]
-
-    @id.setter
-    def id(self, id):
-        self._internal_value[Composite._fieldNumber + 0] = Identifier(id, canBeNull=True, attribName='id')
-        self._isNull = False
-
-    @property
-    def value(self):
-        return self._internal_value[Composite._fieldNumber + 1]
-
-    @value.setter
-    def value(self, value):
-        self._internal_value[Composite._fieldNumber + 1] = Boolean(value, canBeNull=True, attribName='value')
-        self._isNull = False
+    _fields = Composite._fields + (
+        ('id', 'Identifier', True),
+        ('value', 'Boolean', True),
+    )
 
 
 class IdBooleanPairList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.IDBOOLEANPAIR
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(IdBooleanPair(v))
-
 
 class Pair(Composite):
     """Pair is a simple composite structure for holding pairs. The pairs can be user-defined attributes."""
 
+    __slots__ = []
     shortForm = MALShortForm.PAIR
-    _fieldNumber = Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.first = value[Composite._fieldNumber + 0]
-            self.second = value[Composite._fieldNumber + 1]
-
-    @property
-    def first(self):
-        return self._internal_value[Composite._fieldNumber + 0]
-
-    @first.setter
-    def first(self, first):
-        if first is None:
-            self._internal_value[Composite._fieldNumber + 0] = Attribute(first, canBeNull=True, attribName='first')
-        else:
-            self._internal_value[Composite._fieldNumber + 0] = type(first)(first, canBeNull=True, attribName='first')
-        self._isNull = False
-
-    @property
-    def second(self):
-        return self._internal_value[Composite._fieldNumber + 1]
-
-    @second.setter
-    def second(self, second):
-        if second is None:
-            self._internal_value[Composite._fieldNumber + 1] = Attribute(second, canBeNull=True, attribName='second')
-        else:
-            self._internal_value[Composite._fieldNumber + 1] = type(second)(second, canBeNull=True, attribName='second')
-        self._isNull = False
+    _fields = Composite._fields + (
+        ('first', 'Attribute', True),
+        ('second', 'Attribute', True),
+    )
 
 
 class PairList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.PAIR
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(Pair(v))
-
 
 class NamedValue(Composite):
     """The NamedValue structure represents a simple pair type of an identifier and abstract attribute value."""
 
+    __slots__ = []
     shortForm = MALShortForm.NAMEDVALUE
-    _fieldNumber = Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.name = value[Composite._fieldNumber + 0]
-            self.value = value[Composite._fieldNumber + 1]
-
-    @property
-    def name(self):
-        return self._internal_value[Composite._fieldNumber + 0]
-
-    @name.setter
-    def name(self, name):
-        self._internal_value[Composite._fieldNumber + 0] = Identifier(name, canBeNull=True, attribName='name')
-        self._isNull = False
-
-    @property
-    def value(self):
-        return self._internal_value[Composite._fieldNumber + 1]
-
-    @value.setter
-    def value(self, value):
-        if value is None:
-            self._internal_value[Composite._fieldNumber + 1] = Attribute(value, canBeNull=True, attribName='value')
-        else:
-            self._internal_value[Composite._fieldNumber + 1] = type(value)(value, canBeNull=True, attribName='value')
-        self._isNull = False
+    _fields = Composite._fields + (
+        ('name', 'Identifier', True),
+        ('value', 'Attribute', True),
+    )
 
 
 class NamedValueList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.NAMEDVALUE
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(NamedValue(v))
-
 
 class File(Composite):
     """The File structure represents a File and holds details about a File. It can also, optionally, hold a BLOB of the file data. The file type is denoted using the internet MIME media types, the list of official MIME types is held at http://www.iana.org/assignments/media-types/index.html."""
 
+    __slots__ = []
     shortForm = MALShortForm.FILE
-    _fieldNumber = Composite._fieldNumber + 7
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*7
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.name = value[Composite._fieldNumber + 0]
-            self.mimeType = value[Composite._fieldNumber + 1]
-            self.creationDate = value[Composite._fieldNumber + 2]
-            self.modificationDate = value[Composite._fieldNumber + 3]
-            self.size = value[Composite._fieldNumber + 4]
-            self.content = value[Composite._fieldNumber + 5]
-            self.metaData = value[Composite._fieldNumber + 6]
-
-    @property
-    def name(self):
-        return self._internal_value[Composite._fieldNumber + 0]
-
-    @name.setter
-    def name(self, name):
-        self._internal_value[Composite._fieldNumber + 0] = Identifier(name, canBeNull=False, attribName='name')
-        self._isNull = False
-
-    @property
-    def mimeType(self):
-        return self._internal_value[Composite._fieldNumber + 1]
-
-    @mimeType.setter
-    def mimeType(self, mimeType):
-        self._internal_value[Composite._fieldNumber + 1] = String(mimeType, canBeNull=True, attribName='mimeType')
-        self._isNull = False
-
-    @property
-    def creationDate(self):
-        return self._internal_value[Composite._fieldNumber + 2]
-
-    @creationDate.setter
-    def creationDate(self, creationDate):
-        self._internal_value[Composite._fieldNumber + 2] = Time(creationDate, canBeNull=True, attribName='creationDate')
-        self._isNull = False
-
-    @property
-    def modificationDate(self):
-        return self._internal_value[Composite._fieldNumber + 3]
-
-    @modificationDate.setter
-    def modificationDate(self, modificationDate):
-        self._internal_value[Composite._fieldNumber + 3] = Time(modificationDate, canBeNull=True, attribName='modificationDate')
-        self._isNull = False
-
-    @property
-    def size(self):
-        return self._internal_value[Composite._fieldNumber + 4]
-
-    @size.setter
-    def size(self, size):
-        self._internal_value[Composite._fieldNumber + 4] = ULong(size, canBeNull=True, attribName='size')
-        self._isNull = False
-
-    @property
-    def content(self):
-        return self._internal_value[Composite._fieldNumber + 5]
-
-    @content.setter
-    def content(self, content):
-        self._internal_value[Composite._fieldNumber + 5] = Blob(content, canBeNull=True, attribName='content')
-        self._isNull = False
-
-    @property
-    def metaData(self):
-        return self._internal_value[Composite._fieldNumber + 6]
-
-    @metaData.setter
-    def metaData(self, metaData):
-        self._internal_value[Composite._fieldNumber + 6] = NamedValueList(metaData, canBeNull=True, attribName='metaData')
-        self._isNull = False
+    _fields = Composite._fields + (
+        ('name', 'Identifier', False),
+        ('mimeType', 'String', True),
+        ('creationDate', 'Time', True),
+        ('modificationDate', 'Time', True),
+        ('size', 'ULong', True),
+        ('content', 'Blob', True),
+        ('metaData', 'NamedValueList', True),
+    )
 
 
 class FileList(ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.FILE
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(File(v))
+
+registry.register(1, 0, 1, (
+    Attribute,
+    AbstractEnum,
+    ArrayElementList,
+    Composite,
+    Element,
+    ElementList,
+    Blob,
+    BlobList,
+    Boolean,
+    BooleanList,
+    Duration,
+    DurationList,
+    Float,
+    FloatList,
+    Double,
+    DoubleList,
+    Identifier,
+    IdentifierList,
+    Octet,
+    OctetList,
+    UOctet,
+    UOctetList,
+    Short,
+    ShortList,
+    UShort,
+    UShortList,
+    Integer,
+    IntegerList,
+    UInteger,
+    UIntegerList,
+    Long,
+    LongList,
+    ULong,
+    ULongList,
+    String,
+    StringList,
+    Time,
+    TimeList,
+    FineTime,
+    FineTimeList,
+    URI,
+    URIList,
+    InteractionType,
+    InteractionTypeList,
+    SessionType,
+    SessionTypeList,
+    QoSLevel,
+    QoSLevelList,
+    UpdateType,
+    UpdateTypeList,
+    Subscription,
+    SubscriptionList,
+    EntityRequest,
+    EntityRequestList,
+    EntityKey,
+    EntityKeyList,
+    UpdateHeader,
+    UpdateHeaderList,
+    IdBooleanPair,
+    IdBooleanPairList,
+    Pair,
+    PairList,
+    NamedValue,
+    NamedValueList,
+    File,
+    FileList,
+    ))
 
 
 class Errors(IntEnum):
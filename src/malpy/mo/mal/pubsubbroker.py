@@ -0,0 +1,212 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Subscription store and matching of a PUBSUB broker.
+
+The PubSubBrokerHandler only handles the stages of the interaction. The
+PubSubBroker keeps the registered subscriptions and computes the NOTIFY
+messages of a PUBLISH.
+
+Each entity key of each entity request of a subscription is stored at
+the end of a path in a tree of dictionaries:
+    (session, session name, network zone), domain identifiers,
+    area, service, operation, the four sub-keys
+A wildcard (the '*' identifier at the end of the domain, allAreas,
+allServices, allOperations, the '*' first sub-key and the 0 other
+sub-keys) is stored under the _ANY branch. Matching an update follows the
+exact branch and the _ANY branch at each level, so that it does not depend
+on the number of subscriptions, only on the ones which match.
+"""
+
+import threading
+
+from .maltypes import UpdateTypeEnum, Identifier, UpdateHeaderList
+
+
+class _Wildcard(object):
+    def __repr__(self):
+        return '*'
+
+
+_ANY = _Wildcard()
+_END = object()  # End of the domain of a subscription without wildcard
+
+DOMAIN_WILDCARD = '*'
+IDENTIFIER_WILDCARD = '*'
+LONG_WILDCARD = 0
+
+
+def _value(element):
+    return getattr(element, 'internal_value', element)
+
+
+def _identifiers(identifiers):
+    if identifiers is None:
+        return []
+    # IdentifierList(None) holds a null Identifier
+    return [v for v in (_value(i) for i in _value(identifiers) or []) if v is not None]
+
+
+def _scope(header):
+    return (header.session, header.session_name, header.network_zone)
+
+
+def _domain_path(domain):
+    if domain and domain[-1] == DOMAIN_WILDCARD:
+        return domain[:-1] + [_ANY]
+    return domain + [_END]
+
+
+def _key_path(header, entity_request, entity_key):
+    first, second, third, fourth = [_value(k) for k in _value(entity_key)]
+    return [
+        _ANY if _value(entity_request.allAreas) else header.area,
+        _ANY if _value(entity_request.allServices) else header.service,
+        _ANY if _value(entity_request.allOperations) else header.operation,
+        _ANY if first == IDENTIFIER_WILDCARD else first,
+        _ANY if second == LONG_WILDCARD else second,
+        _ANY if third == LONG_WILDCARD else third,
+        _ANY if fourth == LONG_WILDCARD else fourth,
+        ]
+
+
+def _leaves(node, keys, depth=0):
+    """ Yield the leaves under node matching the keys, exactly or with a
+    wildcard.
+    """
+    if depth == len(keys):
+        yield node
+        return
+    child = node.get(keys[depth])
+    if child is not None:
+        yield from _leaves(child, keys, depth + 1)
+    child = node.get(_ANY)
+    if child is not None:
+        yield from _leaves(child, keys, depth + 1)
+
+
+class PubSubBroker(object):
+    """ Registered subscriptions of a broker.
+
+    A subscription is identified by the URI of its consumer and its
+    subscriptionId, registering it again replaces it.
+    """
+
+    def __init__(self):
+        self._index = {}
+        self._subscriptions = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    def register(self, header, subscription):
+        """ @param header: the MALHeader of the REGISTER message
+            @param subscription: the registered mal.Subscription
+        """
+        subscription_id = _value(subscription.subscriptionId)
+        reference = (header.uri_from, subscription_id)
+        domain = _identifiers(header.domain)
+        entries = []
+        for entity_request in _value(subscription.entities):
+            only_on_change = bool(_value(entity_request.onlyOnChange))
+            path = [_scope(header)] + _domain_path(domain + _identifiers(entity_request.subDomain))
+            for entity_key in _value(entity_request.entityKeys):
+                entries.append((path + _key_path(header, entity_request, entity_key),
+                                (reference, only_on_change)))
+        with self._lock:
+            self._remove(reference)
+            for path, entry in entries:
+                node = self._index
+                for key in path:
+                    node = node.setdefault(key, {})
+                node[entry] = node.get(entry, 0) + 1
+            self._subscriptions[reference] = entries
+
+    def deregister(self, header, subscription_ids):
+        """ @param header: the MALHeader of the DEREGISTER message
+            @param subscription_ids: the deregistered subscriptionIds
+        """
+        with self._lock:
+            for subscription_id in _identifiers(subscription_ids):
+                self._remove((header.uri_from, subscription_id))
+
+    def deregister_consumer(self, uri):
+        """ Remove all the subscriptions of a consumer (ex: disconnected) """
+        with self._lock:
+            for reference in [r for r in self._subscriptions if r[0] == uri]:
+                self._remove(reference)
+
+    def _remove(self, reference):
+        for path, entry in self._subscriptions.pop(reference, []):
+            nodes = [self._index]
+            for key in path:
+                nodes.append(nodes[-1][key])
+            nodes[-1][entry] -= 1
+            if nodes[-1][entry] == 0:
+                del nodes[-1][entry]
+            for key, parent, node in zip(reversed(path), reversed(nodes[:-1]), reversed(nodes[1:])):
+                if node:
+                    break
+                del parent[key]
+
+    def match(self, header, update_header):
+        """ Return the set of (consumer URI, subscriptionId) to notify of
+        an update.
+
+        @param header: the MALHeader of the PUBLISH message
+        @param update_header: a mal.UpdateHeader of the PUBLISH message
+        """
+        key = [_value(k) for k in _value(update_header.key)]
+        keys = [header.area, header.service, header.operation] + key
+        is_change = _value(update_header.updateType) != UpdateTypeEnum.UPDATE
+        domain = _identifiers(header.domain)
+        matches = set()
+        with self._lock:
+            node = self._index.get(_scope(header))
+            if node is None:
+                return matches
+            domain_nodes = []
+            for identifier in domain:
+                domain_nodes.append(node.get(_ANY))
+                node = node.get(identifier)
+                if node is None:
+                    break
+            else:
+                domain_nodes.append(node.get(_ANY))
+                domain_nodes.append(node.get(_END))
+            for domain_node in domain_nodes:
+                if domain_node is None:
+                    continue
+                for leaf in _leaves(domain_node, keys):
+                    for reference, only_on_change in leaf:
+                        if is_change or not only_on_change:
+                            matches.add(reference)
+        return matches
+
+    def publish(self, header, update_headers):
+        """ Return {(consumer URI, subscriptionId): [indexes of the updates]}
+        for the updates of a PUBLISH message.
+        """
+        notified = {}
+        for i, update_header in enumerate(_value(update_headers)):
+            for reference in self.match(header, update_header):
+                notified.setdefault(reference, []).append(i)
+        return notified
+
+    def notifications(self, header, body):
+        """ Yield (consumer URI, NOTIFY body) for a PUBLISH message, to be
+        sent with PubSubBrokerHandler.notify().
+
+        @param body: the body of the PUBLISH message, an UpdateHeaderList
+                     followed by the lists of updated values
+        """
+        update_headers, update_lists = body[0], body[1:]
+        for (uri, subscription_id), indexes in self.publish(header, update_headers).items():
+            notify_body = [Identifier(subscription_id),
+                           UpdateHeaderList([_value(update_headers)[i] for i in indexes])]
+            for update_list in update_lists:
+                notify_body.append(type(update_list)([_value(update_list)[i] for i in indexes]))
+            yield uri, notify_body
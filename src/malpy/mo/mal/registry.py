@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Registry of the MAL types.
+
+Each generated module registers its element classes when it is imported,
+with the area, service and area version they belong to. The registry maps
+the absolute short forms (the 64 bits MAL type identifier) and the class
+names (as used by the XML and JSON encodings) to the classes, in constant
+time.
+
+Modules can also be declared without being imported: they are imported
+the first time a lookup misses, so that a process only pays for the
+services it uses.
+"""
+
+import importlib
+
+
+class _TypesByName(dict):
+    def __missing__(self, name):
+        if not load_modules():
+            raise KeyError(name)
+        return self[name]
+
+
+_TYPES_BY_ABSOLUTE_SHORT_FORM = {}
+_ABSOLUTE_SHORT_FORMS = {}
+_TYPES_BY_NAME = _TypesByName()
+_PENDING_MODULES = []
+
+MAL_AREA = 1
+MAL_VERSION = 1
+
+
+def absolute_short_form(area, service, version, shortForm):
+    """ Return the MAL absolute short form of a type. List types have a
+    negative shortForm, which is kept on 24 bits.
+    """
+    return (area << 48) | (service << 32) | (version << 24) | (shortForm & 0xFFFFFF)
+
+
+def register(area, service, version, types):
+    """ Register the element classes of a generated module.
+
+    @param area: the area number
+    @param service: the service number, 0 for the types of the area
+    @param version: the area version
+    @param types: the element classes. The ones without shortForm (abstract
+                  types) are only registered by name.
+    """
+    for objectClass in types:
+        # The first registered class wins in case of homonyms
+        _TYPES_BY_NAME.setdefault(objectClass.__name__, objectClass)
+        if objectClass.shortForm is None:
+            continue
+        key = absolute_short_form(area, service, version, objectClass.shortForm)
+        _ABSOLUTE_SHORT_FORMS[objectClass] = key
+        _TYPES_BY_ABSOLUTE_SHORT_FORM[key] = objectClass
+
+
+def declare_modules(module_names):
+    """ Declare modules registering types, to be imported on the first
+    lookup miss.
+    """
+    _PENDING_MODULES.extend(module_names)
+
+
+def load_modules():
+    """ Import the declared modules. Return False if there were none left. """
+    if not _PENDING_MODULES:
+        return False
+    while _PENDING_MODULES:
+        importlib.import_module(_PENDING_MODULES.pop(0))
+    return True
+
+
+def type_from_absolute_short_form(key):
+    try:
+        return _TYPES_BY_ABSOLUTE_SHORT_FORM[key]
+    except KeyError:
+        if load_modules():
+            return type_from_absolute_short_form(key)
+        raise RuntimeError("I don't know the short form {:#x}".format(key))
+
+
+def type_absolute_short_form(objectClass):
+    try:
+        return _ABSOLUTE_SHORT_FORMS[objectClass]
+    except KeyError:
+        raise ValueError("{} has no short form and cannot be encoded polymorphically.".format(objectClass.__name__))
+
+
+def type_from_name(name):
+    try:
+        return _TYPES_BY_NAME[name]
+    except KeyError:
+        raise RuntimeError("I don't know the type {}".format(name))
+
+
+def is_type_name(name):
+    return name in _TYPES_BY_NAME or (load_modules() and name in _TYPES_BY_NAME)
+
+
+def attribute_from_short_form(shortForm):
+    """ Return the MAL attribute class of a shortForm (1 to 18), as written
+    before the Attribute fields.
+    """
+    return type_from_absolute_short_form(absolute_short_form(MAL_AREA, 0, MAL_VERSION, shortForm))
+
+
+def types_by_name():
+    """ Return the {name: class} mapping of the registered types. Getting
+    an unknown name imports the declared modules.
+    """
+    return _TYPES_BY_NAME
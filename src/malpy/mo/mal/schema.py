@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Classes built from the field tables of the generated modules.
+
+A generated Composite only declares its shortForm and its _fields table,
+a generated ElementList only its shortForm: the constructors and the field
+accessors are shared by all the classes and read the tables. The type names
+of the tables are resolved on first use and cached, so that a module can
+refer to types defined after it, or in modules not imported yet.
+"""
+
+import sys
+
+_FIELD_TYPES = {}
+_LIST_ITEM_TYPES = {}
+
+
+class Field(object):
+    """ Accessor of the field of a Composite at a given index. """
+
+    __slots__ = ['index', 'name']
+
+    def __init__(self, index, name):
+        self.index = index
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        if instance._shared:
+            instance._unshare()
+        # The field may be modified by the caller, the copies of the
+        # composite cannot share it anymore
+        instance._exposed = True
+        return instance._internal_value[self.index]
+
+    def __set__(self, instance, value):
+        if instance._shared:
+            instance._unshare()
+        instance._set_field(self.index, value)
+        instance._isNull = False
+
+
+def declare_fields(objectClass):
+    """ Add the accessors of the fields that a Composite class appends to
+    the ones of its parent.
+    """
+    parentClass = objectClass.__bases__[0]
+    objectClass._fieldNumber = len(objectClass._fields)
+    for index in range(len(parentClass._fields), len(objectClass._fields)):
+        name = objectClass._fields[index][0]
+        setattr(objectClass, name, Field(index, name))
+
+
+def resolve_type(module_name, typename):
+    """ Resolve a type name as written by the generator (ex: 'mal.UShort'
+    or 'com.services.archive.ExpressionOperator') in the namespace of
+    the module that declared it.
+    """
+    components = typename.split('.')
+    objectClass = getattr(sys.modules[module_name], components[0])
+    for component in components[1:]:
+        objectClass = getattr(objectClass, component)
+    return objectClass
+
+
+def field_types(objectClass):
+    """ Return the list of (name, class, canBeNull) describing the fields
+    of a Composite class, parent fields first.
+    """
+    try:
+        return _FIELD_TYPES[objectClass]
+    except KeyError:
+        pass
+    if not objectClass._fields:
+        fields = []
+    else:
+        parentClass = objectClass.__bases__[0]
+        fields = list(field_types(parentClass))
+        for name, typename, canBeNull in objectClass._fields[len(parentClass._fields):]:
+            fields.append((name, resolve_type(objectClass.__module__, typename), canBeNull))
+    _FIELD_TYPES[objectClass] = fields
+    return fields
+
+
+def list_item_type(listClass):
+    """ Return the class of the items of an ElementList class. """
+    try:
+        return _LIST_ITEM_TYPES[listClass]
+    except KeyError:
+        itemClass = resolve_type(listClass.__module__, listClass.__name__[:-len('List')])
+        _LIST_ITEM_TYPES[listClass] = itemClass
+        return itemClass
@@ -89,283 +89,80 @@ class ActionCategoryEnum(IntEnum):
 class ActionCategory(mal.AbstractEnum):
     """Contains the default Action category values. It is implementation specific what the meaning of the values are in a particular context."""
 
+    __slots__ = []
     shortForm = MALShortForm.ACTIONCATEGORY
     value_type = ActionCategoryEnum
 
 
 class ActionCategoryList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ACTIONCATEGORY
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ActionCategory(v))
-
 
 class ActionDefinitionDetails(mal.Composite):
     """The ActionDefinitionDetails structure holds the definition information of an action."""
 
+    __slots__ = []
     shortForm = MALShortForm.ACTIONDEFINITIONDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 4
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*4
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.description = value[mal.Composite._fieldNumber + 0]
-            self.category = value[mal.Composite._fieldNumber + 1]
-            self.progressStepCount = value[mal.Composite._fieldNumber + 2]
-            self.arguments = value[mal.Composite._fieldNumber + 3]
-
-    @property
-    def description(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @description.setter
-    def description(self, description):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.String(description, canBeNull=False, attribName='description')
-        self._isNull = False
-
-    @property
-    def category(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @category.setter
-    def category(self, category):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.UOctet(category, canBeNull=False, attribName='category')
-        self._isNull = False
-
-    @property
-    def progressStepCount(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @progressStepCount.setter
-    def progressStepCount(self, progressStepCount):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mal.UShort(progressStepCount, canBeNull=False, attribName='progressStepCount')
-        self._isNull = False
-
-    @property
-    def arguments(self):
-        return self._internal_value[mal.Composite._fieldNumber + 3]
-
-    @arguments.setter
-    def arguments(self, arguments):
-        self._internal_value[mal.Composite._fieldNumber + 3] = mc.ArgumentDefinitionDetailsList(arguments, canBeNull=True, attribName='arguments')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('description', 'mal.String', False),
+        ('category', 'mal.UOctet', False),
+        ('progressStepCount', 'mal.UShort', False),
+        ('arguments', 'mc.ArgumentDefinitionDetailsList', True),
+    )
 
 
 class ActionDefinitionDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ACTIONDEFINITIONDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ActionDefinitionDetails(v))
-
 
 class ActionInstanceDetails(mal.Composite):
     """The ActionInstanceDetails structure holds the information required for an instance of an Action such as the argument values to use."""
 
+    __slots__ = []
     shortForm = MALShortForm.ACTIONINSTANCEDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 7
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*7
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.defInstId = value[mal.Composite._fieldNumber + 0]
-            self.stageStartedRequired = value[mal.Composite._fieldNumber + 1]
-            self.stageProgressRequired = value[mal.Composite._fieldNumber + 2]
-            self.stageCompletedRequired = value[mal.Composite._fieldNumber + 3]
-            self.argumentValues = value[mal.Composite._fieldNumber + 4]
-            self.argumentIds = value[mal.Composite._fieldNumber + 5]
-            self.isRawValue = value[mal.Composite._fieldNumber + 6]
-
-    @property
-    def defInstId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @defInstId.setter
-    def defInstId(self, defInstId):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Long(defInstId, canBeNull=False, attribName='defInstId')
-        self._isNull = False
-
-    @property
-    def stageStartedRequired(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @stageStartedRequired.setter
-    def stageStartedRequired(self, stageStartedRequired):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.Boolean(stageStartedRequired, canBeNull=False, attribName='stageStartedRequired')
-        self._isNull = False
-
-    @property
-    def stageProgressRequired(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @stageProgressRequired.setter
-    def stageProgressRequired(self, stageProgressRequired):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mal.Boolean(stageProgressRequired, canBeNull=False, attribName='stageProgressRequired')
-        self._isNull = False
-
-    @property
-    def stageCompletedRequired(self):
-        return self._internal_value[mal.Composite._fieldNumber + 3]
-
-    @stageCompletedRequired.setter
-    def stageCompletedRequired(self, stageCompletedRequired):
-        self._internal_value[mal.Composite._fieldNumber + 3] = mal.Boolean(stageCompletedRequired, canBeNull=False, attribName='stageCompletedRequired')
-        self._isNull = False
-
-    @property
-    def argumentValues(self):
-        return self._internal_value[mal.Composite._fieldNumber + 4]
-
-    @argumentValues.setter
-    def argumentValues(self, argumentValues):
-        self._internal_value[mal.Composite._fieldNumber + 4] = mc.AttributeValueList(argumentValues, canBeNull=True, attribName='argumentValues')
-        self._isNull = False
-
-    @property
-    def argumentIds(self):
-        return self._internal_value[mal.Composite._fieldNumber + 5]
-
-    @argumentIds.setter
-    def argumentIds(self, argumentIds):
-        self._internal_value[mal.Composite._fieldNumber + 5] = mal.IdentifierList(argumentIds, canBeNull=True, attribName='argumentIds')
-        self._isNull = False
-
-    @property
-    def isRawValue(self):
-        return self._internal_value[mal.Composite._fieldNumber + 6]
-
-    @isRawValue.setter
-    def isRawValue(self, isRawValue):
-        self._internal_value[mal.Composite._fieldNumber + 6] = mal.BooleanList(isRawValue, canBeNull=True, attribName='isRawValue')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('defInstId', 'mal.Long', False),
+        ('stageStartedRequired', 'mal.Boolean', False),
+        ('stageProgressRequired', 'mal.Boolean', False),
+        ('stageCompletedRequired', 'mal.Boolean', False),
+        ('argumentValues', 'mc.AttributeValueList', True),
+        ('argumentIds', 'mal.IdentifierList', True),
+        ('isRawValue', 'mal.BooleanList', True),
+    )
 
 
 class ActionInstanceDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ACTIONINSTANCEDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ActionInstanceDetails(v))
-
 
 class ActionCreationRequest(mal.Composite):
     """The ActionCreationRequest contains all the fields required when creating a new action in a provider."""
 
+    __slots__ = []
     shortForm = MALShortForm.ACTIONCREATIONREQUEST
-    _fieldNumber = mal.Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.name = value[mal.Composite._fieldNumber + 0]
-            self.actionDefDetails = value[mal.Composite._fieldNumber + 1]
-
-    @property
-    def name(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @name.setter
-    def name(self, name):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Identifier(name, canBeNull=False, attribName='name')
-        self._isNull = False
-
-    @property
-    def actionDefDetails(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @actionDefDetails.setter
-    def actionDefDetails(self, actionDefDetails):
-        self._internal_value[mal.Composite._fieldNumber + 1] = ActionDefinitionDetails(actionDefDetails, canBeNull=False, attribName='actionDefDetails')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('name', 'mal.Identifier', False),
+        ('actionDefDetails', 'ActionDefinitionDetails', False),
+    )
 
 
 class ActionCreationRequestList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ACTIONCREATIONREQUEST
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ActionCreationRequest(v))
+
+mal.registry.register(4, 1, 1, (
+    ActionCategory,
+    ActionCategoryList,
+    ActionDefinitionDetails,
+    ActionDefinitionDetailsList,
+    ActionInstanceDetails,
+    ActionInstanceDetailsList,
+    ActionCreationRequest,
+    ActionCreationRequestList,
+    ))
 
 
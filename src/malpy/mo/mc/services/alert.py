@@ -68,206 +68,60 @@ class MALShortForm(IntEnum):
 class AlertDefinitionDetails(mal.Composite):
     """The AlertDefinitionDetails provides the definition of an alert including any argument definitions."""
 
+    __slots__ = []
     shortForm = MALShortForm.ALERTDEFINITIONDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 4
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*4
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.description = value[mal.Composite._fieldNumber + 0]
-            self.severity = value[mal.Composite._fieldNumber + 1]
-            self.generationEnabled = value[mal.Composite._fieldNumber + 2]
-            self.arguments = value[mal.Composite._fieldNumber + 3]
-
-    @property
-    def description(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @description.setter
-    def description(self, description):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.String(description, canBeNull=False, attribName='description')
-        self._isNull = False
-
-    @property
-    def severity(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @severity.setter
-    def severity(self, severity):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mc.Severity(severity, canBeNull=False, attribName='severity')
-        self._isNull = False
-
-    @property
-    def generationEnabled(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @generationEnabled.setter
-    def generationEnabled(self, generationEnabled):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mal.Boolean(generationEnabled, canBeNull=False, attribName='generationEnabled')
-        self._isNull = False
-
-    @property
-    def arguments(self):
-        return self._internal_value[mal.Composite._fieldNumber + 3]
-
-    @arguments.setter
-    def arguments(self, arguments):
-        self._internal_value[mal.Composite._fieldNumber + 3] = mc.ArgumentDefinitionDetailsList(arguments, canBeNull=False, attribName='arguments')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('description', 'mal.String', False),
+        ('severity', 'mc.Severity', False),
+        ('generationEnabled', 'mal.Boolean', False),
+        ('arguments', 'mc.ArgumentDefinitionDetailsList', False),
+    )
 
 
 class AlertDefinitionDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ALERTDEFINITIONDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(AlertDefinitionDetails(v))
-
 
 class AlertEventDetails(mal.Composite):
     """The AlertEventDetails structure holds the details of an instance of an alert."""
 
+    __slots__ = []
     shortForm = MALShortForm.ALERTEVENTDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.argumentValues = value[mal.Composite._fieldNumber + 0]
-            self.argumentIds = value[mal.Composite._fieldNumber + 1]
-
-    @property
-    def argumentValues(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @argumentValues.setter
-    def argumentValues(self, argumentValues):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mc.AttributeValueList(argumentValues, canBeNull=True, attribName='argumentValues')
-        self._isNull = False
-
-    @property
-    def argumentIds(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @argumentIds.setter
-    def argumentIds(self, argumentIds):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.IdentifierList(argumentIds, canBeNull=True, attribName='argumentIds')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('argumentValues', 'mc.AttributeValueList', True),
+        ('argumentIds', 'mal.IdentifierList', True),
+    )
 
 
 class AlertEventDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ALERTEVENTDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(AlertEventDetails(v))
-
 
 class AlertCreationRequest(mal.Composite):
     """The AlertCreationRequest contains all the fields required when creating a new alert in a provider."""
 
+    __slots__ = []
     shortForm = MALShortForm.ALERTCREATIONREQUEST
-    _fieldNumber = mal.Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.name = value[mal.Composite._fieldNumber + 0]
-            self.alertDefDetails = value[mal.Composite._fieldNumber + 1]
-
-    @property
-    def name(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @name.setter
-    def name(self, name):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Identifier(name, canBeNull=False, attribName='name')
-        self._isNull = False
-
-    @property
-    def alertDefDetails(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @alertDefDetails.setter
-    def alertDefDetails(self, alertDefDetails):
-        self._internal_value[mal.Composite._fieldNumber + 1] = AlertDefinitionDetails(alertDefDetails, canBeNull=False, attribName='alertDefDetails')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('name', 'mal.Identifier', False),
+        ('alertDefDetails', 'AlertDefinitionDetails', False),
+    )
 
 
 class AlertCreationRequestList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.ALERTCREATIONREQUEST
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(AlertCreationRequest(v))
+
+mal.registry.register(4, 3, 1, (
+    AlertDefinitionDetails,
+    AlertDefinitionDetailsList,
+    AlertEventDetails,
+    AlertEventDetailsList,
+    AlertCreationRequest,
+    AlertCreationRequestList,
+    ))
 
 
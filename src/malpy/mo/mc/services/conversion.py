@@ -28,218 +28,73 @@ class MALShortForm(IntEnum):
 class DiscreteConversionDetails(mal.Composite):
     """The DiscreteConversionDetails structure holds a bidirectional conversion between raw and converted values. The first element of the pair is the raw value and the second is the converted value. Both sets of values must be unique."""
 
+    __slots__ = []
     shortForm = MALShortForm.DISCRETECONVERSIONDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 1
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*1
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.mapping = value[mal.Composite._fieldNumber + 0]
-
-    @property
-    def mapping(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @mapping.setter
-    def mapping(self, mapping):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.PairList(mapping, canBeNull=False, attribName='mapping')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('mapping', 'mal.PairList', False),
+    )
 
 
 class DiscreteConversionDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.DISCRETECONVERSIONDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(DiscreteConversionDetails(v))
-
 
 class LineConversionDetails(mal.Composite):
     """The LineConversionDetails structure is a bi-directional conversion between raw and converted values. It is defined by a series of points between which values are to be interpolated. The extrapolate attribute indicates if values can also be linearly extrapolated beyond the initial and final points."""
 
+    __slots__ = []
     shortForm = MALShortForm.LINECONVERSIONDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.extrapolate = value[mal.Composite._fieldNumber + 0]
-            self.points = value[mal.Composite._fieldNumber + 1]
-
-    @property
-    def extrapolate(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @extrapolate.setter
-    def extrapolate(self, extrapolate):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Boolean(extrapolate, canBeNull=False, attribName='extrapolate')
-        self._isNull = False
-
-    @property
-    def points(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @points.setter
-    def points(self, points):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.PairList(points, canBeNull=False, attribName='points')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('extrapolate', 'mal.Boolean', False),
+        ('points', 'mal.PairList', False),
+    )
 
 
 class LineConversionDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.LINECONVERSIONDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(LineConversionDetails(v))
-
 
 class PolyConversionDetails(mal.Composite):
     """The PolyConversionDetails structure holds only forward (raw to converted) polynomial conversions. They are defined by a series of points for the polynomial coefficients."""
 
+    __slots__ = []
     shortForm = MALShortForm.POLYCONVERSIONDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 1
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*1
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.points = value[mal.Composite._fieldNumber + 0]
-
-    @property
-    def points(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @points.setter
-    def points(self, points):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.PairList(points, canBeNull=False, attribName='points')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('points', 'mal.PairList', False),
+    )
 
 
 class PolyConversionDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.POLYCONVERSIONDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(PolyConversionDetails(v))
-
 
 class RangeConversionDetails(mal.Composite):
     """The RangeConversionDetails structure holds a range for a one-way conversion to convert between a continuous range to a discrete value. A range is defined as from this point up to, but not including, the next point."""
 
+    __slots__ = []
     shortForm = MALShortForm.RANGECONVERSIONDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 1
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*1
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.points = value[mal.Composite._fieldNumber + 0]
-
-    @property
-    def points(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @points.setter
-    def points(self, points):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.PairList(points, canBeNull=False, attribName='points')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('points', 'mal.PairList', False),
+    )
 
 
 class RangeConversionDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.RANGECONVERSIONDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(RangeConversionDetails(v))
+
+mal.registry.register(4, 7, 1, (
+    DiscreteConversionDetails,
+    DiscreteConversionDetailsList,
+    LineConversionDetails,
+    LineConversionDetailsList,
+    PolyConversionDetails,
+    PolyConversionDetailsList,
+    RangeConversionDetails,
+    RangeConversionDetailsList,
+    ))
 
 
@@ -115,498 +115,136 @@ class ValidityStateEnum(IntEnum):
 class ValidityState(mal.AbstractEnum):
     """Convenience enumeration that holds the validity states and their numeric values."""
 
+    __slots__ = []
     shortForm = MALShortForm.VALIDITYSTATE
     value_type = ValidityStateEnum
 
 
 class ValidityStateList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.VALIDITYSTATE
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ValidityState(v))
-
 
 class ParameterDefinitionDetails(mal.Composite):
     """The ParameterDefinitionDetails structure holds a parameter definition. The conversion field defines the conditions where the relevant conversion is applied. For onboard parameters, the report interval should be a multiple of the minimum sampling interval of that parameter."""
 
+    __slots__ = []
     shortForm = MALShortForm.PARAMETERDEFINITIONDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 7
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*7
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.description = value[mal.Composite._fieldNumber + 0]
-            self.rawType = value[mal.Composite._fieldNumber + 1]
-            self.rawUnit = value[mal.Composite._fieldNumber + 2]
-            self.generationEnabled = value[mal.Composite._fieldNumber + 3]
-            self.reportInterval = value[mal.Composite._fieldNumber + 4]
-            self.validityExpression = value[mal.Composite._fieldNumber + 5]
-            self.conversion = value[mal.Composite._fieldNumber + 6]
-
-    @property
-    def description(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @description.setter
-    def description(self, description):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.String(description, canBeNull=False, attribName='description')
-        self._isNull = False
-
-    @property
-    def rawType(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @rawType.setter
-    def rawType(self, rawType):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.Octet(rawType, canBeNull=False, attribName='rawType')
-        self._isNull = False
-
-    @property
-    def rawUnit(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @rawUnit.setter
-    def rawUnit(self, rawUnit):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mal.String(rawUnit, canBeNull=True, attribName='rawUnit')
-        self._isNull = False
-
-    @property
-    def generationEnabled(self):
-        return self._internal_value[mal.Composite._fieldNumber + 3]
-
-    @generationEnabled.setter
-    def generationEnabled(self, generationEnabled):
-        self._internal_value[mal.Composite._fieldNumber + 3] = mal.Boolean(generationEnabled, canBeNull=False, attribName='generationEnabled')
-        self._isNull = False
-
-    @property
-    def reportInterval(self):
-        return self._internal_value[mal.Composite._fieldNumber + 4]
-
-    @reportInterval.setter
-    def reportInterval(self, reportInterval):
-        self._internal_value[mal.Composite._fieldNumber + 4] = mal.Duration(reportInterval, canBeNull=False, attribName='reportInterval')
-        self._isNull = False
-
-    @property
-    def validityExpression(self):
-        return self._internal_value[mal.Composite._fieldNumber + 5]
-
-    @validityExpression.setter
-    def validityExpression(self, validityExpression):
-        self._internal_value[mal.Composite._fieldNumber + 5] = mc.ParameterExpression(validityExpression, canBeNull=True, attribName='validityExpression')
-        self._isNull = False
-
-    @property
-    def conversion(self):
-        return self._internal_value[mal.Composite._fieldNumber + 6]
-
-    @conversion.setter
-    def conversion(self, conversion):
-        self._internal_value[mal.Composite._fieldNumber + 6] = ParameterConversion(conversion, canBeNull=True, attribName='conversion')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('description', 'mal.String', False),
+        ('rawType', 'mal.Octet', False),
+        ('rawUnit', 'mal.String', True),
+        ('generationEnabled', 'mal.Boolean', False),
+        ('reportInterval', 'mal.Duration', False),
+        ('validityExpression', 'mc.ParameterExpression', True),
+        ('conversion', 'ParameterConversion', True),
+    )
 
 
 class ParameterDefinitionDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.PARAMETERDEFINITIONDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ParameterDefinitionDetails(v))
-
 
 class ParameterValue(mal.Composite):
     """This structure holds a specific value of the parameter. The type of the value shall match that specified in the parameter definition."""
 
+    __slots__ = []
     shortForm = MALShortForm.PARAMETERVALUE
-    _fieldNumber = mal.Composite._fieldNumber + 3
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*3
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.validityState = value[mal.Composite._fieldNumber + 0]
-            self.rawValue = value[mal.Composite._fieldNumber + 1]
-            self.convertedValue = value[mal.Composite._fieldNumber + 2]
-
-    @property
-    def validityState(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @validityState.setter
-    def validityState(self, validityState):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.UOctet(validityState, canBeNull=False, attribName='validityState')
-        self._isNull = False
-
-    @property
-    def rawValue(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @rawValue.setter
-    def rawValue(self, rawValue):
-        if rawValue is None:
-            self._internal_value[mal.Composite._fieldNumber + 1] = mal.Attribute(rawValue, canBeNull=True, attribName='rawValue')
-        else:
-            self._internal_value[mal.Composite._fieldNumber + 1] = type(rawValue)(rawValue, canBeNull=True, attribName='rawValue')
-        self._isNull = False
-
-    @property
-    def convertedValue(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @convertedValue.setter
-    def convertedValue(self, convertedValue):
-        if convertedValue is None:
-            self._internal_value[mal.Composite._fieldNumber + 2] = mal.Attribute(convertedValue, canBeNull=True, attribName='convertedValue')
-        else:
-            self._internal_value[mal.Composite._fieldNumber + 2] = type(convertedValue)(convertedValue, canBeNull=True, attribName='convertedValue')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('validityState', 'mal.UOctet', False),
+        ('rawValue', 'mal.Attribute', True),
+        ('convertedValue', 'mal.Attribute', True),
+    )
 
 
 class ParameterValueList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.PARAMETERVALUE
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ParameterValue(v))
-
 
 class ParameterConversion(mal.Composite):
     """The ParameterConversion structure holds information about the conversions to be applied to a parameter."""
 
+    __slots__ = []
     shortForm = MALShortForm.PARAMETERCONVERSION
-    _fieldNumber = mal.Composite._fieldNumber + 3
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*3
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.convertedType = value[mal.Composite._fieldNumber + 0]
-            self.convertedUnit = value[mal.Composite._fieldNumber + 1]
-            self.conditionalConversions = value[mal.Composite._fieldNumber + 2]
-
-    @property
-    def convertedType(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @convertedType.setter
-    def convertedType(self, convertedType):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Octet(convertedType, canBeNull=False, attribName='convertedType')
-        self._isNull = False
-
-    @property
-    def convertedUnit(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @convertedUnit.setter
-    def convertedUnit(self, convertedUnit):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.String(convertedUnit, canBeNull=True, attribName='convertedUnit')
-        self._isNull = False
-
-    @property
-    def conditionalConversions(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @conditionalConversions.setter
-    def conditionalConversions(self, conditionalConversions):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mc.ConditionalConversionList(conditionalConversions, canBeNull=False, attribName='conditionalConversions')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('convertedType', 'mal.Octet', False),
+        ('convertedUnit', 'mal.String', True),
+        ('conditionalConversions', 'mc.ConditionalConversionList', False),
+    )
 
 
 class ParameterConversionList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.PARAMETERCONVERSION
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ParameterConversion(v))
-
 
 class ParameterCreationRequest(mal.Composite):
     """The ParameterCreationRequest contains all the fields required when creating a new parameter in a provider."""
 
+    __slots__ = []
     shortForm = MALShortForm.PARAMETERCREATIONREQUEST
-    _fieldNumber = mal.Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.name = value[mal.Composite._fieldNumber + 0]
-            self.paramDefDetails = value[mal.Composite._fieldNumber + 1]
-
-    @property
-    def name(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @name.setter
-    def name(self, name):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Identifier(name, canBeNull=False, attribName='name')
-        self._isNull = False
-
-    @property
-    def paramDefDetails(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @paramDefDetails.setter
-    def paramDefDetails(self, paramDefDetails):
-        self._internal_value[mal.Composite._fieldNumber + 1] = ParameterDefinitionDetails(paramDefDetails, canBeNull=False, attribName='paramDefDetails')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('name', 'mal.Identifier', False),
+        ('paramDefDetails', 'ParameterDefinitionDetails', False),
+    )
 
 
 class ParameterCreationRequestList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.PARAMETERCREATIONREQUEST
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ParameterCreationRequest(v))
-
 
 class ParameterRawValue(mal.Composite):
     """The ParameterRawValue structure holds a new raw value for a specific parameter."""
 
+    __slots__ = []
     shortForm = MALShortForm.PARAMETERRAWVALUE
-    _fieldNumber = mal.Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.paramInstId = value[mal.Composite._fieldNumber + 0]
-            self.rawValue = value[mal.Composite._fieldNumber + 1]
-
-    @property
-    def paramInstId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @paramInstId.setter
-    def paramInstId(self, paramInstId):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Long(paramInstId, canBeNull=False, attribName='paramInstId')
-        self._isNull = False
-
-    @property
-    def rawValue(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @rawValue.setter
-    def rawValue(self, rawValue):
-        if rawValue is None:
-            self._internal_value[mal.Composite._fieldNumber + 1] = mal.Attribute(rawValue, canBeNull=True, attribName='rawValue')
-        else:
-            self._internal_value[mal.Composite._fieldNumber + 1] = type(rawValue)(rawValue, canBeNull=True, attribName='rawValue')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('paramInstId', 'mal.Long', False),
+        ('rawValue', 'mal.Attribute', True),
+    )
 
 
 class ParameterRawValueList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.PARAMETERRAWVALUE
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ParameterRawValue(v))
-
 
 class ParameterValueDetails(mal.Composite):
     """This structure holds a specific time stamped value of the parameter. The type of the value shall match that specified in the parameter definition."""
 
+    __slots__ = []
     shortForm = MALShortForm.PARAMETERVALUEDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 4
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*4
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.paramId = value[mal.Composite._fieldNumber + 0]
-            self.defId = value[mal.Composite._fieldNumber + 1]
-            self.timestamp = value[mal.Composite._fieldNumber + 2]
-            self.value = value[mal.Composite._fieldNumber + 3]
-
-    @property
-    def paramId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @paramId.setter
-    def paramId(self, paramId):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Long(paramId, canBeNull=False, attribName='paramId')
-        self._isNull = False
-
-    @property
-    def defId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @defId.setter
-    def defId(self, defId):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.Long(defId, canBeNull=False, attribName='defId')
-        self._isNull = False
-
-    @property
-    def timestamp(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @timestamp.setter
-    def timestamp(self, timestamp):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mal.Time(timestamp, canBeNull=False, attribName='timestamp')
-        self._isNull = False
-
-    @property
-    def value(self):
-        return self._internal_value[mal.Composite._fieldNumber + 3]
-
-    @value.setter
-    def value(self, value):
-        self._internal_value[mal.Composite._fieldNumber + 3] = ParameterValue(value, canBeNull=False, attribName='value')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('paramId', 'mal.Long', False),
+        ('defId', 'mal.Long', False),
+        ('timestamp', 'mal.Time', False),
+        ('value', 'ParameterValue', False),
+    )
 
 
 class ParameterValueDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.PARAMETERVALUEDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(ParameterValueDetails(v))
+
+mal.registry.register(4, 2, 1, (
+    ValidityState,
+    ValidityStateList,
+    ParameterDefinitionDetails,
+    ParameterDefinitionDetailsList,
+    ParameterValue,
+    ParameterValueList,
+    ParameterConversion,
+    ParameterConversionList,
+    ParameterCreationRequest,
+    ParameterCreationRequestList,
+    ParameterRawValue,
+    ParameterRawValueList,
+    ParameterValueDetails,
+    ParameterValueDetailsList,
+    ))
 
 
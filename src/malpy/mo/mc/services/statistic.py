@@ -123,495 +123,124 @@ class MALShortForm(IntEnum):
 class StatisticFunctionDetails(mal.Composite):
     """The StatisticFunctionDetails structure holds the details of the function."""
 
+    __slots__ = []
     shortForm = MALShortForm.STATISTICFUNCTIONDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.name = value[mal.Composite._fieldNumber + 0]
-            self.description = value[mal.Composite._fieldNumber + 1]
-
-    @property
-    def name(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @name.setter
-    def name(self, name):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Identifier(name, canBeNull=False, attribName='name')
-        self._isNull = False
-
-    @property
-    def description(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @description.setter
-    def description(self, description):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.String(description, canBeNull=False, attribName='description')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('name', 'mal.Identifier', False),
+        ('description', 'mal.String', False),
+    )
 
 
 class StatisticFunctionDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.STATISTICFUNCTIONDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(StatisticFunctionDetails(v))
-
 
 class StatisticLinkDetails(mal.Composite):
     """The StatisticLinkDetails structure holds the sampling, reporting, and collection intervals for one parameter statistic function link."""
 
+    __slots__ = []
     shortForm = MALShortForm.STATISTICLINKDETAILS
-    _fieldNumber = mal.Composite._fieldNumber + 6
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*6
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.samplingInterval = value[mal.Composite._fieldNumber + 0]
-            self.reportingInterval = value[mal.Composite._fieldNumber + 1]
-            self.collectionInterval = value[mal.Composite._fieldNumber + 2]
-            self.resetEveryCollection = value[mal.Composite._fieldNumber + 3]
-            self.reportingEnabled = value[mal.Composite._fieldNumber + 4]
-            self.useConverted = value[mal.Composite._fieldNumber + 5]
-
-    @property
-    def samplingInterval(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @samplingInterval.setter
-    def samplingInterval(self, samplingInterval):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Duration(samplingInterval, canBeNull=False, attribName='samplingInterval')
-        self._isNull = False
-
-    @property
-    def reportingInterval(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @reportingInterval.setter
-    def reportingInterval(self, reportingInterval):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.Duration(reportingInterval, canBeNull=False, attribName='reportingInterval')
-        self._isNull = False
-
-    @property
-    def collectionInterval(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @collectionInterval.setter
-    def collectionInterval(self, collectionInterval):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mal.Duration(collectionInterval, canBeNull=False, attribName='collectionInterval')
-        self._isNull = False
-
-    @property
-    def resetEveryCollection(self):
-        return self._internal_value[mal.Composite._fieldNumber + 3]
-
-    @resetEveryCollection.setter
-    def resetEveryCollection(self, resetEveryCollection):
-        self._internal_value[mal.Composite._fieldNumber + 3] = mal.Boolean(resetEveryCollection, canBeNull=False, attribName='resetEveryCollection')
-        self._isNull = False
-
-    @property
-    def reportingEnabled(self):
-        return self._internal_value[mal.Composite._fieldNumber + 4]
-
-    @reportingEnabled.setter
-    def reportingEnabled(self, reportingEnabled):
-        self._internal_value[mal.Composite._fieldNumber + 4] = mal.Boolean(reportingEnabled, canBeNull=False, attribName='reportingEnabled')
-        self._isNull = False
-
-    @property
-    def useConverted(self):
-        return self._internal_value[mal.Composite._fieldNumber + 5]
-
-    @useConverted.setter
-    def useConverted(self, useConverted):
-        self._internal_value[mal.Composite._fieldNumber + 5] = mal.Boolean(useConverted, canBeNull=False, attribName='useConverted')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('samplingInterval', 'mal.Duration', False),
+        ('reportingInterval', 'mal.Duration', False),
+        ('collectionInterval', 'mal.Duration', False),
+        ('resetEveryCollection', 'mal.Boolean', False),
+        ('reportingEnabled', 'mal.Boolean', False),
+        ('useConverted', 'mal.Boolean', False),
+    )
 
 
 class StatisticLinkDetailsList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.STATISTICLINKDETAILS
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(StatisticLinkDetails(v))
-
 
 class StatisticValue(mal.Composite):
     """The StatisticValue structure holds the statistical result for a parameter."""
 
+    __slots__ = []
     shortForm = MALShortForm.STATISTICVALUE
-    _fieldNumber = mal.Composite._fieldNumber + 6
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*6
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.paramDefInstId = value[mal.Composite._fieldNumber + 0]
-            self.startTime = value[mal.Composite._fieldNumber + 1]
-            self.endTime = value[mal.Composite._fieldNumber + 2]
-            self.valueTime = value[mal.Composite._fieldNumber + 3]
-            self.value = value[mal.Composite._fieldNumber + 4]
-            self.sampleCount = value[mal.Composite._fieldNumber + 5]
-
-    @property
-    def paramDefInstId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @paramDefInstId.setter
-    def paramDefInstId(self, paramDefInstId):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Long(paramDefInstId, canBeNull=False, attribName='paramDefInstId')
-        self._isNull = False
-
-    @property
-    def startTime(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @startTime.setter
-    def startTime(self, startTime):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.Time(startTime, canBeNull=True, attribName='startTime')
-        self._isNull = False
-
-    @property
-    def endTime(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @endTime.setter
-    def endTime(self, endTime):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mal.Time(endTime, canBeNull=True, attribName='endTime')
-        self._isNull = False
-
-    @property
-    def valueTime(self):
-        return self._internal_value[mal.Composite._fieldNumber + 3]
-
-    @valueTime.setter
-    def valueTime(self, valueTime):
-        self._internal_value[mal.Composite._fieldNumber + 3] = mal.Time(valueTime, canBeNull=True, attribName='valueTime')
-        self._isNull = False
-
-    @property
-    def value(self):
-        return self._internal_value[mal.Composite._fieldNumber + 4]
-
-    @value.setter
-    def value(self, value):
-        if value is None:
-            self._internal_value[mal.Composite._fieldNumber + 4] = mal.Attribute(value, canBeNull=True, attribName='value')
-        else:
-            self._internal_value[mal.Composite._fieldNumber + 4] = type(value)(value, canBeNull=True, attribName='value')
-        self._isNull = False
-
-    @property
-    def sampleCount(self):
-        return self._internal_value[mal.Composite._fieldNumber + 5]
-
-    @sampleCount.setter
-    def sampleCount(self, sampleCount):
-        self._internal_value[mal.Composite._fieldNumber + 5] = mal.UInteger(sampleCount, canBeNull=False, attribName='sampleCount')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('paramDefInstId', 'mal.Long', False),
+        ('startTime', 'mal.Time', True),
+        ('endTime', 'mal.Time', True),
+        ('valueTime', 'mal.Time', True),
+        ('value', 'mal.Attribute', True),
+        ('sampleCount', 'mal.UInteger', False),
+    )
 
 
 class StatisticValueList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.STATISTICVALUE
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(StatisticValue(v))
-
 
 class StatisticCreationRequest(mal.Composite):
     """The StatisticCreationRequest structure holds the link details for a specific parameter and function association."""
 
+    __slots__ = []
     shortForm = MALShortForm.STATISTICCREATIONREQUEST
-    _fieldNumber = mal.Composite._fieldNumber + 3
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*3
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.statFuncInstId = value[mal.Composite._fieldNumber + 0]
-            self.parameterId = value[mal.Composite._fieldNumber + 1]
-            self.linkDetails = value[mal.Composite._fieldNumber + 2]
-
-    @property
-    def statFuncInstId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @statFuncInstId.setter
-    def statFuncInstId(self, statFuncInstId):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Long(statFuncInstId, canBeNull=False, attribName='statFuncInstId')
-        self._isNull = False
-
-    @property
-    def parameterId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @parameterId.setter
-    def parameterId(self, parameterId):
-        self._internal_value[mal.Composite._fieldNumber + 1] = com.ObjectKey(parameterId, canBeNull=False, attribName='parameterId')
-        self._isNull = False
-
-    @property
-    def linkDetails(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @linkDetails.setter
-    def linkDetails(self, linkDetails):
-        self._internal_value[mal.Composite._fieldNumber + 2] = StatisticLinkDetails(linkDetails, canBeNull=False, attribName='linkDetails')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('statFuncInstId', 'mal.Long', False),
+        ('parameterId', 'com.ObjectKey', False),
+        ('linkDetails', 'StatisticLinkDetails', False),
+    )
 
 
 class StatisticCreationRequestList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.STATISTICCREATIONREQUEST
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(StatisticCreationRequest(v))
-
 
 class StatisticLinkSummary(mal.Composite):
     """The StatisticLinkSummary structure holds the ids of a specific statistic link and the function and parameter it links to."""
 
+    __slots__ = []
     shortForm = MALShortForm.STATISTICLINKSUMMARY
-    _fieldNumber = mal.Composite._fieldNumber + 5
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*5
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.funcId = value[mal.Composite._fieldNumber + 0]
-            self.linkId = value[mal.Composite._fieldNumber + 1]
-            self.linkDefId = value[mal.Composite._fieldNumber + 2]
-            self.reportingEnabled = value[mal.Composite._fieldNumber + 3]
-            self.parameterId = value[mal.Composite._fieldNumber + 4]
-
-    @property
-    def funcId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @funcId.setter
-    def funcId(self, funcId):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Long(funcId, canBeNull=False, attribName='funcId')
-        self._isNull = False
-
-    @property
-    def linkId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @linkId.setter
-    def linkId(self, linkId):
-        self._internal_value[mal.Composite._fieldNumber + 1] = mal.Long(linkId, canBeNull=False, attribName='linkId')
-        self._isNull = False
-
-    @property
-    def linkDefId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 2]
-
-    @linkDefId.setter
-    def linkDefId(self, linkDefId):
-        self._internal_value[mal.Composite._fieldNumber + 2] = mal.Long(linkDefId, canBeNull=False, attribName='linkDefId')
-        self._isNull = False
-
-    @property
-    def reportingEnabled(self):
-        return self._internal_value[mal.Composite._fieldNumber + 3]
-
-    @reportingEnabled.setter
-    def reportingEnabled(self, reportingEnabled):
-        self._internal_value[mal.Composite._fieldNumber + 3] = mal.Boolean(reportingEnabled, canBeNull=False, attribName='reportingEnabled')
-        self._isNull = False
-
-    @property
-    def parameterId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 4]
-
-    @parameterId.setter
-    def parameterId(self, parameterId):
-        self._internal_value[mal.Composite._fieldNumber + 4] = com.ObjectKey(parameterId, canBeNull=False, attribName='parameterId')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('funcId', 'mal.Long', False),
+        ('linkId', 'mal.Long', False),
+        ('linkDefId', 'mal.Long', False),
+        ('reportingEnabled', 'mal.Boolean', False),
+        ('parameterId', 'com.ObjectKey', False),
+    )
 
 
 class StatisticLinkSummaryList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.STATISTICLINKSUMMARY
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(StatisticLinkSummary(v))
-
 
 class StatisticEvaluationReport(mal.Composite):
     """The StatisticEvaluationReport structure holds the set of statistical results."""
 
+    __slots__ = []
     shortForm = MALShortForm.STATISTICEVALUATIONREPORT
-    _fieldNumber = mal.Composite._fieldNumber + 2
-
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value += [None]*2
-        if value is None and self._canBeNull:
-            self._isNull = True
-        elif type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            self.linkId = value[mal.Composite._fieldNumber + 0]
-            self.value = value[mal.Composite._fieldNumber + 1]
-
-    @property
-    def linkId(self):
-        return self._internal_value[mal.Composite._fieldNumber + 0]
-
-    @linkId.setter
-    def linkId(self, linkId):
-        self._internal_value[mal.Composite._fieldNumber + 0] = mal.Long(linkId, canBeNull=False, attribName='linkId')
-        self._isNull = False
-
-    @property
-    def value(self):
-        return self._internal_value[mal.Composite._fieldNumber + 1]
-
-    @value.setter
-    def value(self, value):
-        self._internal_value[mal.Composite._fieldNumber + 1] = StatisticValue(value, canBeNull=False, attribName='value')
-        self._isNull = False
+    _fields = mal.Composite._fields + (
+        ('linkId', 'mal.Long', False),
+        ('value', 'StatisticValue', False),
+    )
 
 
 class StatisticEvaluationReportList(mal.ElementList):
+    __slots__ = []
     shortForm = -MALShortForm.STATISTICEVALUATIONREPORT
 
-    def __init__(self, value=None, canBeNull=True, attribName=None):
-        super().__init__(value, canBeNull, attribName)
-        self._internal_value = []
-        if type(value) == type(self):
-            if value.internal_value is None:
-                if self._canBeNull:
-                    self._isNull = True
-                else:
-                    raise ValueError("This {} cannot be Null".format(type(self)))
-            else:
-                self._internal_value = value.copy().internal_value
-        else:
-            listvalue = value if type(value) == list else [value]
-            for v in listvalue:
-                 self._internal_value.append(StatisticEvaluationReport(v))
+
+mal.registry.register(4, 5, 1, (
+    StatisticFunctionDetails,
+    StatisticFunctionDetailsList,
+    StatisticLinkDetails,
+    StatisticLinkDetailsList,
+    StatisticValue,
+    StatisticValueList,
+    StatisticCreationRequest,
+    StatisticCreationRequestList,
+    StatisticLinkSummary,
+    StatisticLinkSummaryList,
+    StatisticEvaluationReport,
+    StatisticEvaluationReportList,
+    ))
 
 
@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Text formats of the MAL time values.
+
+The values are seconds since the epoch (floats), the texts are in UTC:
+    - YYYY-MM-DDThh:mm:ss.sss for Time and YYYY-MM-DDThh:mm:ss.sssssssss
+      for FineTime, as in MAL/XML
+    - YYYY-DDDThh:mm:ss.sss (day of the year) for the X-MAL-Timestamp
+      header of MAL/HTTP
+
+The values are first rounded to an integer number of milli- or nanoseconds,
+as in the binary encodings, and the texts are built with integer arithmetic.
+The date part only changes once a day and is cached in both directions.
+"""
+
+import functools
+
+SECONDS_PER_DAY = 86400
+MILLISECONDS = 3
+NANOSECONDS = 9
+
+
+def _days_from_civil(year, month, day):
+    """ Number of days since 1970-01-01 of a date of the proleptic
+    Gregorian calendar.
+    """
+    if month <= 2:
+        year -= 1
+        month += 9
+    else:
+        month -= 3
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * month + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _civil_from_days(days):
+    """ (year, month, day) of a number of days since 1970-01-01. """
+    days += 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * month + 2) // 5 + 1
+    if month < 10:
+        month += 3
+    else:
+        month -= 9
+    year = year_of_era + era * 400
+    if month <= 2:
+        year += 1
+    return year, month, day
+
+
+@functools.lru_cache(maxsize=64)
+def _calendar_date(days):
+    return "%04d-%02d-%02dT" % _civil_from_days(days)
+
+
+@functools.lru_cache(maxsize=64)
+def _ordinal_date(days):
+    year = _civil_from_days(days)[0]
+    return "%04d-%03dT" % (year, days - _days_from_civil(year, 1, 1) + 1)
+
+
+@functools.lru_cache(maxsize=64)
+def _days_from_calendar_date(date):
+    year, month, day = date.split('-')
+    return _days_from_civil(int(year), int(month), int(day))
+
+
+@functools.lru_cache(maxsize=64)
+def _days_from_ordinal_date(date):
+    year, day_of_year = date.split('-')
+    return _days_from_civil(int(year), 1, 1) + int(day_of_year) - 1
+
+
+def _format(value, digits, date_prefix):
+    scale = 10 ** digits
+    seconds, fraction = divmod(int(round(value * scale)), scale)
+    days, seconds = divmod(seconds, SECONDS_PER_DAY)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return "%s%02d:%02d:%02d.%0*d" % (date_prefix(days), hours, minutes, seconds, digits, fraction)
+
+
+def _parse(text, digits, days_from_date):
+    date, separator, clock = text.partition('T')
+    if not separator:
+        raise ValueError("Invalid MAL time '{}'".format(text))
+    if clock.endswith('Z'):
+        clock = clock[:-1]
+    clock, _, fraction = clock.partition('.')
+    hours, minutes, seconds = clock.split(':')
+    seconds = days_from_date(date) * SECONDS_PER_DAY + int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+    scale = 10 ** digits
+    # Extra digits are truncated, missing ones are zeroes
+    units = seconds * scale + int(fraction[:digits].ljust(digits, '0'))
+    return units / scale
+
+
+def format_time(value):
+    """ Format a Time value as YYYY-MM-DDThh:mm:ss.sss """
+    return _format(value, MILLISECONDS, _calendar_date)
+
+
+def parse_time(text):
+    """ Parse a YYYY-MM-DDThh:mm:ss.sss text to a Time value. """
+    return _parse(text, MILLISECONDS, _days_from_calendar_date)
+
+
+def format_finetime(value):
+    """ Format a FineTime value as YYYY-MM-DDThh:mm:ss.sssssssss """
+    return _format(value, NANOSECONDS, _calendar_date)
+
+
+def parse_finetime(text):
+    """ Parse a YYYY-MM-DDThh:mm:ss.sssssssss text to a FineTime value. """
+    return _parse(text, NANOSECONDS, _days_from_calendar_date)
+
+
+def format_ordinal_time(value):
+    """ Format a Time value as YYYY-DDDThh:mm:ss.sss """
+    return _format(value, MILLISECONDS, _ordinal_date)
+
+
+def parse_ordinal_time(text):
+    """ Parse a YYYY-DDDThh:mm:ss.sss text to a Time value. """
+    return _parse(text, MILLISECONDS, _days_from_ordinal_date)
@@ -31,3 +31,27 @@ class MALSocket(object):
         raise NotImplementedError("This is to be implemented.")
         message = b""
         return message
+
+
+class AsyncMALSocket(MALSocket):
+    """ MALSocket whose methods are coroutines, to be used with asyncio
+    and the Async* handlers.
+    """
+
+    async def bind(self, uri):
+        raise NotImplementedError("This is to be implemented.")
+
+    async def connect(self, uri):
+        raise NotImplementedError("This is to be implemented.")
+
+    async def unbind(self):
+        raise NotImplementedError("This is to be implemented.")
+
+    async def disconnect(self):
+        raise NotImplementedError("This is to be implemented.")
+
+    async def send(self, message):
+        raise NotImplementedError("This is to be implemented.")
+
+    async def recv(self):
+        raise NotImplementedError("This is to be implemented.")
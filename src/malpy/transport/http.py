@@ -3,25 +3,46 @@
 #
 # SPDX-License-Identifier: MIT
 
-import socket as pythonsocket
+import functools
+import queue
+import select
+import threading
 import time
-import pickle
 import http.client
+import http.server
 import urllib.parse
 import logging
 import json
 
 from email.header import Header, decode_header, make_header
 from io import BytesIO
+from malpy import timecodec
 from malpy.malpydefinitions import MALPY_ENCODING
 from malpy.mo import mal
-from struct import *  # pack() unpack()
-
 
 from .abstract_transport import MALSocket
+from .multiplexing import sent_transaction_key, received_transaction_key
 
 VERSION_NUMBER = 1  # Version number of the transport
 
+CONTENT_TYPES = {
+    MALPY_ENCODING.XML: "application/mal-xml",
+    MALPY_ENCODING.JSON: "application/mal-json"
+}
+
+
+def _content_type(encoding):
+    try:
+        return CONTENT_TYPES[encoding]
+    except KeyError:
+        raise NotImplementedError("Only the XML and JSON Encodings are implemented with the HTTP Transport.")
+
+
+def _check_content_type(encoding, headers):
+    expected = CONTENT_TYPES.get(encoding)
+    if expected is not None and headers['Content-Type'] != expected:
+        raise RuntimeError("Unexpected encoding. Expected '{}', got '{}'".format(expected, headers['Content-Type']))
+
 def _encode_uri(uri):
     return '{}:{}'.format(uri[0], uri[1])
 
@@ -56,22 +77,16 @@ def _split_uri(uri):
     if len(splitted_rest_uri) > 1:
         path = splitted_rest_uri[1]
 
-    logger.debug('urlparsed {} host {} port {} path {}'.format(uri, host, port, path))
+    logger.debug('urlparsed %s host %s port %s path %s', uri, host, port, path)
 
     return (host,port,path)
 
 
-def _encode_time(t):
-    s = time.strftime("%Y-%jT%H:%M:%S", time.localtime(t))
-    # Time is in seconds.
-    # We retrieve the decimal part only
-    # 0.xxxxx and from that 1 -> 4 chars => .xxx
-    s += ("%.9f" % (t % 1,))[1:5]
-    return s
-
-
-def _decode_time(s):
-    return time.mktime(time.strptime(s[:-4], "%Y-%jT%H:%M:%S")) + float(s[-4:])
+def _uri_scheme(uri):
+    # Plain HTTP only for the http URIs, HTTPS for the other ones
+    if uri.split(':', 1)[0].lower() == 'http':
+        return 'http'
+    return 'https'
 
 
 def _encode_qos_level(qos_level):
@@ -144,368 +159,647 @@ def _decode_ascii(s):
     return str(make_header(decode_header(s)))
 
 
+class HTTPConnectionPool(object):
+    """ Keep-alive HTTP connections shared by the HTTPSockets of the
+    process, by (host, port, TLS context, scheme).
+
+    A connection is checked out for one HTTP exchange, and checked in once
+    its response is read. At most maxsize idle connections are kept per
+    destination, and they are closed after idle_timeout seconds. An idle
+    connection closed by the server is detected before being reused.
+    """
+
+    def __init__(self, maxsize=4, idle_timeout=30.):
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self._idle = {}  # key -> [(connection, checkin time)], last in first out
+        self._lock = threading.Lock()
+
+    def checkout(self, host, port, context=None, scheme='https'):
+        """ Return an idle connection to (host, port), or a new one. """
+        key = (host, port, context, scheme)
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                connections = self._idle.get(key)
+                if not connections:
+                    break
+                connection, checkin_time = connections.pop()
+            if now - checkin_time < self.idle_timeout and self._is_alive(connection):
+                return connection
+            connection.close()
+        if scheme == 'http':
+            return http.client.HTTPConnection(_encode_uri((host, port)))
+        return http.client.HTTPSConnection(_encode_uri((host, port)), context=context)
+
+    def checkin(self, connection, host, port, context=None, scheme='https'):
+        """ Give back a connection whose last response was entirely read. """
+        if connection.sock is None:
+            # Closed, ex: 'Connection: close' from the server
+            return
+        key = (host, port, context, scheme)
+        now = time.monotonic()
+        with self._lock:
+            connections = self._idle.setdefault(key, [])
+            expired = [c for c, t in connections if now - t >= self.idle_timeout]
+            connections[:] = [(c, t) for c, t in connections if now - t < self.idle_timeout]
+            if len(connections) < self.maxsize:
+                connections.append((connection, now))
+            else:
+                expired.append(connection)
+        for c in expired:
+            c.close()
+
+    def clear(self):
+        """ Close all the idle connections. """
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection, _ in connections:
+                connection.close()
+
+    @staticmethod
+    def _is_alive(connection):
+        # An idle keep-alive connection has nothing to read: if the socket
+        # is readable, the server closed it (or sent garbage)
+        sock = connection.sock
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+
+connection_pool = HTTPConnectionPool()
+
+
+class _SharedReader(object):
+    """ Buffered reader of a pipelined connection, given to each
+    HTTPResponse in place of the socket. The responses must not close it.
+    """
+
+    def __init__(self, fp):
+        self.fp = fp
+
+    def makefile(self, mode):
+        return self
+
+    def readline(self, limit=-1):
+        return self.fp.readline(limit)
+
+    def read(self, amt=None):
+        return self.fp.read(amt)
+
+    def readinto(self, b):
+        return self.fp.readinto(b)
+
+    def close(self):
+        pass
+
+
+class _HTTPStream(object):
+    """ Pipelined POST requests on a connection of connection_pool.
+
+    The requests are written without waiting for their responses, which
+    are read once more than window of them are pending, and by close().
+    The throughput is then bounded by the bandwidth instead of the round
+    trip time, but the errors are reported late.
+    """
+
+    def __init__(self, key, window):
+        self.key = key
+        self.window = window
+        self.pending = 0
+        self.connection = connection_pool.checkout(*key)
+        if self.connection.sock is None:
+            self.connection.connect()
+        self.reader = _SharedReader(self.connection.sock.makefile('rb'))
+        self.host = _encode_uri(key[:2])
+
+    def send(self, target, headers, body):
+        lines = ['POST {} HTTP/1.1'.format(target), 'Host: {}'.format(self.host)]
+        lines += ['{}: {}'.format(key, value) for key, value in headers.items()]
+        request = '\r\n'.join(lines).encode('latin-1') + b'\r\n\r\n' + bytes(body)
+        try:
+            self.connection.sock.sendall(request)
+        except OSError:
+            self.connection.close()
+            raise
+        self.pending += 1
+        while self.pending > self.window:
+            self._read_response()
+
+    def close(self):
+        """ Read the pending responses and give the connection back. """
+        while self.pending:
+            self._read_response()
+        connection_pool.checkin(self.connection, *self.key)
+
+    def _read_response(self):
+        response = http.client.HTTPResponse(self.reader, method='POST')
+        try:
+            response.begin()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            self.connection.close()
+            raise
+        self.pending -= 1
+        if response.status != 200:
+            self.connection.close()
+            raise RuntimeError("Got en error: {} - {}".format(response.status, response.reason))
+        if response.will_close and self.pending:
+            self.connection.close()
+            raise RuntimeError("The server closed the connection with {} pipelined requests pending.".format(self.pending))
+
+
 class Status:
     def __init__(self, code, message=""):
         self.code = code
         self.message = message
 
 
-#TODO: check if http uses \r\n \n or anything x...
+# Messages answered by the MAL message of the next stage in their HTTP
+# response. The other ones get an empty HTTP response, the messages of the
+# next stages being sent as new HTTP requests.
+_REPLIED_STAGES = {
+    (mal.InteractionTypeEnum.SUBMIT, mal.MAL_IP_STAGES.SUBMIT),
+    (mal.InteractionTypeEnum.REQUEST, mal.MAL_IP_STAGES.REQUEST),
+    (mal.InteractionTypeEnum.INVOKE, mal.MAL_IP_STAGES.INVOKE),
+    (mal.InteractionTypeEnum.PROGRESS, mal.MAL_IP_STAGES.PROGRESS),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_REGISTER),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_PUBLISH_REGISTER),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_DEREGISTER),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_PUBLISH_DEREGISTER),
+    }
 
-class HTTPSocket(MALSocket):
-    _messagesize = 1024
-    struct_format = '!I'
 
-    def __init__(self, socket=None, CONTEXT=None,  private=False, private_host=None, private_port=None):
-        self._private = private
-        self.CONTEXT=CONTEXT
-        if private and socket is None:
-            self.socket = pythonsocket.socket(pythonsocket.AF_INET,
-                                              pythonsocket.SOCK_STREAM)
-        else:
-            self.socket = socket
-        self._lastCommandIsSend = False
-        self.client = None
-        self.private_host=private_host
-        self.private_port=private_port
+_REPLIED_HTTP_STAGES = {(ip_type.name, str(ip_stage)) for ip_type, ip_stage in _REPLIED_STAGES}
+
+
+def _is_replied(headers):
+    return (headers['X-MAL-Interaction-Type'], headers['X-MAL-Interaction-Stage']) in _REPLIED_HTTP_STAGES
+
+
+# The X-MAL-* headers which are the same for all the messages of a
+# transaction: they are translated once, and cached by their values.
+# Only the stage, the timestamp and the transaction id are translated for
+# each message.
+_CONSTANT_HTTP_FIELDS = (
+    'x-mal-version-number', 'x-mal-authentication-id', 'x-mal-uri-from',
+    'x-mal-uri-to', 'x-mal-qoslevel', 'x-mal-priority', 'x-mal-domain',
+    'x-mal-network-zone', 'x-mal-session', 'x-mal-session-name',
+    'x-mal-interaction-type', 'x-mal-service-area', 'x-mal-service',
+    'x-mal-operation', 'x-mal-area-version', 'x-mal-is-error-message')
+
+
+@functools.lru_cache(maxsize=256)
+def _constant_mal_header(values):
+    """ Return the MALHeader of the values of _CONSTANT_HTTP_FIELDS. It is
+    shared, and must be copied.
+    """
+    (version_number, auth_id, uri_from, uri_to, qos_level, priority, domain,
+     network_zone, session, session_name, ip_type, area, service, operation,
+     area_version, is_error_message) = values
+
+    if int(version_number) != VERSION_NUMBER:
+        raise RuntimeError("The incoming version number was {}, expected was {}".format(version_number, VERSION_NUMBER))
+
+    malheader = mal.MALHeader()
+    malheader.auth_id = b''.fromhex(auth_id)
+    malheader.uri_from = uri_from
+    malheader.uri_to = uri_to
+    malheader.qos_level = _decode_qos_level(qos_level)
+    malheader.priority = int(priority)
+    malheader.domain = _decode_ascii(domain).split('.')
+    malheader.network_zone = _decode_ascii(network_zone)
+    malheader.session = _decode_session(session)
+    malheader.session_name = _decode_ascii(session_name)
+    malheader.ip_type = _decode_enum(ip_type, mal.InteractionTypeEnum)
+    malheader.area = int(area)
+    malheader.service = int(service)
+    malheader.operation = int(operation)
+    malheader.area_version = int(area_version)
+    malheader.is_error_message = (is_error_message == "True")
+    return malheader
+
+
+def _header_http_to_mal(headers):
+    # One pass instead of a case insensitive search per header
+    fields = {key.lower(): value for key, value in headers.items()}
+    malheader = _constant_mal_header(tuple([fields[name] for name in _CONSTANT_HTTP_FIELDS])).copy()
+    malheader.domain = list(malheader.domain)
+    malheader.timestamp = timecodec.parse_ordinal_time(fields['x-mal-timestamp'])
+    malheader.ip_stage = int(fields['x-mal-interaction-stage'])
+    malheader.transaction_id = int(fields['x-mal-transaction-id'])
+    return malheader
+
+
+@functools.lru_cache(maxsize=256)
+def _constant_http_headers(auth_id, uri_from, uri_to, qos_level, priority, domain,
+                           network_zone, session, session_name, ip_type, area,
+                           service, operation, area_version, is_error_message):
+    """ Return the X-MAL-* headers of the MAL header fields which are the
+    same for all the messages of a transaction. The dict is shared, and must
+    be copied.
+    """
+    return {
+        "X-MAL-Authentication-Id": auth_id.hex(),
+        "X-MAL-URI-From": uri_from,
+        "X-MAL-URI-To": uri_to,
+        "X-MAL-QoSlevel": qos_level.name,
+        "X-MAL-Priority": str(priority),
+        "X-MAL-Domain": ".".join([ _encode_ascii(x) for x in domain ]),
+        "X-MAL-Network-Zone": _encode_ascii(network_zone),
+        "X-MAL-Session": session.name,
+        "X-MAL-Session-Name": _encode_ascii(session_name),
+        "X-MAL-Interaction-Type": ip_type.name,
+        "X-MAL-Service-Area": str(area),
+        "X-MAL-Service": str(service),
+        "X-MAL-Operation": str(operation),
+        "X-MAL-Area-Version": str(area_version),
+        "X-MAL-Is-Error-Message": "True" if is_error_message else "False",
+        "X-MAL-Version-Number": str(VERSION_NUMBER)
+    }
 
-    def bind(self, uri):
-        """ @param uri: (host, port) """
-        self.socket.bind(uri)
 
-    def listen(self, unacceptedconnectnb=0):
-        self.socket.listen(unacceptedconnectnb)
+def _header_mal_to_http(message):
+    header = message.header
+    headers = _constant_http_headers(
+        header.auth_id, header.uri_from, header.uri_to, header.qos_level,
+        header.priority, tuple(header.domain), header.network_zone,
+        header.session, header.session_name, header.ip_type, header.area,
+        header.service, header.operation, header.area_version,
+        header.is_error_message).copy()
+    headers["Content-Length"] = len(message.msg_parts)
+    headers["X-MAL-Timestamp"] = timecodec.format_ordinal_time(header.timestamp)
+    headers["X-MAL-Interaction-Stage"] = str(header.ip_stage)
+    headers["X-MAL-Transaction-Id"] = str(header.transaction_id)
+    return headers
 
-    def waitforconnection(self):
-        logger = logging.getLogger(__name__)
-        conn, addr = self.socket.accept()
-        logger.debug('Header {} body {}'.format(conn, addr))
-        return HTTPSocket(conn, private=self._private, CONTEXT=self.CONTEXT)
+
+class HTTPSocket(MALSocket):
+    """ Client side of the MAL/HTTP binding.
+
+    Each message is POSTed to the URI of its destination, and the message
+    of the next stage is read from the HTTP response when the stage has
+    one (see _REPLIED_STAGES). The messages that the peer sends later as
+    new HTTP requests (ex: INVOKE_RESPONSE, PUBSUB_NOTIFY) are received
+    through the HTTPServerSocket given as server.
+
+    In streaming mode, the messages without MAL reply (ex: PROGRESS_UPDATE,
+    PUBSUB_NOTIFY) are pipelined: up to window of them are sent before their
+    HTTP responses are read. flush() waits for all the responses, and
+    raises the errors they report.
+    """
+
+    def __init__(self, socket=None, CONTEXT=None, server=None, streaming=False, window=64):
+        self.CONTEXT=CONTEXT
+        self.socket = socket
+        self.server = server
+        self.streaming = streaming
+        self.window = window
+        self._stream = None
+        # Connection of the pending HTTP exchange, borrowed from connection_pool
+        self.client = None
+        self._client_key = None
+        self._uri = None
+        # (HTTP headers, MALMessage) routed by the server
+        self.messages = queue.Queue()
 
     def connect(self, uri):
         """ @param uri: (host, port) """
         self._uri=uri
-		
-    def unbind(self):
-        self.socket.close()
 
     def disconnect(self):
-        self.socket.close()
+        self.flush()
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+        if self.server is not None:
+            self.server.unregister(self)
+        if self.socket is not None:
+            self.socket.close()
+
+    def flush(self):
+        """ Wait for the HTTP responses of the streamed messages. """
+        if self._stream is not None:
+            stream, self._stream = self._stream, None
+            stream.close()
 
     def send(self, message):
         logger = logging.getLogger(__name__)
-        logger.debug("[**] private '{}' LastCommandIsSend {}".format(self._private, self._lastCommandIsSend))
-
-        headers = self._header_mal_to_http(message)
 
-        if self.encoding == MALPY_ENCODING.XML:
-            headers['Content-Type'] = "application/mal-xml"
-        else:
-            headers['Content-Type'] = "application/mal"
-            raise NotImplementedError("Only the XML Encoding is implemented with the HTTP Transport.")
+        headers = _header_mal_to_http(message)
+        headers['Content-Type'] = _content_type(self.encoding)
         body = message.msg_parts
 
-        logger.info("headers : {}\nbody : {}".format(json.dumps(headers,indent=4),body.decode('utf-8')))
+        # The formatting of the message costs more than its translation
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("headers : {}\nbody : {}".format(json.dumps(headers,indent=4),body.decode('utf-8')))
 
-        # For deregister stage, request is not private
-        if headers['X-MAL-Interaction-Stage'] ==  str(mal.MAL_IP_STAGES.PUBSUB_DEREGISTER):
-           self._private = False
-
-        if self._private is False :
-            self._send_http_request(target=message.header.uri_to, body=body, headers=headers)
+        if self.server is not None:
+            self.server.register(self, sent_transaction_key(message.header))
+        if self.streaming and not _is_replied(headers):
+            self._stream_http_request(target=message.header.uri_to, body=body, headers=headers)
         else:
-            self._send_pickle_response(headers, body)
-
-
-        if self._private is False and self._lastCommandIsSend is False:
-            self._private = True
-
-        if self._private is True and self._lastCommandIsSend is False:
-            self._private = False
-
-        self._lastCommandIsSend = True
-        logger.debug("[**] private '{}' LastCommandIsSend {}".format(self._private, self._lastCommandIsSend))
-
+            self._send_http_request(target=message.header.uri_to, body=body, headers=headers)
 
     def recv(self):
         logger = logging.getLogger(__name__)
 
-        logger.debug("[**] private '{}' LastCommandIsSend {}".format(self._private, self._lastCommandIsSend))
-
-        if self._private is True:
-            headers, body = self._receive_pickle_request()
-            logger.info("headers : {}\nbody : {}".format(headers,body.decode('utf-8')))
+        if self.client is not None:
+            headers, body = self._receive_http_response()
+            logger.info("headers : %s\nbody : %s", headers, body)
+            message = mal.MALMessage(header=_header_http_to_mal(headers), msg_parts=body)
+        elif self.server is not None:
+            headers, message = self.messages.get()
         else:
-            headers, body=self._receive_http_response()
-            logger.info("headers : {}\nbody : {}".format(headers,body))
-#        logger.info("headers : {}\nbody : {}".format(json.dumps(headers,indent=4),body.decode('utf-8')))
-
-        malheader = self._header_http_to_mal(headers)
-
-        if self.encoding == MALPY_ENCODING.XML and headers['Content-Type'] != "application/mal-xml":
-            raise RuntimeError("Unexpected encoding. Expected 'application/mal-xml', got '{}'".format(headers['Content-Type']))
+            raise RuntimeError("No HTTP response is expected. The messages sent as new HTTP requests are received through an HTTPServerSocket.")
 
-        if self._private is False and \
-           self._lastCommandIsSend is True and \
-           (headers['X-MAL-Interaction-Stage'] != str(mal.MAL_IP_STAGES.PUBSUB_PUBLISH_REGISTER_ACK) and headers['X-MAL-Interaction-Stage'] != str(mal.MAL_IP_STAGES.PUBSUB_PUBLISH_DEREGISTER_ACK)):
-            self._private = True
+        _check_content_type(self.encoding, headers)
 
-        self._lastCommandIsSend = False
-        logger.debug("[**] private '{}' LastCommandIsSend {}".format(self._private, self._lastCommandIsSend))
-     
-
-        return mal.MALMessage(header=malheader, msg_parts=body)
+        return message
 
     @property
     def uri(self):
         return (self._uri)
 
-    def _header_http_to_mal(self, headers):
-
-        if int(headers['X-MAL-Version-Number']) != VERSION_NUMBER:
-            raise RuntimeError("The incoming version number was {}, expected was {}".format(headers['X-MAL-Version-Number'], VERSION_NUMBER))
-
-        malheader = mal.MALHeader()
-        malheader.auth_id = b''.fromhex(headers['X-MAL-Authentication-Id'])
-        malheader.uri_from = headers['X-MAL-URI-From']
-        malheader.uri_to = headers['X-MAL-URI-To']
-        malheader.timestamp = _decode_time(headers['X-MAL-Timestamp'])
-        malheader.qos_level = _decode_qos_level(headers['X-MAL-QoSlevel'])
-        malheader.priority = int(headers['X-MAL-Priority'])
-        malheader.domain = _decode_ascii(headers['X-MAL-Domain']).split('.')
-        malheader.network_zone = _decode_ascii(headers['X-MAL-Network-Zone'])
-        malheader.session = _decode_session(headers['X-MAL-Session'])
-        malheader.session_name = _decode_ascii(headers['X-MAL-Session-Name'])
-        malheader.ip_type = _decode_enum(headers['X-MAL-Interaction-Type'], mal.InteractionTypeEnum)
-        malheader.ip_stage = int(headers['X-MAL-Interaction-Stage'])
-        malheader.transaction_id = int(headers['X-MAL-Transaction-Id'])
-        malheader.area = int(headers['X-MAL-Service-Area'])
-        malheader.service = int(headers['X-MAL-Service'])
-        malheader.operation = int(headers['X-MAL-Operation'])
-        malheader.area_version = int(headers['X-MAL-Area-Version'])
-        malheader.is_error_message = (headers["X-MAL-Is-Error-Message"] == "True")
-
-        return malheader
-
-    def _header_mal_to_http(self, message):
-
-        headers = {
-            "Content-Length": len(message),
-            "X-MAL-Authentication-Id": message.header.auth_id.hex(),
-            "X-MAL-URI-From": message.header.uri_from,
-            "X-MAL-URI-To": message.header.uri_to,
-            "X-MAL-Timestamp": _encode_time(message.header.timestamp),
-            "X-MAL-QoSlevel": message.header.qos_level.name,
-            "X-MAL-Priority": str(message.header.priority),
-            "X-MAL-Domain": ".".join([ _encode_ascii(x) for x in message.header.domain ]),
-            "X-MAL-Network-Zone": _encode_ascii(message.header.network_zone),
-            "X-MAL-Session": message.header.session.name,
-            "X-MAL-Session-Name": _encode_ascii(message.header.session_name),
-            "X-MAL-Interaction-Type": message.header.ip_type.name,
-            "X-MAL-Interaction-Stage": str(message.header.ip_stage),
-            "X-MAL-Transaction-Id": str(message.header.transaction_id),
-            "X-MAL-Service-Area": str(message.header.area),
-            "X-MAL-Service": str(message.header.service),
-            "X-MAL-Operation": str(message.header.operation),
-            "X-MAL-Area-Version": str(message.header.area_version),
-            "X-MAL-Is-Error-Message": "True" if message.header.is_error_message else "False",
-            "X-MAL-Version-Number": str(VERSION_NUMBER)
-        }
-
-        return headers
-
-
     def _send_http_request(self, target, headers, body):
         logger = logging.getLogger(__name__)
 
-	#modif httpsconnection request method header body en sendpostrequest
-        #logger.debug('Target [{}] Header {} body {}'.format(target, headers, body.decode('utf-8')))
-
         host,port,path = _split_uri(target)
-        # If client doesn't exist
-        if not self.client:
-             logger.debug('Create Client')
-             self.client = http.client.HTTPSConnection(_encode_uri((host,port)), context=self.CONTEXT)
-             self.client.set_debuglevel(0)
-        
-        #try:
-        logger.debug('Send POST \nrequest url : {} \nheaders : {} \nbody : {}'.format(target, json.dumps(headers,indent=4), body.decode('utf-8)')))
-        self.client.request('POST', url=target, body=body, headers=headers)
-        #except Exception as e:
-        #    logger.warning("Exception {} URL {}".format(e, target))
-
-        # Dans certains cas, il faut faire un getreponse()
-        if ( headers['X-MAL-Interaction-Type'] == _encode_ip_type(mal.InteractionTypeEnum.SEND) ) or \
-           ( headers['X-MAL-Interaction-Type'] == _encode_ip_type(mal.InteractionTypeEnum.INVOKE) and \
-               headers['X-MAL-Interaction-Stage'] == str(mal.MAL_IP_STAGES.INVOKE_RESPONSE))  or  \
-           ( headers['X-MAL-Interaction-Type'] == _encode_ip_type(mal.InteractionTypeEnum.PROGRESS) and \
-               ( (headers['X-MAL-Interaction-Stage'] == str(mal.MAL_IP_STAGES.PROGRESS_RESPONSE) ) or (headers['X-MAL-Interaction-Stage'] == str(mal.MAL_IP_STAGES.PROGRESS_UPDATE)))) or \
-           ( headers['X-MAL-Interaction-Type'] == _encode_ip_type(mal.InteractionTypeEnum.PUBSUB) and \
-               headers['X-MAL-Interaction-Stage'] == str(mal.MAL_IP_STAGES.PUBSUB_PUBLISH)  ):
-            logger.debug('Interaction Type {} Stage {} -> getresponse()'.format(headers['X-MAL-Interaction-Type'], headers['X-MAL-Interaction-Stage']))
+        key = (host, port, self.CONTEXT, _uri_scheme(target))
+        if self.client is not None and self._client_key != key:
+            # Another destination: the pending exchange is abandoned
+            self.client.close()
+            self.client = None
+        if self.client is None:
+            self.client = connection_pool.checkout(*key)
+            self._client_key = key
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Send POST \nrequest url : {} \nheaders : {} \nbody : {}'.format(target, json.dumps(headers,indent=4), body.decode('utf-8')))
+        reused = self.client.sock is not None
+        try:
+            self.client.request('POST', url=target, body=body, headers=headers)
+        except OSError:
+            if not reused:
+                raise
+            # The server closed the kept-alive connection in the meantime
+            logger.debug('Reconnect to %s:%s', host, port)
+            self.client.close()
+            self.client.request('POST', url=target, body=body, headers=headers)
+
+        # Without MAL message in the response, it is read right away
+        if not _is_replied(headers):
+            logger.debug('Interaction Type %s Stage %s -> getresponse()', headers['X-MAL-Interaction-Type'], headers['X-MAL-Interaction-Stage'])
             response=self.client.getresponse()
+            response.read()
+            self._release_client()
+            if response.status != 200:
+                raise RuntimeError("Got en error: {} - {}".format(response.status, response.reason))
 
+    def _stream_http_request(self, target, headers, body):
+        host,port,path = _split_uri(target)
+        key = (host, port, self.CONTEXT, _uri_scheme(target))
+        if self._stream is not None and self._stream.key != key:
+            self.flush()
+        if self._stream is None:
+            self._stream = _HTTPStream(key, self.window)
+        self._stream.send(target, headers, body)
+
+    def _release_client(self):
+        # The response is read, the connection can serve other exchanges
+        connection_pool.checkin(self.client, *self._client_key)
+        self.client = None
 
     def _receive_http_response(self):
         response=self.client.getresponse()
         headers=response.headers
         body=response.read().decode('utf-8')
+        self._release_client()
         if response.status != 200:
             raise RuntimeError("Got en error: {} - {}\n{}".format(response.status, response.reason, body))
         return headers, body
 
-    def _receive_pickle_request(self):
-        logger = logging.getLogger(__name__)
-
-        if self.socket is None:
-            server_socket = pythonsocket.socket(pythonsocket.AF_INET,
-                                              pythonsocket.SOCK_STREAM)    
-            server_socket.bind((self.private_host, self.private_port))
-            server_socket.listen(10)
-            logger.info("[*] Server listening on {} {}".format(self.private_host, self.private_port))
-            conn, addr = server_socket.accept()
-            logger.debug('socket accept  {} {}'.format(conn, addr))
-            self.socket = conn
-
- 
-        # Read first message lenght
-        logger.debug("[**] Recv() ask  {} bytes".format(calcsize(self.struct_format)))
-        size_packed = self.socket.recv(calcsize(self.struct_format))
-
-        # Perhaps pipe broken
-        if size_packed == b'':
-            # Close socket
-            self.socket.close()
-
-            # Rebuild a new server_socket
-            logger.warning("Perhaps pipe broken. Create new server socket")
-            server_socket = pythonsocket.socket(pythonsocket.AF_INET,
-                                              pythonsocket.SOCK_STREAM)    
-            server_socket.bind((self.private_host, self.private_port))
-            server_socket.listen(10)
-            logger.info("[*] Server listening on {} {}".format(self.private_host, self.private_port))
-            conn, addr = server_socket.accept()
-            logger.info('socket accept  {} {}'.format(conn, addr))
-            self.socket = conn
 
-            logger.info("[**] Recv() ask  {} bytes".format(calcsize(self.struct_format)))
-            size_packed = self.socket.recv(calcsize(self.struct_format))
+class _MALRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive
+    disable_nagle_algorithm = True
 
+    def do_POST(self):
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            # The end of the body is unknown, the connection is closed
+            self.close_connection = True
+            self.send_mal_response(400, {'Content-Length': 0}, b'')
+            return
+        body = self.rfile.read(length)
+        self.server.mal_socket._dispatch(self, body)
+
+    def send_mal_response(self, status, headers, body):
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.getLogger(__name__).debug(format, *args)
+
+
+class HTTPServerSocket(MALSocket):
+    """ Server side of the MAL/HTTP binding.
+
+    Each HTTP connection is served by its own thread, which maps the
+    X-MAL-* headers of the requests to a MALHeader. The first message of
+    an interaction is given to a new HTTPTransactionSocket, returned by
+    waitforconnection(), so that the provider handlers run concurrently.
+    The messages of the transactions initiated by the HTTPSockets using
+    this server (ex: INVOKE_RESPONSE) are routed to them.
+    """
+
+    def __init__(self, CONTEXT=None, client_context=None, streaming=False, reply_timeout=60.):
+        """
+        @param CONTEXT: server side SSLContext, None for plain HTTP (the
+                        consumers then use http:// URIs)
+        @param client_context: SSLContext of the HTTP requests sent by the
+                               transactions, for their later stages
+        @param streaming: pipeline the later stages without MAL reply (see
+                          HTTPSocket)
+        @param reply_timeout: seconds given to the provider handler to send
+                              the MAL reply of a request, after which the
+                              HTTP status is 500
+        """
+        self.CONTEXT = CONTEXT
+        self.client_context = client_context
+        self.streaming = streaming
+        self.reply_timeout = reply_timeout
+        self.httpserver = None
+        self._thread = None
+        self._transactions = queue.Queue()
+        self._routes = {}
+        self._lock = threading.Lock()
 
+    def bind(self, uri):
+        """ @param uri: (host, port) """
+        self.httpserver = http.server.ThreadingHTTPServer(uri, _MALRequestHandler, bind_and_activate=False)
+        self.httpserver.mal_socket = self
+        self.httpserver.server_bind()
+        if self.CONTEXT is not None:
+            # The handshake is done by the thread of the connection
+            self.httpserver.socket = self.CONTEXT.wrap_socket(
+                self.httpserver.socket, server_side=True, do_handshake_on_connect=False)
 
+    def listen(self, unacceptedconnectnb=0):
+        self.httpserver.socket.listen(unacceptedconnectnb)
+        self._thread = threading.Thread(target=self.httpserver.serve_forever, daemon=True)
+        self._thread.start()
 
-        logger.info("[**] Received {} bytes".format(size_packed))
-        size = unpack(self.struct_format,size_packed)[0]
-        logger.debug("[**] Received {} bytes '{}'".format(size,size_packed))
+    def waitforconnection(self):
+        return self._transactions.get()
 
-        message = self.socket.recv(int(size))
-        logger.debug("[**] Received {} bytes '{}'".format(len(message),message))
+    def unbind(self):
+        if self._thread is not None:
+            self.httpserver.shutdown()
+            self._thread = None
+        self.httpserver.server_close()
 
-        # Get message from http server
-        data = pickle.loads(message)
-        #logger.debug("[**] data '{}'".format(data))
-        logger.debug("[**] Headers {} Body '{}'".format(data['headers'], data['body'].decode('utf-8')))
+    def register(self, socket, key):
+        """ Route the received messages of the transaction key to socket. """
+        with self._lock:
+            self._routes[key] = socket
 
-        headers = data['headers']
-        body = data['body']
+    def unregister(self, socket):
+        with self._lock:
+            self._routes = {k: s for k, s in self._routes.items() if s is not socket}
 
-        return headers, body
+    @property
+    def uri(self):
+        return self.httpserver.server_address
 
-    def _send_pickle_response(self, headers, body):
+    def _dispatch(self, request, body):
+        """ Route a received request and answer it: 400 when its X-MAL-*
+        headers are missing or invalid, 500 when it cannot be dispatched
+        or its MAL reply is not sent in time.
+        """
         logger = logging.getLogger(__name__)
 
-        logger.debug('Header {} body {}'.format(headers, body))
-        response_dict= {
-            'headers': headers,
-            'body': body
-        }
-
         try:
-            data_response=pickle.dumps(response_dict)
-            data_response_lenght = len(data_response)
-            data_response_lenght_packed = pack(self.struct_format,data_response_lenght)
-
-            # Send data lenght
-            logger.debug("Send {} bytes '{}'".format(len(data_response_lenght_packed),data_response_lenght_packed))
-            self.socket.send(data_response_lenght_packed)
-
-            # Send data
-            logger.debug("Send {} bytes '{}'".format(data_response_lenght,data_response))
-            self.socket.send(data_response)
-        except Exception as e:
-            logger.warning("Exception {} ".format(e))
-
-
-
-class HTTPSocketPubSub(HTTPSocket):
-
-    def __init__(self, socket=None, CONTEXT=None,  private=False, private_host=None, private_port=None):
-        super().__init__(socket, CONTEXT,   private, private_host, private_port)
+            header = _header_http_to_mal(request.headers)
+        except (KeyError, ValueError, TypeError, RuntimeError) as error:
+            logger.warning("Invalid MAL/HTTP headers from %s: %r", request.client_address, error)
+            request.send_mal_response(400, {'Content-Length': 0}, b'')
+            return
+        logger.debug("Received %s stage %s from %s", header.ip_type.name, header.ip_stage, header.uri_from)
+        try:
+            reply = self._route(request, header, body)
+        except Exception:
+            logger.exception("Failed to dispatch %s stage %s from %s", header.ip_type.name, header.ip_stage, header.uri_from)
+            reply = None
+        if reply is None:
+            request.send_mal_response(500, {'Content-Length': 0}, b'')
+        else:
+            request.send_mal_response(200, *reply)
 
-    def recv(self):
+    def _route(self, request, header, body):
+        """ Give the message to its transaction socket, and return the
+        (headers, body) of the HTTP response, None if it was not replied.
+        """
         logger = logging.getLogger(__name__)
 
-        # Read HTTP body an headers
-        body = self.socket.body
-        headers = self.socket.headers
-        logger.info("headers [{}] , body [{}]".format(headers,body.decode('utf-8')))
- 
-        # Set MAL header from HTTP header
-        malheader = self._header_http_to_mal(headers)
-
-        if self.encoding == MALPY_ENCODING.XML and headers['Content-Type'] != "application/mal-xml":
-            raise RuntimeError("Unexpected encoding. Expected 'application/mal-xml', got '{}'".format(headers['Content-Type']))
-
-        # Rajouter un send_http_response() dans le cas de la reception d'un PUBSUB_PUBLISH
-        if ( headers['X-MAL-Interaction-Type'] == _encode_ip_type(mal.InteractionTypeEnum.PUBSUB) and \
-             headers['X-MAL-Interaction-Stage'] == str(mal.MAL_IP_STAGES.PUBSUB_PUBLISH)  ):
-            logger.debug('Interaction Type {} Stage {} -> getresponse()'.format(headers['X-MAL-Interaction-Type'], headers['X-MAL-Interaction-Stage']))
-            self.send_http_response(b'')
+        message = mal.MALMessage(header=header, msg_parts=body)
+        with self._lock:
+            socket = self._routes.get(received_transaction_key(header))
+        if socket is not None:
+            socket.messages.put((request.headers, message))
+            return {'Content-Length': 0}, b''
+        replied = (header.ip_type, header.ip_stage) in _REPLIED_STAGES and not header.is_error_message
+        socket = HTTPTransactionSocket(self, request.client_address, replied)
+        # Taken before the socket is given to the provider, which may
+        # reply at once
+        replies = socket._reply
+        socket.messages.put((request.headers, message))
+        self._transactions.put(socket)
+        if not replied:
+            return {'Content-Length': 0}, b''
+        # The thread waits for the provider handler
+        try:
+            return replies.get(timeout=self.reply_timeout)
+        except queue.Empty:
+            logger.debug("No reply to %s stage %s from %s", header.ip_type.name, header.ip_stage, header.uri_from)
+            socket._cancel_reply()
+            # The reply may have been sent meanwhile
+            return replies.get()
+
+
+class HTTPTransactionSocket(MALSocket):
+    """ Transport of an interaction initiated by a request received by an
+    HTTPServerSocket. The first message sent is the HTTP response of that
+    request when its stage has one, the next ones are sent as new HTTP
+    requests.
+    """
+
+    def __init__(self, server, uri, replied):
+        self.server = server
+        self._uri = uri
+        self.messages = queue.Queue()
+        self._reply = queue.Queue() if replied else None
+        self._reply_cancelled = False
+        self._reply_lock = threading.Lock()
+        self._client = None
 
-        # Return a MAL message
-        return mal.MALMessage(header=malheader, msg_parts=body)
-        
+    def disconnect(self):
+        self._cancel_reply()
+        if self._client is not None:
+            self._client.disconnect()
+
+    def _take_reply(self, cancel=False):
+        """ Return the queue of the HTTP response of the request, once """
+        with self._reply_lock:
+            if self._reply_cancelled:
+                raise RuntimeError("The request was already answered with an HTTP error.")
+            replies, self._reply = self._reply, None
+            self._reply_cancelled = cancel and replies is not None
+            return replies
+
+    def _cancel_reply(self):
+        # No reply will be sent, the HTTP status is 500
+        try:
+            replies = self._take_reply(cancel=True)
+        except RuntimeError:
+            return
+        if replies is not None:
+            replies.put(None)
 
     def send(self, message):
-        logger = logging.getLogger(__name__)
-
-        # Set HTTP headers from MAL message
-        headers = self._header_mal_to_http(message)
-        body = message.msg_parts
-        logger.info("headers : {}\nbody : {}".format(json.dumps(headers,indent=4),body.decode('utf-8')))
-
-        if self.encoding == MALPY_ENCODING.XML:
-            headers['Content-Type'] = "application/mal-xml"
-        else:
-            headers['Content-Type'] = "application/mal"
-            raise NotImplementedError("Only the XML Encoding is implemented with the HTTP Transport.")
-
-        # For stage NOTIFY, the request is a HTTP POST request
-        if headers['X-MAL-Interaction-Stage'] == str(mal.MAL_IP_STAGES.PUBSUB_NOTIFY) :
-            self._send_http_request(target=message.header.uri_to, body=body, headers=headers)
-        else:
-
-            logger.info("send http response")
-# For other cases it's a 200 http response
-            self.socket.send_response(200, 'OK')
-
-            # Write headers in HTTP response
-            for key, value in headers.items():
-                self.socket.send_header(key,value)
-            self.socket.end_headers()
-
-            # send response
-            self.socket.wfile.write(body)
-
-    def send_http_response(self, message):
-        # Send HTTP response 200
-        logger = logging.getLogger(__name__)
-
-        self.socket.send_response(200, 'OK')
-        logger.debug("message {}".format(message))
-        self.socket.end_headers()
-        self.socket.wfile.write(message)
-
- 
+        replies = self._take_reply()
+        if replies is None:
+            if self._client is None:
+                self._client = HTTPSocket(CONTEXT=self.server.client_context, streaming=self.server.streaming)
+                self._client.parent = self.parent
+            self._client.send(message)
+            return
+        try:
+            headers = _header_mal_to_http(message)
+            headers['Content-Type'] = _content_type(self.encoding)
+        except Exception:
+            replies.put(None)
+            raise
+        replies.put((headers, message.msg_parts))
 
+    def recv(self):
+        headers, message = self.messages.get()
+        try:
+            _check_content_type(self.encoding, headers)
+        except RuntimeError:
+            self._cancel_reply()
+            raise
+        return message
 
+    @property
+    def uri(self):
+        return self._uri
@@ -0,0 +1,296 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Transaction multiplexing over one connection.
+
+A dispatcher owns a connected MAL socket whose recv() returns MALMessages
+with a decoded header (ex: MALTCPSocket). It hands out channels, which are
+MAL sockets given to the handlers in place of the connection. Each channel
+carries the messages of the transactions it sent, and the received
+messages are routed by their transaction key:
+(transaction_id, remote URI, interaction type, area, service, operation).
+The transaction ids are allocated per handler class, the interaction type
+tells apart the transactions of the handlers of different patterns.
+
+Messages of unknown transactions (new interactions initiated by the peer)
+open a new channel, returned by waitfortransaction().
+
+A channel keeps its transactions until it is disconnected.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+
+from malpy.mo import mal
+
+from .abstract_transport import MALSocket, AsyncMALSocket
+
+
+def _transaction_key(header, uri):
+    # Unset numbers and URIs are read back from the wire as 0 and ""
+    return (header.transaction_id, uri or "", header.ip_type or 0,
+            header.area or 0, header.service or 0, header.operation or 0)
+
+
+def sent_transaction_key(header):
+    return _transaction_key(header, header.uri_to)
+
+
+def received_transaction_key(header):
+    return _transaction_key(header, header.uri_from)
+
+
+def _check_message(message):
+    if not isinstance(message, mal.MALMessage):
+        raise TypeError("Multiplexed transactions need a MALMessage with an encoded body, got {}.".format(type(message)))
+
+
+class TransactionChannel(MALSocket):
+    """ Transport of the transactions of one handler over the connection
+    of a TransactionDispatcher.
+    """
+
+    def __init__(self, dispatcher):
+        self.dispatcher = dispatcher
+        self.keys = set()
+        self.messages = queue.Queue()
+
+    def connect(self, uri):
+        self.dispatcher.connect(uri)
+
+    def disconnect(self):
+        self.dispatcher.unregister(self)
+
+    def send(self, message):
+        _check_message(message)
+        self.dispatcher.register(self, sent_transaction_key(message.header))
+        self.dispatcher.send(message)
+
+    def recv(self):
+        message = self.messages.get()
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+    @property
+    def uri(self):
+        return self.dispatcher.socket.uri
+
+
+class TransactionDispatcher(object):
+    """ Share one connected MAL socket between many transactions.
+
+    A thread reads the socket and routes the messages to the channels.
+    """
+
+    channel_class = TransactionChannel
+
+    def __init__(self, socket, encoding):
+        """ @param socket: a MAL socket receiving MALMessages (ex: MALTCPSocket)
+            @param encoding: the encoder of the bodies, whose encoding is
+                             announced on the connection
+        """
+        self.socket = socket
+        self.encoding = encoding
+        self.socket.parent = self
+        self.connected = False
+        self.error = None
+        self._channels = {}
+        self._incoming = queue.Queue()
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._thread = None
+
+    def channel(self):
+        return self.channel_class(self)
+
+    def connect(self, uri):
+        """ Connect the shared socket, if it is not connected yet, and
+        start dispatching.
+        """
+        with self._lock:
+            if not self.connected:
+                self.socket.connect(uri)
+                self.connected = True
+        self.start()
+
+    def start(self):
+        """ Start dispatching on an already connected socket (ex: returned
+        by waitforconnection()).
+        """
+        with self._lock:
+            self.connected = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._dispatch, daemon=True)
+                self._thread.start()
+
+    def disconnect(self):
+        self.socket.disconnect()
+
+    def waitfortransaction(self):
+        """ Return the channel of the next transaction initiated by the peer.
+        Its first message is ready to be received.
+        """
+        channel = self._incoming.get()
+        if isinstance(channel, Exception):
+            raise channel
+        return channel
+
+    def register(self, channel, key):
+        with self._lock:
+            if key not in channel.keys:
+                if key in self._channels:
+                    raise RuntimeError("The transaction {} is already in use on this connection.".format(key))
+                channel.keys.add(key)
+                self._channels[key] = channel
+
+    def unregister(self, channel):
+        with self._lock:
+            for key in channel.keys:
+                if self._channels.get(key) is channel:
+                    del self._channels[key]
+            channel.keys.clear()
+
+    def send(self, message):
+        if self.error is not None:
+            raise self.error
+        with self._send_lock:
+            self.socket.send(message)
+
+    def _route(self, message):
+        key = received_transaction_key(message.header)
+        with self._lock:
+            channel = self._channels.get(key)
+            if channel is None:
+                channel = self.channel()
+                channel.keys.add(key)
+                self._channels[key] = channel
+                self._incoming.put_nowait(channel)
+        channel.messages.put_nowait(message)
+
+    def _dispatch(self):
+        logger = logging.getLogger(__name__)
+        try:
+            while True:
+                self._route(self.socket.recv())
+        except (ConnectionError, OSError) as e:
+            self._close(e)
+        except Exception as e:
+            # Ex: an invalid frame, the connection cannot be read anymore
+            logger.exception("Stopped dispatching the received messages")
+            self._close(e)
+
+    def _close(self, error):
+        if not isinstance(error, ConnectionError):
+            cause = error
+            error = ConnectionError("{}: {}".format(type(cause).__name__, cause))
+            error.__cause__ = cause
+        with self._lock:
+            self.error = error
+            channels = set(self._channels.values())
+            self._channels.clear()
+        for channel in channels:
+            channel.messages.put_nowait(error)
+        self._incoming.put_nowait(error)
+
+
+class AsyncTransactionChannel(AsyncMALSocket):
+    """ Asyncio version of TransactionChannel. """
+
+    def __init__(self, dispatcher):
+        self.dispatcher = dispatcher
+        self.keys = set()
+        self.messages = asyncio.Queue()
+
+    async def connect(self, uri):
+        await self.dispatcher.connect(uri)
+
+    async def disconnect(self):
+        self.dispatcher.unregister(self)
+
+    async def send(self, message):
+        _check_message(message)
+        self.dispatcher.register(self, sent_transaction_key(message.header))
+        await self.dispatcher.send(message)
+
+    async def recv(self):
+        message = await self.messages.get()
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+    @property
+    def uri(self):
+        return self.dispatcher.socket.uri
+
+
+class AsyncTransactionDispatcher(TransactionDispatcher):
+    """ Asyncio version of TransactionDispatcher, the socket is read by a
+    task of the event loop (ex: with an AsyncMALTCPSocket).
+    """
+
+    channel_class = AsyncTransactionChannel
+
+    def __init__(self, socket, encoding):
+        super().__init__(socket, encoding)
+        self._incoming = asyncio.Queue()
+        self._lock = _NoLock()
+        self._send_lock = asyncio.Lock()
+        self._connect_lock = asyncio.Lock()
+        self._task = None
+
+    async def connect(self, uri):
+        async with self._connect_lock:
+            if not self.connected:
+                await self.socket.connect(uri)
+                self.connected = True
+        self.start()
+
+    def start(self):
+        self.connected = True
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._dispatch())
+
+    async def disconnect(self):
+        if self._task is not None:
+            self._task.cancel()
+        await self.socket.disconnect()
+
+    async def waitfortransaction(self):
+        channel = await self._incoming.get()
+        if isinstance(channel, Exception):
+            raise channel
+        return channel
+
+    async def send(self, message):
+        if self.error is not None:
+            raise self.error
+        async with self._send_lock:
+            await self.socket.send(message)
+
+    async def _dispatch(self):
+        logger = logging.getLogger(__name__)
+        try:
+            while True:
+                self._route(await self.socket.recv())
+        except (ConnectionError, OSError) as e:
+            self._close(e)
+        except Exception as e:
+            logger.exception("Stopped dispatching the received messages")
+            self._close(e)
+
+
+class _NoLock(object):
+    """ The event loop runs one coroutine at a time, the shared state of an
+    AsyncTransactionDispatcher needs no lock.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
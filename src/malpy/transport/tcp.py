@@ -3,23 +3,189 @@
 #
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import socket as pythonsocket
+import struct
 
 from malpy.malpydefinitions import MALPY_ENCODING
 from malpy.mo import mal
+from malpy.encoding import BinaryWriter, BinaryReader
 
-from .abstract_transport import MALSocket
+from .abstract_transport import MALSocket, AsyncMALSocket
+
+
+VERSION_NUMBER = 1  # Version number of the MAL/TCP binding
+
+# Interaction type and stage of each SDU type of the binding
+_SDU_TYPES = [
+    (mal.InteractionTypeEnum.SEND, mal.MAL_IP_STAGES.SEND),
+    (mal.InteractionTypeEnum.SUBMIT, mal.MAL_IP_STAGES.SUBMIT),
+    (mal.InteractionTypeEnum.SUBMIT, mal.MAL_IP_STAGES.SUBMIT_ACK),
+    (mal.InteractionTypeEnum.REQUEST, mal.MAL_IP_STAGES.REQUEST),
+    (mal.InteractionTypeEnum.REQUEST, mal.MAL_IP_STAGES.REQUEST_RESPONSE),
+    (mal.InteractionTypeEnum.INVOKE, mal.MAL_IP_STAGES.INVOKE),
+    (mal.InteractionTypeEnum.INVOKE, mal.MAL_IP_STAGES.INVOKE_ACK),
+    (mal.InteractionTypeEnum.INVOKE, mal.MAL_IP_STAGES.INVOKE_RESPONSE),
+    (mal.InteractionTypeEnum.PROGRESS, mal.MAL_IP_STAGES.PROGRESS),
+    (mal.InteractionTypeEnum.PROGRESS, mal.MAL_IP_STAGES.PROGRESS_ACK),
+    (mal.InteractionTypeEnum.PROGRESS, mal.MAL_IP_STAGES.PROGRESS_UPDATE),
+    (mal.InteractionTypeEnum.PROGRESS, mal.MAL_IP_STAGES.PROGRESS_RESPONSE),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_REGISTER),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_REGISTER_ACK),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_PUBLISH_REGISTER),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_PUBLISH_REGISTER_ACK),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_PUBLISH),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_NOTIFY),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_DEREGISTER),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_DEREGISTER_ACK),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_PUBLISH_DEREGISTER),
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_STAGES.PUBSUB_PUBLISH_DEREGISTER_ACK),
+    ]
+_SDU_TYPE_NUMBERS = {ip: sdu_type for sdu_type, ip in enumerate(_SDU_TYPES)}
+
+# Error messages use the SDU type of the message they replace
+_ERROR_SDU_TYPES = {
+    (mal.InteractionTypeEnum.SUBMIT, mal.MAL_IP_ERRORS.SUBMIT_ERROR): 2,
+    (mal.InteractionTypeEnum.REQUEST, mal.MAL_IP_ERRORS.REQUEST_ERROR): 4,
+    (mal.InteractionTypeEnum.INVOKE, mal.MAL_IP_ERRORS.INVOKE_ACK_ERROR): 6,
+    (mal.InteractionTypeEnum.INVOKE, mal.MAL_IP_ERRORS.INVOKE_RESPONSE_ERROR): 7,
+    (mal.InteractionTypeEnum.PROGRESS, mal.MAL_IP_ERRORS.PROGRESS_ACK_ERROR): 9,
+    (mal.InteractionTypeEnum.PROGRESS, mal.MAL_IP_ERRORS.PROGRESS_UPDATE_ERROR): 10,
+    (mal.InteractionTypeEnum.PROGRESS, mal.MAL_IP_ERRORS.PROGRESS_RESPONSE_ERROR): 11,
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_ERRORS.PUBSUB_REGISTER_ACK_ERROR): 13,
+    (mal.InteractionTypeEnum.PUBSUB, mal.MAL_IP_ERRORS.PUBSUB_PUBLISH_REGISTER_ERROR): 15,
+    }
+_ERROR_SDU_IP = {sdu_type: ip for ip, sdu_type in _ERROR_SDU_TYPES.items()}
+
+_QOS_LEVELS = list(mal.QoSLevelEnum)
+_SESSIONS = list(mal.SessionTypeEnum)
+
+# Version/SDU type, area, service, operation, area version,
+# error/QoS level/session, transaction id, flags, encoding id, variable length
+FIXED_HEADER = struct.Struct('!BHHHBBqBBI')
+
+# Presence flags of the optional fields, in the order they are written
+_URI_FROM_FLAG = 0x80
+_URI_TO_FLAG = 0x40
+_PRIORITY_FLAG = 0x20
+_TIMESTAMP_FLAG = 0x10
+_NETWORK_ZONE_FLAG = 0x08
+_SESSION_NAME_FLAG = 0x04
+_DOMAIN_FLAG = 0x02
+_AUTH_ID_FLAG = 0x01
+
+
+def encode_header(header, encoding, body_length):
+    """ Encode a MALHeader as the MAL/TCP header of a message whose
+    encoded body is body_length bytes long.
+
+    Undefined area, service, operation and transaction id (generic
+    handlers) are sent as 0.
+    """
+    if header.is_error_message:
+        sdu_type = _ERROR_SDU_TYPES[(header.ip_type, header.ip_stage)]
+    else:
+        sdu_type = _SDU_TYPE_NUMBERS[(header.ip_type, header.ip_stage)]
+
+    flags = 0
+    optional = BinaryWriter()
+    if header.uri_from is not None:
+        flags |= _URI_FROM_FLAG
+        optional.write_string(header.uri_from)
+    if header.uri_to is not None:
+        flags |= _URI_TO_FLAG
+        optional.write_string(header.uri_to)
+    if header.priority is not None:
+        flags |= _PRIORITY_FLAG
+        optional.write_uvarint(header.priority)
+    if header.timestamp is not None:
+        flags |= _TIMESTAMP_FLAG
+        optional.write_varint(int(round(header.timestamp * 1000)))
+    if header.network_zone is not None:
+        flags |= _NETWORK_ZONE_FLAG
+        optional.write_string(header.network_zone)
+    if header.session_name is not None:
+        flags |= _SESSION_NAME_FLAG
+        optional.write_string(header.session_name)
+    if header.domain is not None:
+        flags |= _DOMAIN_FLAG
+        optional.write_uvarint(len(header.domain))
+        for subdomain in header.domain:
+            optional.write_string(subdomain)
+    if header.auth_id is not None:
+        flags |= _AUTH_ID_FLAG
+        optional.write_blob(header.auth_id)
+
+    fixed = FIXED_HEADER.pack(
+        (VERSION_NUMBER << 5) | sdu_type,
+        header.area or 0, header.service or 0, header.operation or 0, header.area_version,
+        (0x80 if header.is_error_message else 0) | ((header.qos_level - 1) << 4) | (header.session - 1),
+        header.transaction_id or 0, flags, encoding,
+        len(optional.buffer) + body_length)
+    return fixed + optional.buffer
+
+
+def decode_header(fixed, data):
+    """ Decode the fixed part of a MAL/TCP header and the optional fields
+    at the beginning of data.
+    @return: (MALHeader, encoding, offset of the body in data)
+    """
+    (version_sdu_type, area, service, operation, area_version, error_qos_session,
+     transaction_id, flags, encoding, _) = FIXED_HEADER.unpack_from(fixed)
+    if version_sdu_type >> 5 != VERSION_NUMBER:
+        raise RuntimeError("The incoming version number was {}, expected was {}".format(version_sdu_type >> 5, VERSION_NUMBER))
+
+    header = mal.MALHeader()
+    header.is_error_message = error_qos_session & 0x80 != 0
+    if header.is_error_message:
+        header.ip_type, header.ip_stage = _ERROR_SDU_IP[version_sdu_type & 0x1F]
+    else:
+        header.ip_type, header.ip_stage = _SDU_TYPES[version_sdu_type & 0x1F]
+    header.area = area
+    header.service = service
+    header.operation = operation
+    header.area_version = area_version
+    header.qos_level = _QOS_LEVELS[(error_qos_session >> 4) & 0x07]
+    header.session = _SESSIONS[error_qos_session & 0x0F]
+    header.transaction_id = transaction_id
+
+    optional = BinaryReader(data)
+    if flags & _URI_FROM_FLAG:
+        header.uri_from = optional.read_string()
+    if flags & _URI_TO_FLAG:
+        header.uri_to = optional.read_string()
+    if flags & _PRIORITY_FLAG:
+        header.priority = optional.read_uvarint()
+    if flags & _TIMESTAMP_FLAG:
+        header.timestamp = optional.read_varint() / 1000
+    if flags & _NETWORK_ZONE_FLAG:
+        header.network_zone = optional.read_string()
+    if flags & _SESSION_NAME_FLAG:
+        header.session_name = optional.read_string()
+    if flags & _DOMAIN_FLAG:
+        header.domain = [optional.read_string() for _ in range(optional.read_uvarint())]
+    if flags & _AUTH_ID_FLAG:
+        header.auth_id = optional.read_blob()
+    return header, encoding, optional.offset
 
 
 class TCPSocket(MALSocket):
+    """ MAL socket over TCP.
+
+    In framed mode, each message is preceded by its length so that
+    messages of any size are sent completely and received as a whole.
+    Otherwise recv() returns what one socket.recv() call gives.
+    """
 
     _messagesize = 1024
+    _lengthheader = struct.Struct('!I')
 
-    def __init__(self, socket=None):
+    def __init__(self, socket=None, framed=False):
         if socket:
             self.socket = socket
         else:
             self.socket = pythonsocket.socket(pythonsocket.AF_INET, pythonsocket.SOCK_STREAM)
+        self.framed = framed
 
     def bind(self, uri):
         """ @param uri: (host, port) """
@@ -30,7 +196,7 @@ class TCPSocket(MALSocket):
 
     def waitforconnection(self):
         conn, _ = self.socket.accept()
-        return TCPSocket(conn)
+        return TCPSocket(conn, framed=self.framed)
 
     def connect(self, uri):
         """ @param uri: (host, port) """
@@ -43,13 +209,168 @@ class TCPSocket(MALSocket):
         self.socket.close()
 
     def send(self, message):
-        self.socket.send(message)
+        if self.framed:
+            self._send_parts([self._lengthheader.pack(len(message)), message])
+        else:
+            self.socket.sendall(message)
 
     def recv(self):
-        return self.socket.recv(self._messagesize)
+        if self.framed:
+            size = self._lengthheader.unpack(self._recv_exactly(self._lengthheader.size))[0]
+            return self._recv_exactly(size)
+        else:
+            return self.socket.recv(self._messagesize)
+
+    def _send_parts(self, parts):
+        """ Send the buffers with a single system call when possible
+        (scatter/gather), then send what remains if the write was partial.
+        """
+        if not hasattr(self.socket, 'sendmsg'):
+            self.socket.sendall(b"".join(parts))
+            return
+        sent = self.socket.sendmsg(parts)
+        for part in parts:
+            if sent >= len(part):
+                sent -= len(part)
+                continue
+            self.socket.sendall(memoryview(part)[sent:])
+            sent = 0
+
+    def _recv_exactly(self, size):
+        """ Receive exactly size bytes into a bytearray allocated once. """
+        data = bytearray(size)
+        view = memoryview(data)
+        received = 0
+        while received < size:
+            nbytes = self.socket.recv_into(view[received:], size - received)
+            if nbytes == 0:
+                raise ConnectionError("The connection was closed by the peer.")
+            received += nbytes
+        return data
 
     @property
     def uri(self):
         return self.socket.getsockname()
 
 
+class MALTCPSocket(TCPSocket):
+    """ MAL socket implementing the MAL/TCP binding.
+
+    The MAL header is sent in the binary layout of the binding, only the
+    body goes through the encoder of the handler. The variable length of
+    the header frames the messages on the stream. Received bodies are
+    memoryviews on the received buffer.
+    """
+
+    def __init__(self, socket=None):
+        super().__init__(socket, framed=True)
+
+    def waitforconnection(self):
+        conn, _ = self.socket.accept()
+        return MALTCPSocket(conn)
+
+    def send(self, message):
+        if not isinstance(message, mal.MALMessage):
+            raise TypeError("The MAL/TCP binding sends a MALMessage with an encoded body, got {}.".format(type(message)))
+        body = message.msg_parts
+        header = encode_header(message.header, self.encoding, len(body))
+        self._send_parts([header, body])
+
+    def recv(self):
+        fixed = self._recv_exactly(FIXED_HEADER.size)
+        data = self._recv_exactly(FIXED_HEADER.unpack_from(fixed)[-1])
+        header, encoding, offset = decode_header(fixed, data)
+        if self.encoding is not None and encoding != self.encoding:
+            raise RuntimeError("Unexpected encoding. Expected '{}', got '{}'".format(self.encoding, encoding))
+        return mal.MALMessage(header=header, msg_parts=memoryview(data)[offset:])
+
+
+class AsyncTCPSocket(AsyncMALSocket):
+    """ Asyncio version of TCPSocket.
+
+    A bound socket accepts connections in the background, and
+    waitforconnection() returns them one by one, so that a single event
+    loop serves all the connections.
+    """
+
+    _messagesize = 1024
+    _lengthheader = struct.Struct('!I')
+
+    def __init__(self, reader=None, writer=None, framed=False):
+        self.reader = reader
+        self.writer = writer
+        self.framed = framed
+        self.server = None
+        self._connections = None
+
+    async def bind(self, uri, unacceptedconnectnb=100):
+        """ @param uri: (host, port) """
+        self._connections = asyncio.Queue()
+        self.server = await asyncio.start_server(
+            self._accept, uri[0], uri[1], backlog=unacceptedconnectnb)
+
+    async def _accept(self, reader, writer):
+        await self._connections.put(self.__class__(reader, writer, framed=self.framed))
+
+    async def waitforconnection(self):
+        return await self._connections.get()
+
+    async def connect(self, uri):
+        """ @param uri: (host, port) """
+        self.reader, self.writer = await asyncio.open_connection(uri[0], uri[1])
+
+    async def unbind(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def disconnect(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+    async def send(self, message):
+        if self.framed:
+            self.writer.writelines([self._lengthheader.pack(len(message)), message])
+        else:
+            self.writer.write(message)
+        await self.writer.drain()
+
+    async def recv(self):
+        if self.framed:
+            size = self._lengthheader.unpack(await self._recv_exactly(self._lengthheader.size))[0]
+            return await self._recv_exactly(size)
+        else:
+            return await self.reader.read(self._messagesize)
+
+    async def _recv_exactly(self, size):
+        try:
+            return await self.reader.readexactly(size)
+        except asyncio.IncompleteReadError:
+            raise ConnectionError("The connection was closed by the peer.")
+
+    @property
+    def uri(self):
+        if self.server is not None:
+            return self.server.sockets[0].getsockname()
+        return self.writer.get_extra_info('sockname')
+
+
+class AsyncMALTCPSocket(AsyncTCPSocket):
+    """ Asyncio version of MALTCPSocket. """
+
+    def __init__(self, reader=None, writer=None, framed=True):
+        super().__init__(reader, writer, framed=True)
+
+    async def send(self, message):
+        if not isinstance(message, mal.MALMessage):
+            raise TypeError("The MAL/TCP binding sends a MALMessage with an encoded body, got {}.".format(type(message)))
+        body = message.msg_parts
+        self.writer.writelines([encode_header(message.header, self.encoding, len(body)), body])
+        await self.writer.drain()
+
+    async def recv(self):
+        fixed = await self._recv_exactly(FIXED_HEADER.size)
+        data = await self._recv_exactly(FIXED_HEADER.unpack_from(fixed)[-1])
+        header, encoding, offset = decode_header(fixed, data)
+        if self.encoding is not None and encoding != self.encoding:
+            raise RuntimeError("Unexpected encoding. Expected '{}', got '{}'".format(self.encoding, encoding))
+        return mal.MALMessage(header=header, msg_parts=memoryview(data)[offset:])
@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The lists of numeric attributes store their values in an array.array,
+and behave as the other ElementLists.
+"""
+
+import array
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy import encoding
+
+
+class TestArrayLists(unittest.TestCase):
+
+    def test_storage(self):
+        values = mal.LongList([1, None, -3])
+        self.assertIsInstance(values._internal_value, array.array)
+        self.assertEqual(list(values.values()), [1, None, -3])
+        self.assertEqual([e.internal_value for e in values.internal_value], [1, None, -3])
+        self.assertIs(type(values.internal_value[0]), mal.Long)
+        self.assertEqual(len(values), 3)
+
+    def test_same_as_a_list(self):
+        # Random edits of the items, compared with the ones of a list
+        rng = random.Random(3)
+        generators = {
+            mal.LongList: lambda: rng.choice([None, rng.randint(-5, 5)]),
+            mal.FloatList: lambda: rng.choice([None, rng.random()]),
+            mal.UOctetList: lambda: rng.choice([None, rng.randint(0, 255)]),
+            }
+        for cls, generate in generators.items():
+            for _ in range(50):
+                expected = [generate() for _ in range(rng.randint(0, 20))]
+                values = cls(expected)
+                items = values.internal_value
+                for _ in range(30):
+                    operation = rng.randrange(6)
+                    size = len(expected)
+                    value = generate()
+                    if operation == 0:
+                        items.append(value)
+                        expected.append(value)
+                    elif operation == 1 and size:
+                        i = rng.randrange(-size, size)
+                        items[i] = value
+                        expected[i] = value
+                    elif operation == 2:
+                        i = rng.randint(-size - 2, size + 2)
+                        items.insert(i, value)
+                        expected.insert(i, value)
+                    elif operation == 3 and size:
+                        i = rng.randrange(-size, size)
+                        del items[i]
+                        del expected[i]
+                    elif operation == 4:
+                        a, b = sorted(rng.randint(0, size) for _ in range(2))
+                        new = [generate() for _ in range(rng.randint(0, 3))]
+                        items[a:b] = new
+                        expected[a:b] = new
+                    elif operation == 5 and size:
+                        a, b = sorted(rng.randint(0, size) for _ in range(2))
+                        del items[a:b]
+                        del expected[a:b]
+                    self.assertEqual(list(values.values()), expected)
+                    self.assertEqual([e.internal_value for e in items], expected)
+
+    def test_elements(self):
+        values = mal.LongList([1, 2])
+        values.internal_value.append(mal.Long(3))
+        values.internal_value.extend([4, None])
+        self.assertEqual(list(values.values()), [1, 2, 3, 4, None])
+
+    def test_range(self):
+        with self.assertRaises(ValueError):
+            mal.UOctetList([1]).internal_value.append(300)
+        with self.assertRaises(ValueError):
+            mal.FloatList([1.0]).internal_value.append(1e39)
+        with self.assertRaises(ValueError):
+            mal.FloatList([None, 1e39])
+        with self.assertRaises(TypeError):
+            mal.LongList([1]).internal_value[0] = 'x'
+        infinities = [float('inf'), float('-inf'), 3.4028234663852886e38]
+        self.assertEqual(list(mal.FloatList(infinities).values()), infinities)
+
+    def test_copy(self):
+        original = mal.DoubleList([0.5, None])
+        copy = original.copy()
+        copy.internal_value.append(1.5)
+        self.assertEqual(list(original.values()), [0.5, None])
+        self.assertEqual(list(copy.values()), [0.5, None, 1.5])
+
+    def test_encodings(self):
+        body = [mal.FloatList([0.5, None, float('inf')]), mal.ULongList([2 ** 64 - 1, None]),
+                mal.TimeList([1.5, None])]
+        for encoder in (encoding.BinaryEncoder(), encoding.SplitBinaryEncoder(), encoding.XMLEncoder(),
+                        encoding.JSONEncoder()):
+            decoded = encoder.decode_body(encoder.encode_body(body))
+            self.assertEqual([type(e) for e in decoded], [type(e) for e in body])
+            self.assertEqual([list(e.values()) for e in decoded], [list(e.values()) for e in body])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Interactions between awaitable handlers over asyncio MAL/TCP sockets,
+all served by a single event loop.
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy.transport import tcp
+from malpy import encoding
+
+
+class TestAsyncTCP(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = tcp.AsyncMALTCPSocket()
+        await self.server.bind(('127.0.0.1', 0))
+        self.serving = asyncio.ensure_future(self.serve())
+
+    async def asyncTearDown(self):
+        self.serving.cancel()
+        await self.server.unbind()
+
+    async def serve(self):
+        while True:
+            socket = await self.server.waitforconnection()
+            asyncio.ensure_future(self.provide(socket))
+
+    async def provide(self, socket):
+        handler = mal.AsyncRequestProviderHandler(socket, encoding.BinaryEncoder())
+        message = await handler.receive_request()
+        await handler.response(mal.String("got " + message.msg_parts[0].internal_value))
+        await socket.disconnect()
+
+    async def request(self, value):
+        socket = tcp.AsyncMALTCPSocket()
+        handler = mal.AsyncRequestConsumerHandler(socket, encoding.BinaryEncoder(), "provider", "consumer")
+        await handler.connect(self.server.uri)
+        try:
+            await handler.request(mal.String(value))
+            message = await handler.receive_response()
+        finally:
+            await socket.disconnect()
+        return message.msg_parts[0].internal_value
+
+    async def test_request(self):
+        self.assertEqual(await self.request("r"), "got r")
+
+    async def test_concurrent_requests(self):
+        replies = await asyncio.gather(*[self.request(str(i)) for i in range(50)])
+        self.assertEqual(replies, ["got {}".format(i) for i in range(50)])
+
+
+class TestAsyncFraming(unittest.IsolatedAsyncioTestCase):
+
+    async def test_messages(self):
+        server = tcp.AsyncTCPSocket(framed=True)
+        await server.bind(('127.0.0.1', 0))
+        client = tcp.AsyncTCPSocket(framed=True)
+        await client.connect(server.uri)
+        connection = await server.waitforconnection()
+        messages = [b"first", b"", b"x" * 100000]
+        for message in messages:
+            await client.send(message)
+        self.assertEqual([await connection.recv() for _ in messages], messages)
+        await client.disconnect()
+        with self.assertRaises(ConnectionError):
+            await connection.recv()
+        await connection.disconnect()
+        await server.unbind()
+
+
+if __name__ == '__main__':
+    unittest.main()
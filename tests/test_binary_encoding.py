@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Round trips of message bodies through the MAL binary encoding. """
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy import encoding
+
+
+class TestBinaryEncoding(unittest.TestCase):
+
+    def setUp(self):
+        self.encoder = encoding.BinaryEncoder()
+
+    def round_trip(self, body):
+        return self.encoder.decode_body(self.encoder.encode_body(body))
+
+    def test_attributes(self):
+        body = [mal.Boolean(True), mal.Octet(-2), mal.UOctet(250), mal.Short(-300),
+                mal.UShort(60000), mal.Integer(-70000), mal.UInteger(4000000000),
+                mal.Long(-2 ** 63), mal.ULong(2 ** 64 - 1), mal.Float(0.5), mal.Double(-1.25),
+                mal.Duration(3.5), mal.Identifier("id"), mal.String("été"),
+                mal.URI("malhttp://host/uri"), mal.Blob(b"\x00\xff"), mal.Time(1.5),
+                mal.FineTime(1.000000001)]
+        decoded = self.round_trip(body)
+        self.assertEqual([type(e) for e in decoded], [type(e) for e in body])
+        self.assertEqual([e.internal_value for e in decoded], [e.internal_value for e in body])
+
+    def test_varint(self):
+        stream = encoding.BinaryWriter()
+        stream.write_varint(-1)
+        stream.write_uvarint(300)
+        self.assertEqual(stream.getvalue(), b"\x01\xac\x02")
+        reader = encoding.BinaryReader(stream.getvalue())
+        self.assertEqual((reader.read_varint(), reader.read_uvarint()), (-1, 300))
+
+    def test_null_parts(self):
+        self.assertEqual(self.round_trip([None, mal.Long(1), None])[0::2], [None, None])
+        self.assertIsNone(self.encoder.decode_body(self.encoder.encode_body(None)))
+
+    def test_composites(self):
+        header = mal.UpdateHeader([1.5, "uri", mal.UpdateTypeEnum.DELETION, mal.EntityKey(["A", 1, None, 3])])
+        decoded, = self.round_trip([header])
+        self.assertEqual(decoded.timestamp.internal_value, 1.5)
+        self.assertEqual(decoded.sourceURI.internal_value, "uri")
+        self.assertEqual(decoded.updateType.internal_value, mal.UpdateTypeEnum.DELETION)
+        self.assertEqual(decoded.key.firstSubKey.internal_value, "A")
+        self.assertIsNone(decoded.key.thirdSubKey.internal_value)
+
+    def test_lists(self):
+        decoded = self.round_trip([mal.IdentifierList(["a", None, "b"]), mal.LongList([1, None, -1]),
+                                   mal.EntityKeyList([["A", 1, 2, 3], ["B", 4, 5, 6]])])
+        self.assertEqual([e.internal_value for e in decoded[0].internal_value], ["a", None, "b"])
+        self.assertEqual(list(decoded[1].values()), [1, None, -1])
+        self.assertEqual([k.firstSubKey.internal_value for k in decoded[2].internal_value], ["A", "B"])
+
+    def test_attribute_fields(self):
+        decoded = self.round_trip([mal.Pair([mal.UInteger(4), mal.String("x")]),
+                                   mal.NamedValue(["n", mal.Double(2.5)])])
+        self.assertIs(type(decoded[0].first), mal.UInteger)
+        self.assertEqual(decoded[0].second.internal_value, "x")
+        self.assertIs(type(decoded[1].value), mal.Double)
+
+    def test_attribute_built_from_an_attribute(self):
+        attribute = mal.Attribute(mal.Long(1))
+        self.assertEqual(mal.Attribute(attribute).shortForm, mal.MALShortForm.LONG)
+        self.assertEqual(attribute.copy().shortForm, mal.MALShortForm.LONG)
+        decoded = self.round_trip([attribute, mal.NamedValue(["n", attribute]),
+                                   mal.Pair([attribute, mal.Attribute(mal.Blob(b"\x01"))])])
+        self.assertIs(type(decoded[0]), mal.Long)
+        self.assertIs(type(decoded[1].value), mal.Long)
+        self.assertEqual(decoded[1].value.internal_value, 1)
+        self.assertIs(type(decoded[2].second), mal.Blob)
+        self.assertEqual(decoded[2].second.internal_value, b"\x01")
+
+
+class TestTextEncodings(unittest.TestCase):
+
+    def test_attribute_built_from_an_attribute(self):
+        # The XML and JSON encodings name the type of the attribute
+        for encoder in (encoding.XMLEncoder(), encoding.XMLEncoder(use_dom=True), encoding.JSONEncoder()):
+            attribute = mal.Attribute(mal.Time(2.5))
+            decoded = encoder.decode_body(encoder.encode_body([attribute, mal.NamedValue(["n", attribute])]))
+            self.assertIs(type(decoded[0]), mal.Time)
+            self.assertIs(type(decoded[1].value), mal.Time)
+            self.assertEqual(decoded[1].value.internal_value, 2.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The binary codecs compiled from the field tables of the composites and
+lists write the layout of the MAL binary encoding.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy.mo.mc.services import parameter
+from malpy import encoding
+
+
+def encoded(*writes):
+    stream = encoding.BinaryWriter()
+    for method, value in writes:
+        getattr(stream, method)(value)
+    return stream.getvalue()
+
+
+class TestCompiledCodecs(unittest.TestCase):
+
+    def setUp(self):
+        self.encoder = encoding.BinaryEncoder()
+
+    def test_cached(self):
+        self.assertIs(encoding._binary_encoder(mal.EntityKey), encoding._binary_encoder(mal.EntityKey))
+        self.assertIs(encoding._binary_decoder(mal.EntityKey), encoding._binary_decoder(mal.EntityKey))
+
+    def test_composite_layout(self):
+        body = self.encoder.encode_body([mal.EntityKey(["A", 1, None, -3])])
+        self.assertEqual(body, encoded(
+            ('write_presence', True), ('write_varint', encoding.absolute_short_form(mal.EntityKey)),
+            ('write_presence', True), ('write_string', "A"),
+            ('write_presence', True), ('write_varint', 1),
+            ('write_presence', False),
+            ('write_presence', True), ('write_varint', -3)))
+
+    def test_list_layout(self):
+        body = self.encoder.encode_body([mal.IdentifierList(["a", None])])
+        self.assertEqual(body, encoded(
+            ('write_presence', True), ('write_varint', encoding.absolute_short_form(mal.IdentifierList)),
+            ('write_uvarint', 2), ('write_presence', True), ('write_string', "a"), ('write_presence', False)))
+
+    def test_polymorphic_fields(self):
+        body = self.encoder.encode_body([mal.Pair([mal.UShort(7), None])])
+        self.assertEqual(body, encoded(
+            ('write_presence', True), ('write_varint', encoding.absolute_short_form(mal.Pair)),
+            ('write_presence', True), ('write_uoctet', mal.MALShortForm.USHORT - 1), ('write_uvarint', 7),
+            ('write_presence', False)))
+
+    def test_not_nullable_field(self):
+        subscription = mal.Subscription._from_fields([mal.Identifier(None), mal.EntityRequestList([])])
+        with self.assertRaises(ValueError):
+            self.encoder.encode_body([subscription])
+
+    def test_nested_round_trip(self):
+        body = [parameter.ParameterValueList([[1, mal.Long(3), None], [2, mal.String("x"), mal.Double(2.5)]]),
+                mal.UpdateHeaderList([[1.5, "u", mal.UpdateTypeEnum.CREATION, ["k", 1, 2, 3]], None])]
+        decoded = self.encoder.decode_body(self.encoder.encode_body(body))
+        values = decoded[0].internal_value
+        self.assertIs(type(values[0].rawValue), mal.Long)
+        self.assertEqual(values[1].convertedValue.internal_value, 2.5)
+        self.assertEqual(decoded[1].internal_value[0].key.firstSubKey.internal_value, "k")
+        self.assertIsNone(decoded[1].internal_value[1].internal_value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The HTTPConnectionPool reuses the keep-alive connections to a
+destination, within its size and idle timeout.
+"""
+
+import http.client
+import http.server
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.transport import http as malhttp
+
+
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b"closing" if self.path == '/close' else b"ok"
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        if self.path == '/close':
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(('localhost', 0), KeepAliveHandler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.pool = malhttp.HTTPConnectionPool(maxsize=2, idle_timeout=5.)
+
+    def tearDown(self):
+        self.pool.clear()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def checkout(self):
+        return self.pool.checkout('localhost', self.port, scheme='http')
+
+    def get(self, connection, path='/'):
+        connection.request('GET', path)
+        response = connection.getresponse()
+        return response.read()
+
+    def test_reuse(self):
+        connection = self.checkout()
+        self.assertIsInstance(connection, http.client.HTTPConnection)
+        self.assertNotIsInstance(connection, http.client.HTTPSConnection)
+        self.assertEqual(self.get(connection), b"ok")
+        sock = connection.sock
+        self.pool.checkin(connection, 'localhost', self.port, scheme='http')
+        reused = self.checkout()
+        self.assertIs(reused, connection)
+        self.assertEqual(self.get(reused), b"ok")
+        self.assertIs(reused.sock, sock)
+
+    def test_keys(self):
+        connection = self.checkout()
+        self.get(connection)
+        self.pool.checkin(connection, 'localhost', self.port, scheme='http')
+        self.assertIsInstance(self.pool.checkout('localhost', self.port), http.client.HTTPSConnection)
+        self.assertIsNot(self.pool.checkout('localhost', self.port + 1, scheme='http'), connection)
+        self.assertIs(self.checkout(), connection)
+
+    def test_maxsize(self):
+        connections = [self.checkout() for _ in range(3)]
+        for connection in connections:
+            self.get(connection)
+        for connection in connections:
+            self.pool.checkin(connection, 'localhost', self.port, scheme='http')
+        # The extra connection is closed, the last checked in is reused first
+        self.assertIsNone(connections[2].sock)
+        self.assertIs(self.checkout(), connections[1])
+        self.assertIs(self.checkout(), connections[0])
+
+    def test_idle_timeout(self):
+        self.pool.idle_timeout = 0.05
+        connection = self.checkout()
+        self.get(connection)
+        self.pool.checkin(connection, 'localhost', self.port, scheme='http')
+        time.sleep(0.1)
+        self.assertIsNot(self.checkout(), connection)
+        self.assertIsNone(connection.sock)
+
+    def test_closed_by_the_server(self):
+        connection = self.checkout()
+        self.assertEqual(self.get(connection, '/close'), b"closing")
+        # 'Connection: close' closes the connection, which is not pooled
+        self.pool.checkin(connection, 'localhost', self.port, scheme='http')
+        self.assertIsNot(self.checkout(), connection)
+
+    def test_clear(self):
+        connection = self.checkout()
+        self.get(connection)
+        self.pool.checkin(connection, 'localhost', self.port, scheme='http')
+        self.pool.clear()
+        self.assertIsNone(connection.sock)
+        self.assertIsNot(self.checkout(), connection)
+
+    def test_uri_scheme(self):
+        self.assertEqual(malhttp._uri_scheme('http://localhost:80/a'), 'http')
+        self.assertEqual(malhttp._uri_scheme('HTTP://localhost:80/a'), 'http')
+        self.assertEqual(malhttp._uri_scheme('https://localhost:443/a'), 'https')
+        self.assertEqual(malhttp._uri_scheme('malhttp://localhost:443/a'), 'https')
+
+
+if __name__ == '__main__':
+    unittest.main()
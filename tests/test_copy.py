@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The copies of the composites and lists are independent, even when a
+reference to their content was taken before the copy.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+
+
+def update_header():
+    return mal.UpdateHeader([1.0, "uri", mal.UpdateTypeEnum.CREATION,
+                             mal.EntityKey(["A", 1, 2, 3])])
+
+
+class TestCopy(unittest.TestCase):
+
+    def test_field_taken_before_the_copy(self):
+        original = update_header()
+        key = original.key
+        copy = original.copy()
+        key.firstSubKey = 'MUTATED'
+        self.assertEqual(copy.key.firstSubKey.internal_value, 'A')
+        self.assertEqual(original.key.firstSubKey.internal_value, 'MUTATED')
+
+    def test_items_taken_before_the_copy(self):
+        original = mal.IdentifierList(["x", "y"])
+        items = original.internal_value
+        copy = original.copy()
+        items.append(mal.Identifier("z"))
+        self.assertEqual(len(copy.internal_value), 2)
+        self.assertEqual(len(original.internal_value), 3)
+
+    def test_nested_items_taken_before_the_copy(self):
+        original = update_header()
+        fields = original.key.internal_value
+        copy = original.copy()
+        fields[0] = mal.Identifier("MUTATED")
+        self.assertEqual(copy.key.firstSubKey.internal_value, 'A')
+
+    def test_modified_copy(self):
+        original = update_header()
+        copy = original.copy()
+        copy.key.firstSubKey = 'MUTATED'
+        copy.internal_value[1] = mal.URI("other")
+        self.assertEqual(original.key.firstSubKey.internal_value, 'A')
+        self.assertEqual(original.sourceURI.internal_value, 'uri')
+
+    def test_shared_until_modified(self):
+        original = mal.EntityKey(["A", 1, 2, 3])
+        copy = original.copy()
+        self.assertIs(copy._internal_value, original._internal_value)
+        copy.secondSubKey = 5
+        self.assertIsNot(copy._internal_value, original._internal_value)
+        self.assertEqual(original.secondSubKey.internal_value, 1)
+        self.assertEqual(copy.firstSubKey.internal_value, 'A')
+
+    def test_type_equal_constructor(self):
+        original = mal.IdentifierList(["x", "y"])
+        other = mal.IdentifierList(original)
+        self.assertIs(other._internal_value, original._internal_value)
+        other.internal_value.append(mal.Identifier("z"))
+        self.assertEqual(len(original.internal_value), 2)
+        self.assertTrue(mal.EntityKey(mal.EntityKey(None))._isNull)
+        with self.assertRaises(ValueError):
+            mal.EntityKey(mal.EntityKey(None), canBeNull=False)
+
+    def test_copy_of_a_copy(self):
+        original = update_header()
+        copies = [original.copy()]
+        copies.append(copies[0].copy())
+        copies[1].key.firstSubKey = 'MUTATED'
+        self.assertEqual(original.key.firstSubKey.internal_value, 'A')
+        self.assertEqual(copies[0].key.firstSubKey.internal_value, 'A')
+        self.assertEqual(copies[1].key.firstSubKey.internal_value, 'MUTATED')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The bulk constructor of the numeric lists checks the whole input at
+once, and gives every invalid index.
+"""
+
+import array
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+
+
+class TestFromValues(unittest.TestCase):
+
+    def test_iterables(self):
+        self.assertEqual(list(mal.LongList.from_values([1, -2, 3]).values()), [1, -2, 3])
+        self.assertEqual(list(mal.UShortList.from_values(range(5)).values()), [0, 1, 2, 3, 4])
+        self.assertEqual(list(mal.DoubleList.from_values(x / 2 for x in range(3)).values()), [0, 0.5, 1])
+        self.assertEqual(len(mal.IntegerList.from_values([])), 0)
+
+    def test_buffers(self):
+        values = array.array('q', [1, 2, 3])
+        longs = mal.LongList.from_values(values)
+        self.assertEqual(list(longs.values()), [1, 2, 3])
+        # The buffer is copied
+        values[0] = 5
+        self.assertEqual(longs.value(0), 1)
+        self.assertEqual(list(mal.DoubleList.from_values(array.array('d', [0.5])).values()), [0.5])
+        # Buffers of another kind or size are converted item by item
+        self.assertEqual(list(mal.LongList.from_values(array.array('b', [-1, 2])).values()), [-1, 2])
+        self.assertEqual(list(mal.FloatList.from_values(array.array('i', [7])).values()), [7.0])
+        self.assertEqual(list(mal.UOctetList.from_values(b"\x00\xff").values()), [0, 255])
+
+    def test_null(self):
+        self.assertTrue(mal.LongList.from_values(None)._isNull)
+        values = mal.LongList.from_values([1], attribName='values')
+        self.assertEqual(values.attribName, 'values')
+        self.assertFalse(values._isNull)
+
+    def test_invalid_indices(self):
+        with self.assertRaises(ValueError) as context:
+            mal.UOctetList.from_values([1, 256, 3, -1])
+        message = str(context.exception)
+        self.assertIn("between 0 and 255", message)
+        self.assertIn("[1, 3]", message)
+        with self.assertRaises(ValueError) as context:
+            mal.ShortList.from_values(iter([40000, 0, 'x']))
+        self.assertIn("[0, 2]", str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            mal.ULongList.from_values([2 ** 64, 2 ** 64 - 1])
+        self.assertIn("[0]", str(context.exception))
+
+    def test_float_range(self):
+        self.assertEqual(list(mal.FloatList.from_values([float('inf'), 1.0]).values()), [float('inf'), 1.0])
+        with self.assertRaises(ValueError) as context:
+            mal.FloatList.from_values([1.0, 1e39, -1e39])
+        message = str(context.exception)
+        self.assertIn("32-bit", message)
+        self.assertIn("[1, 2]", message)
+        with self.assertRaises(ValueError):
+            mal.FloatList.from_values(array.array('d', [1e39]))
+
+    def test_same_as_constructor(self):
+        values = [0, 1, 2 ** 31 - 1, -2 ** 31]
+        self.assertEqual(list(mal.IntegerList.from_values(values).values()),
+                         list(mal.IntegerList(values).values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The X-MAL-* headers of the MAL/HTTP binding are translated from the
+MALHeader fields cached per transaction, and back.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy.transport import http as malhttp
+
+
+def message(**fields):
+    malheader = mal.MALHeader()
+    malheader.area_version = 1
+    malheader.ip_type = mal.InteractionTypeEnum.PROGRESS
+    malheader.ip_stage = mal.MAL_IP_STAGES.PROGRESS_UPDATE
+    malheader.area = 4
+    malheader.service = 2
+    malheader.operation = 7
+    malheader.is_error_message = False
+    malheader.qos_level = mal.QoSLevelEnum.ASSURED
+    malheader.session = mal.SessionTypeEnum.LIVE
+    malheader.transaction_id = 123456789012
+    malheader.priority = 3
+    malheader.uri_from = "http://a:1/provider"
+    malheader.uri_to = "http://b:2/consumer"
+    malheader.timestamp = 1700000000.125
+    malheader.network_zone = "zone"
+    malheader.session_name = "session"
+    malheader.domain = ["esa", "mission"]
+    malheader.auth_id = b"\x01\x02"
+    for name, value in fields.items():
+        setattr(malheader, name, value)
+    return mal.MALMessage(header=malheader, msg_parts=b"body")
+
+
+class TestHTTPHeader(unittest.TestCase):
+
+    def test_round_trip(self):
+        expected = message().header
+        headers = malhttp._header_mal_to_http(message())
+        self.assertEqual(headers["Content-Length"], 4)
+        self.assertEqual(headers["X-MAL-Domain"], "esa.mission")
+        self.assertEqual(headers["X-MAL-Authentication-Id"], "0102")
+        decoded = malhttp._header_http_to_mal(headers)
+        for name in mal.MALHeader.__slots__:
+            self.assertEqual(getattr(decoded, name), getattr(expected, name), name)
+
+    def test_case_insensitive(self):
+        headers = {key.lower(): str(value) for key, value in malhttp._header_mal_to_http(message()).items()}
+        self.assertEqual(malhttp._header_http_to_mal(headers).transaction_id, 123456789012)
+
+    def test_per_message_fields(self):
+        first = malhttp._header_mal_to_http(message())
+        second = malhttp._header_mal_to_http(message(transaction_id=5, timestamp=1700000001.5,
+                                                     ip_stage=mal.MAL_IP_STAGES.PROGRESS_RESPONSE))
+        self.assertEqual(second["X-MAL-Transaction-Id"], "5")
+        self.assertEqual(second["X-MAL-Interaction-Stage"], str(mal.MAL_IP_STAGES.PROGRESS_RESPONSE))
+        self.assertNotEqual(first["X-MAL-Timestamp"], second["X-MAL-Timestamp"])
+        self.assertEqual(first["X-MAL-Transaction-Id"], "123456789012")
+        # The other headers change with the cached fields
+        third = malhttp._header_mal_to_http(message(domain=["other"], priority=1))
+        self.assertEqual(third["X-MAL-Domain"], "other")
+        self.assertEqual(third["X-MAL-Priority"], "1")
+        self.assertEqual(first["X-MAL-Domain"], "esa.mission")
+
+    def test_cached_headers_not_modified(self):
+        headers = malhttp._header_mal_to_http(message())
+        headers["X-MAL-URI-To"] = "http://c:3/other"
+        headers["Content-Type"] = "application/mal-xml"
+        again = malhttp._header_mal_to_http(message())
+        self.assertEqual(again["X-MAL-URI-To"], "http://b:2/consumer")
+        self.assertNotIn("Content-Type", again)
+
+    def test_cached_header_not_modified(self):
+        headers = malhttp._header_mal_to_http(message())
+        decoded = malhttp._header_http_to_mal(headers)
+        decoded.domain.append("changed")
+        decoded.uri_to = "http://c:3/other"
+        again = malhttp._header_http_to_mal(headers)
+        self.assertEqual(again.domain, ["esa", "mission"])
+        self.assertEqual(again.uri_to, "http://b:2/consumer")
+
+    def test_invalid_headers(self):
+        headers = malhttp._header_mal_to_http(message())
+        del headers["X-MAL-Service"]
+        with self.assertRaises(KeyError):
+            malhttp._header_http_to_mal(headers)
+        headers = malhttp._header_mal_to_http(message())
+        headers["X-MAL-Version-Number"] = "2"
+        with self.assertRaises(RuntimeError):
+            malhttp._header_http_to_mal(headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The HTTPServerSocket answers the requests with the MAL reply of the
+provider, or with an HTTP error, and keeps the connections usable.
+"""
+
+import http.client
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy.transport import http as malhttp
+from malpy import encoding
+
+
+class RequestProvider(mal.RequestProviderHandler):
+    AREA = 100
+    VERSION = 1
+    SERVICE = 1
+    OPERATION = 1
+
+
+class RequestConsumer(mal.RequestConsumerHandler):
+    AREA = 100
+    VERSION = 1
+    SERVICE = 1
+    OPERATION = 1
+
+
+class TestHTTPServer(unittest.TestCase):
+
+    def setUp(self):
+        self.server = malhttp.HTTPServerSocket(reply_timeout=0.5)
+        self.server.bind(('localhost', 0))
+        self.server.listen(10)
+        self.provider_uri = 'http://localhost:{}/provider'.format(self.server.uri[1])
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    def tearDown(self):
+        self.server.unbind()
+
+    def serve(self):
+        while True:
+            socket = self.server.waitforconnection()
+            threading.Thread(target=self.handle, args=(socket,), daemon=True).start()
+
+    def handle(self, socket):
+        handler = RequestProvider(socket, encoding.XMLEncoder())
+        message = handler.receive_request()
+        value = message.msg_parts[0].internal_value
+        if value != "silent":
+            handler.response(mal.String("got " + value))
+
+    def request(self, value):
+        consumer = RequestConsumer(malhttp.HTTPSocket(), encoding.XMLEncoder(), self.provider_uri,
+                                   'http://localhost:1/consumer', domain=['a'], network_zone='z')
+        consumer.request(mal.String(value))
+        return consumer.receive_response().msg_parts[0].internal_value
+
+    def test_request(self):
+        self.assertEqual(self.request("r"), "got r")
+
+    def test_concurrent_requests(self):
+        results = {}
+
+        def run(i):
+            results[i] = self.request(str(i))
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, {i: "got {}".format(i) for i in range(8)})
+
+    def test_reply_timeout(self):
+        with self.assertRaises(RuntimeError):
+            self.request("silent")
+
+    def test_invalid_headers(self):
+        connection = http.client.HTTPConnection('localhost', self.server.uri[1])
+        try:
+            # Missing X-MAL-* headers, then a malformed one
+            connection.request('POST', '/provider', b'', {'Content-Length': '0'})
+            response = connection.getresponse()
+            response.read()
+            self.assertEqual(response.status, 400)
+            connection.request('POST', '/provider', b'', {'Content-Length': '0', 'X-MAL-Version-Number': 'x'})
+            response = connection.getresponse()
+            response.read()
+            self.assertEqual(response.status, 400)
+        finally:
+            connection.close()
+        # The server still answers the valid requests
+        self.assertEqual(self.request("r"), "got r")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" In streaming mode, the messages without MAL reply are pipelined on one
+connection, and their HTTP responses are read late.
+"""
+
+import http.server
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy.transport import http as malhttp
+from malpy import encoding
+
+
+class ProgressProvider(mal.ProgressProviderHandler):
+    AREA = 100
+    VERSION = 1
+    SERVICE = 1
+    OPERATION = 3
+
+
+class ProgressConsumer(mal.ProgressConsumerHandler):
+    AREA = 100
+    VERSION = 1
+    SERVICE = 1
+    OPERATION = 3
+
+
+class RecordingHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.requests.append((self.client_address, body))
+        status = 500 if body == b"fail" else 200
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHTTPStream(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(('localhost', 0), RecordingHandler)
+        self.server.daemon_threads = True
+        self.server.requests = []
+        self.key = ('localhost', self.server.server_address[1], None, 'http')
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        malhttp.connection_pool.clear()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def send(self, stream, body):
+        stream.send('/p', {'Content-Length': str(len(body))}, body)
+
+    def test_pipelined(self):
+        stream = malhttp._HTTPStream(self.key, 4)
+        for i in range(10):
+            self.send(stream, str(i).encode())
+            self.assertLessEqual(stream.pending, 4)
+        stream.close()
+        self.assertEqual(stream.pending, 0)
+        self.assertEqual([body for _, body in self.server.requests], [str(i).encode() for i in range(10)])
+        # All on the same connection, which is given back to the pool
+        self.assertEqual(len({address for address, _ in self.server.requests}), 1)
+        self.assertIs(malhttp.connection_pool.checkout(*self.key), stream.connection)
+
+    def test_errors_reported_late(self):
+        stream = malhttp._HTTPStream(self.key, 4)
+        self.send(stream, b"fail")
+        self.send(stream, b"1")
+        with self.assertRaises(RuntimeError):
+            stream.close()
+
+
+class TestProgressStreaming(unittest.TestCase):
+
+    def setUp(self):
+        self.provider_server = malhttp.HTTPServerSocket(streaming=True)
+        self.provider_server.bind(('localhost', 0))
+        self.provider_server.listen(10)
+        self.consumer_server = malhttp.HTTPServerSocket()
+        self.consumer_server.bind(('localhost', 0))
+        self.consumer_server.listen(10)
+
+    def tearDown(self):
+        self.provider_server.unbind()
+        self.consumer_server.unbind()
+        malhttp.connection_pool.clear()
+
+    def provide(self, count):
+        socket = self.provider_server.waitforconnection()
+        handler = ProgressProvider(socket, encoding.XMLEncoder())
+        handler.receive_progress()
+        handler.ack(mal.String("ack"))
+        for i in range(count):
+            handler.update(mal.UInteger(i))
+        handler.response(mal.String("end"))
+        socket.disconnect()
+
+    def test_progress(self):
+        count = 200
+        threading.Thread(target=self.provide, args=(count,), daemon=True).start()
+        consumer = ProgressConsumer(
+            malhttp.HTTPSocket(server=self.consumer_server), encoding.XMLEncoder(),
+            'http://localhost:{}/p'.format(self.provider_server.uri[1]),
+            'http://localhost:{}/c'.format(self.consumer_server.uri[1]), domain=['a'], network_zone='z')
+        consumer.progress(mal.String("go"))
+        self.assertEqual(consumer.receive_ack().msg_parts[0].internal_value, "ack")
+        values = [consumer.receive_update().msg_parts[0].internal_value for _ in range(count)]
+        self.assertEqual(values, list(range(count)))
+        self.assertEqual(consumer.receive_update().msg_parts[0].internal_value, "end")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Round trips of message bodies through the MAL/JSON encoding. """
+
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy.mo.mc.services import parameter
+from malpy import encoding
+
+
+def to_python(element):
+    """ Python values of an element, to compare decoded bodies """
+    if element is None:
+        return None
+    value = element.internal_value
+    if isinstance(element, (mal.Composite, mal.ElementList)) and value is not None:
+        value = [to_python(e) for e in value]
+    return (type(element).__name__, value)
+
+
+def body():
+    return [mal.Long(-5), mal.String('a"b'), mal.Time(1.5), mal.FineTime(2.000000001),
+            mal.Blob(b"\x01\xab"), None, mal.Boolean(True), mal.Double(0.25),
+            mal.UpdateType(mal.UpdateTypeEnum.DELETION), mal.IdentifierList(["x", None]),
+            mal.LongList([1, None, 3]), mal.TimeList([1.5, None]), mal.Pair([mal.UInteger(4), None]),
+            mal.UpdateHeader([1.5, "u", mal.UpdateTypeEnum.CREATION, ["k", 1, None, 3]]),
+            parameter.ParameterValueList([[1, mal.Long(3), None], [2, mal.String("x"), mal.Double(2.5)]])]
+
+
+class TestJSONEncoding(unittest.TestCase):
+
+    def setUp(self):
+        self.encoder = encoding.JSONEncoder()
+
+    def test_round_trip(self):
+        decoded = self.encoder.decode_body(self.encoder.encode_body(body()))
+        self.assertEqual([to_python(e) for e in decoded], [to_python(e) for e in body()])
+
+    def test_document(self):
+        document = json.loads(self.encoder.encode_body(body()))
+        self.assertEqual(document[0], {"Long": -5})
+        self.assertEqual(document[2], {"Time": "1970-01-01T00:00:01.500"})
+        self.assertEqual(document[4], {"Blob": "01ab"})
+        self.assertIsNone(document[5])
+        self.assertEqual(document[8], {"UpdateType": "DELETION"})
+        self.assertEqual(document[10], {"LongList": [1, None, 3]})
+        self.assertEqual(document[12], {"Pair": {"first": {"UInteger": 4}, "second": None}})
+
+    def test_memoryview(self):
+        encoded = self.encoder.encode_body([mal.Identifier("id")])
+        decoded, = self.encoder.decode_body(memoryview(encoded))
+        self.assertEqual(decoded.internal_value, "id")
+
+    def test_empty_body(self):
+        self.assertIsNone(self.encoder.decode_body(b""))
+        self.assertEqual(self.encoder.decode_body(self.encoder.encode_body([])), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
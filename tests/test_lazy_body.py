@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The parts of a lazy MALMessage are decoded when they are accessed, and
+its encoded body is reused until then.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy import encoding
+
+
+def encoders():
+    return [encoding.BinaryEncoder(), encoding.SplitBinaryEncoder(), encoding.XMLEncoder(), encoding.JSONEncoder()]
+
+
+class TestLazyBody(unittest.TestCase):
+
+    def lazy_message(self, encoder, body):
+        return encoder.decode_lazy(mal.MALMessage(msg_parts=encoder.encode_body(body)))
+
+    def test_parts(self):
+        for encoder in encoders():
+            message = self.lazy_message(encoder, [mal.String("abc"), mal.Long(5)])
+            self.assertEqual(message.part(0).internal_value, "abc")
+            self.assertEqual(len(message._msg_parts), 1)
+            self.assertEqual(message.part(1).internal_value, 5)
+            self.assertEqual([p.internal_value for p in message.msg_parts], ["abc", 5])
+
+    def test_only_the_accessed_parts_are_decoded(self):
+        encoder = encoding.BinaryEncoder()
+        body = encoder.encode_body([mal.String("abc"), mal.String("def")])
+        # The second part is truncated
+        message = encoder.decode_lazy(mal.MALMessage(msg_parts=body[:-1]))
+        self.assertEqual(message.part(0).internal_value, "abc")
+        with self.assertRaises(ValueError):
+            message.msg_parts
+
+    def test_encoded_body_reused(self):
+        for encoder in encoders():
+            body = encoder.encode_body([mal.String("abc"), mal.Long(5)])
+            message = encoder.decode_lazy(mal.MALMessage(msg_parts=body))
+            self.assertEqual(len(message), len(body))
+            self.assertIs(encoder.encode(message).msg_parts, body)
+
+    def test_accessed_body_encoded_again(self):
+        for encoder in encoders():
+            message = self.lazy_message(encoder, [mal.String("abc")])
+            message.msg_parts.append(mal.Long(1))
+            decoded = encoder.decode(encoder.encode(message))
+            self.assertEqual([p.internal_value for p in decoded.msg_parts], ["abc", 1])
+
+    def test_other_encoding(self):
+        message = self.lazy_message(encoding.BinaryEncoder(), [mal.String("abc")])
+        xml = encoding.XMLEncoder()
+        decoded = xml.decode(xml.encode(message))
+        self.assertEqual(decoded.msg_parts[0].internal_value, "abc")
+
+    def test_empty_body(self):
+        for encoder in encoders():
+            message = self.lazy_message(encoder, [])
+            self.assertEqual(message.msg_parts, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The service modules are imported on first use, or when the registry
+misses a type. Each check runs in a new interpreter, with an empty
+sys.modules.
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+PARAMETER = 'malpy.mo.mc.services.parameter'
+
+
+def run(code):
+    env = dict(os.environ, PYTHONPATH=SRC)
+    result = subprocess.run([sys.executable, '-c', textwrap.dedent(code)], env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise AssertionError(result.stderr.decode())
+    return result.stdout.decode().split()
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_not_imported(self):
+        loaded = run("""
+            import sys
+            from malpy.mo import mal, mc
+            from malpy import encoding
+            print(int('{0}' in sys.modules), int('malpy.mo.mc.services' in sys.modules))
+            """.format(PARAMETER))
+        self.assertEqual(loaded, ['0', '0'])
+
+    def test_attribute_access(self):
+        loaded = run("""
+            import sys
+            from malpy.mo import mc
+            mc.services.parameter.ParameterValue
+            print(int('{0}' in sys.modules), int('malpy.mo.mc.services.alert' in sys.modules))
+            """.format(PARAMETER))
+        self.assertEqual(loaded, ['1', '0'])
+
+    def test_registry_miss(self):
+        loaded = run("""
+            import sys
+            from malpy.mo import mal
+            from malpy import encoding
+            mal.Long
+            print(int('{0}' in sys.modules))
+            print(mal.registry.type_from_name('ParameterValue').__module__)
+            print(int('{0}' in sys.modules))
+            """.format(PARAMETER))
+        self.assertEqual(loaded, ['0', PARAMETER, '1'])
+
+    def test_unknown_attribute(self):
+        loaded = run("""
+            from malpy.mo import mc
+            try:
+                mc.services.notaservice
+            except AttributeError:
+                print('AttributeError')
+            """)
+        self.assertEqual(loaded, ['AttributeError'])
+
+
+if __name__ == '__main__':
+    unittest.main()
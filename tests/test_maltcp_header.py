@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The MAL/TCP binding sends the MALHeader in its binary layout. """
+
+import os
+import socket
+import sys
+import types
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.malpydefinitions import MALPY_ENCODING
+from malpy.mo import mal
+from malpy.transport import tcp
+from malpy import encoding
+
+
+def header(**fields):
+    malheader = mal.MALHeader()
+    malheader.area_version = 1
+    malheader.ip_type = mal.InteractionTypeEnum.INVOKE
+    malheader.ip_stage = mal.MAL_IP_STAGES.INVOKE_ACK
+    malheader.area = 4
+    malheader.service = 2
+    malheader.operation = 7
+    malheader.is_error_message = False
+    malheader.qos_level = mal.QoSLevelEnum.ASSURED
+    malheader.session = mal.SessionTypeEnum.REPLAY
+    malheader.transaction_id = 123456789012
+    malheader.priority = 3
+    malheader.uri_from = "maltcp://a:1/provider"
+    malheader.uri_to = "maltcp://b:2/consumer"
+    malheader.timestamp = 1700000000.125
+    malheader.network_zone = "zone"
+    malheader.session_name = "session"
+    malheader.domain = ["esa", "mission"]
+    malheader.auth_id = b"\x01\x02"
+    for name, value in fields.items():
+        setattr(malheader, name, value)
+    return malheader
+
+
+def round_trip(malheader, body_length=0):
+    """ Return (header, encoding, offset, body length) of a decoded header """
+    encoded = tcp.encode_header(malheader, MALPY_ENCODING.BINARY, body_length)
+    fixed, data = encoded[:tcp.FIXED_HEADER.size], encoded[tcp.FIXED_HEADER.size:]
+    variable_length = tcp.FIXED_HEADER.unpack_from(fixed)[-1]
+    return tcp.decode_header(fixed, data) + (variable_length - len(data),)
+
+
+class TestMALTCPHeader(unittest.TestCase):
+
+    def assertSameHeader(self, decoded, expected):
+        for name in mal.MALHeader.__slots__:
+            self.assertEqual(getattr(decoded, name), getattr(expected, name), name)
+
+    def test_round_trip(self):
+        decoded, encoding_id, offset, body_length = round_trip(header(), 42)
+        self.assertSameHeader(decoded, header())
+        self.assertEqual(encoding_id, MALPY_ENCODING.BINARY)
+        self.assertEqual(body_length, 42)
+
+    def test_optional_fields(self):
+        malheader = header(uri_to=None, priority=None, timestamp=None, network_zone=None,
+                           session_name=None, domain=None, auth_id=None)
+        decoded, _, _, _ = round_trip(malheader)
+        self.assertSameHeader(decoded, malheader)
+
+    def test_error_message(self):
+        malheader = header(ip_stage=mal.MAL_IP_ERRORS.INVOKE_RESPONSE_ERROR, is_error_message=True)
+        decoded, _, _, _ = round_trip(malheader)
+        self.assertTrue(decoded.is_error_message)
+        self.assertEqual(decoded.ip_stage, mal.MAL_IP_ERRORS.INVOKE_RESPONSE_ERROR)
+
+    def test_version_number(self):
+        encoded = bytearray(tcp.encode_header(header(), MALPY_ENCODING.BINARY, 0))
+        encoded[0] = (2 << 5) | (encoded[0] & 0x1F)
+        with self.assertRaises(RuntimeError):
+            tcp.decode_header(encoded[:tcp.FIXED_HEADER.size], encoded[tcp.FIXED_HEADER.size:])
+
+
+class TestMALTCPSocket(unittest.TestCase):
+
+    def setUp(self):
+        a, b = socket.socketpair()
+        parent = types.SimpleNamespace(encoding=encoding.BinaryEncoder())
+        self.sender = tcp.MALTCPSocket(a)
+        self.receiver = tcp.MALTCPSocket(b)
+        self.sender.parent = parent
+        self.receiver.parent = parent
+
+    def tearDown(self):
+        self.sender.disconnect()
+        self.receiver.disconnect()
+
+    def test_messages(self):
+        encoder = encoding.BinaryEncoder()
+        for value in ("first", "second"):
+            self.sender.send(encoder.encode(mal.MALMessage(header(), [mal.String(value)])))
+        for value in ("first", "second"):
+            message = self.receiver.recv()
+            self.assertEqual(message.header.transaction_id, header().transaction_id)
+            self.assertEqual(encoder.decode(message).msg_parts[0].internal_value, value)
+
+    def test_unexpected_encoding(self):
+        self.receiver.parent = types.SimpleNamespace(encoding=encoding.XMLEncoder())
+        self.sender.send(encoding.BinaryEncoder().encode(mal.MALMessage(header(), [mal.Long(1)])))
+        with self.assertRaises(RuntimeError):
+            self.receiver.recv()
+
+    def test_not_a_message(self):
+        with self.assertRaises(TypeError):
+            self.sender.send(b"body")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Concurrent MAL transactions sharing one MAL/TCP connection. """
+
+import os
+import socket
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy.transport import tcp
+from malpy.transport.multiplexing import TransactionDispatcher
+from malpy.encoding import BinaryEncoder
+
+
+class TestMultiplexing(unittest.TestCase):
+
+    def setUp(self):
+        a, b = socket.socketpair()
+        self.consumer = TransactionDispatcher(tcp.MALTCPSocket(a), BinaryEncoder())
+        self.provider = TransactionDispatcher(tcp.MALTCPSocket(b), BinaryEncoder())
+        self.consumer.start()
+        self.provider.start()
+
+    def tearDown(self):
+        self.consumer.disconnect()
+        self.provider.disconnect()
+
+    def serve(self, count):
+        def provide(channel):
+            if channel.messages.queue[0].header.ip_type == mal.InteractionTypeEnum.REQUEST:
+                handler = mal.RequestProviderHandler(channel, BinaryEncoder())
+                message = handler.receive_request()
+                handler.response(mal.String("request " + message.msg_parts[0].internal_value))
+            else:
+                handler = mal.InvokeProviderHandler(channel, BinaryEncoder())
+                message = handler.receive_invoke()
+                handler.ack(None)
+                handler.response(mal.String("invoke " + message.msg_parts[0].internal_value))
+            channel.disconnect()
+
+        def serve():
+            for _ in range(count):
+                threading.Thread(target=provide, args=(self.provider.waitfortransaction(),), daemon=True).start()
+        threading.Thread(target=serve, daemon=True).start()
+
+    def test_concurrent_transactions(self):
+        self.serve(20)
+        handlers = []
+        for i in range(10):
+            request = mal.RequestConsumerHandler(self.consumer.channel(), BinaryEncoder(), "provider")
+            request.request(mal.String(str(i)))
+            invoke = mal.InvokeConsumerHandler(self.consumer.channel(), BinaryEncoder(), "provider")
+            invoke.invoke(mal.String(str(i)))
+            handlers.append((i, request, invoke))
+        # The replies are received in the reverse order of the requests
+        for i, request, invoke in reversed(handlers):
+            invoke.receive_ack()
+            self.assertEqual(invoke.receive_response().msg_parts[0].internal_value, "invoke {}".format(i))
+            self.assertEqual(request.receive_response().msg_parts[0].internal_value, "request {}".format(i))
+
+    def test_transaction_in_use(self):
+        first, second = self.consumer.channel(), self.consumer.channel()
+        key = (5, "provider", mal.InteractionTypeEnum.REQUEST, 1, 1, 1)
+        self.consumer.register(first, key)
+        self.consumer.register(first, key)
+        with self.assertRaises(RuntimeError):
+            self.consumer.register(second, key)
+        first.disconnect()
+        self.consumer.register(second, key)
+
+
+class TestInvalidFrame(unittest.TestCase):
+
+    def test_channels_get_the_error(self):
+        a, b = socket.socketpair()
+        dispatcher = TransactionDispatcher(tcp.MALTCPSocket(a), BinaryEncoder())
+        handler = mal.RequestConsumerHandler(dispatcher.channel(), BinaryEncoder(), "provider")
+        handler.request(mal.String("x"))
+        with self.assertLogs('malpy.transport.multiplexing', 'ERROR'):
+            # A header of an unknown version of the binding
+            b.sendall(tcp.FIXED_HEADER.pack(7 << 5, 0, 0, 0, 0, 0, 0, 0, 0, 0))
+            dispatcher.start()
+            with self.assertRaises(ConnectionError):
+                handler.receive_response()
+        with self.assertRaises(ConnectionError):
+            dispatcher.waitfortransaction()
+        dispatcher.disconnect()
+        b.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
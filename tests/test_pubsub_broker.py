@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Matching of the published updates with the registered subscriptions. """
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+
+
+def header(uri, domain=("esa", "mission"), area=4, service=2, operation=1):
+    malheader = mal.MALHeader()
+    malheader.uri_from = uri
+    malheader.domain = list(domain)
+    malheader.session = mal.SessionTypeEnum.LIVE
+    malheader.session_name = "LIVE"
+    malheader.network_zone = "zone"
+    malheader.area = area
+    malheader.service = service
+    malheader.operation = operation
+    return malheader
+
+
+def subscription(subscription_id, keys, subdomain=None, all_operations=False, only_on_change=False):
+    request = mal.EntityRequest([subdomain, False, False, all_operations, only_on_change,
+                                 mal.EntityKeyList([mal.EntityKey(key) for key in keys])])
+    return mal.Subscription([subscription_id, mal.EntityRequestList([request])])
+
+
+def update(key, update_type=mal.UpdateTypeEnum.UPDATE):
+    return mal.UpdateHeader([1.5, "provider", update_type, mal.EntityKey(key)])
+
+
+class TestPubSubBroker(unittest.TestCase):
+
+    def setUp(self):
+        self.broker = mal.PubSubBroker()
+
+    def match(self, key, publish_header=None, update_type=mal.UpdateTypeEnum.UPDATE):
+        return self.broker.match(publish_header or header("provider"), update(key, update_type))
+
+    def test_exact_key(self):
+        self.broker.register(header("a"), subscription("s", [["temp", 1, 2, 3]]))
+        self.assertEqual(self.match(["temp", 1, 2, 3]), {("a", "s")})
+        self.assertEqual(self.match(["temp", 1, 2, 4]), set())
+        self.assertEqual(self.match(["temp", 1, 2, 3], header("provider", operation=2)), set())
+
+    def test_key_wildcards(self):
+        self.broker.register(header("a"), subscription("all", [["*", 0, 0, 0]]))
+        self.broker.register(header("b"), subscription("temp", [["temp", 0, 2, 0]]))
+        self.assertEqual(self.match(["temp", 5, 2, 9]), {("a", "all"), ("b", "temp")})
+        self.assertEqual(self.match(["temp", 5, 3, 9]), {("a", "all")})
+
+    def test_domain(self):
+        self.broker.register(header("a", domain=["esa"]), subscription("sub", [["*", 0, 0, 0]], subdomain=["mission"]))
+        self.broker.register(header("b", domain=["esa", "*"]), subscription("any", [["*", 0, 0, 0]]))
+        self.broker.register(header("c", domain=["esa"]), subscription("top", [["*", 0, 0, 0]]))
+        self.assertEqual(self.match(["x", 1, 1, 1]), {("a", "sub"), ("b", "any")})
+        self.assertEqual(self.match(["x", 1, 1, 1], header("provider", domain=["esa"])), {("b", "any"), ("c", "top")})
+        self.assertEqual(self.match(["x", 1, 1, 1], header("provider", domain=["cnes"])), set())
+
+    def test_all_operations(self):
+        self.broker.register(header("a"), subscription("s", [["x", 0, 0, 0]], all_operations=True))
+        self.assertEqual(self.match(["x", 1, 1, 1], header("provider", operation=7)), {("a", "s")})
+        self.assertEqual(self.match(["x", 1, 1, 1], header("provider", service=3)), set())
+
+    def test_only_on_change(self):
+        self.broker.register(header("a"), subscription("s", [["x", 0, 0, 0]], only_on_change=True))
+        self.assertEqual(self.match(["x", 1, 1, 1]), set())
+        self.assertEqual(self.match(["x", 1, 1, 1], update_type=mal.UpdateTypeEnum.CREATION), {("a", "s")})
+
+    def test_register_again_and_deregister(self):
+        self.broker.register(header("a"), subscription("s", [["x", 0, 0, 0]]))
+        self.broker.register(header("a"), subscription("s", [["y", 0, 0, 0]]))
+        self.assertEqual(len(self.broker), 1)
+        self.assertEqual(self.match(["x", 1, 1, 1]), set())
+        self.assertEqual(self.match(["y", 1, 1, 1]), {("a", "s")})
+        self.broker.deregister(header("a"), mal.IdentifierList(["s"]))
+        self.assertEqual(len(self.broker), 0)
+        self.assertEqual(self.broker._index, {})
+
+    def test_deregister_consumer(self):
+        self.broker.register(header("a"), subscription("s1", [["x", 0, 0, 0]]))
+        self.broker.register(header("a"), subscription("s2", [["y", 0, 0, 0]]))
+        self.broker.register(header("b"), subscription("s1", [["x", 0, 0, 0]]))
+        self.broker.deregister_consumer("a")
+        self.assertEqual(self.match(["x", 1, 1, 1]), {("b", "s1")})
+        self.assertEqual(self.match(["y", 1, 1, 1]), set())
+
+    def test_notifications(self):
+        self.broker.register(header("a"), subscription("s", [["y", 0, 0, 0]]))
+        body = [mal.UpdateHeaderList([update(["x", 1, 1, 1]), update(["y", 1, 1, 1])]),
+                mal.LongList([10, 20])]
+        notifications = list(self.broker.notifications(header("provider"), body))
+        self.assertEqual(len(notifications), 1)
+        uri, notify_body = notifications[0]
+        self.assertEqual(uri, "a")
+        self.assertEqual(notify_body[0].internal_value, "s")
+        self.assertEqual([h.key.firstSubKey.internal_value for h in notify_body[1].internal_value], ["y"])
+        self.assertEqual(list(notify_body[2].values()), [20])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Lookups of the MAL types by absolute short form and by name. """
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy.mo.mc.services import parameter
+
+registry = mal.registry
+
+
+class TestRegistry(unittest.TestCase):
+
+    def test_absolute_short_form(self):
+        self.assertEqual(registry.absolute_short_form(1, 0, 1, 13), 0x0001000001000000 + 13)
+        # List types keep their negative shortForm on 24 bits
+        self.assertEqual(registry.absolute_short_form(4, 2, 1, -1), 0x0004000201FFFFFF)
+
+    def test_mal_types(self):
+        for objectClass in (mal.Long, mal.LongList, mal.EntityKey, mal.UpdateType, mal.IdentifierList):
+            key = registry.type_absolute_short_form(objectClass)
+            self.assertIs(registry.type_from_absolute_short_form(key), objectClass)
+            self.assertIs(registry.type_from_name(objectClass.__name__), objectClass)
+        self.assertEqual(registry.type_absolute_short_form(mal.Long),
+                         registry.absolute_short_form(1, 0, 1, mal.MALShortForm.LONG))
+
+    def test_service_types(self):
+        key = registry.type_absolute_short_form(parameter.ParameterValue)
+        self.assertEqual(key >> 48, 4)  # MC area
+        self.assertIs(registry.type_from_absolute_short_form(key), parameter.ParameterValue)
+        self.assertIs(registry.type_from_name('ParameterValueList'), parameter.ParameterValueList)
+
+    def test_attributes(self):
+        for shortForm in range(1, 19):
+            self.assertEqual(registry.attribute_from_short_form(shortForm).shortForm, shortForm)
+
+    def test_unknown(self):
+        with self.assertRaises(RuntimeError):
+            registry.type_from_absolute_short_form(0x7FFF000001000001)
+        with self.assertRaises(RuntimeError):
+            registry.type_from_name('NotAType')
+        self.assertFalse(registry.is_type_name('NotAType'))
+        # Abstract types have no short form
+        with self.assertRaises(ValueError):
+            registry.type_absolute_short_form(mal.Composite)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The Composites and ElementLists are built from the field tables of the
+generated modules, and the type names of the tables are resolved on first
+use.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy.mo import com
+from malpy.mo.mc.services import check
+from malpy.mo.mal import schema
+
+
+class TestSchema(unittest.TestCase):
+
+    def test_accessors(self):
+        self.assertIsInstance(mal.EntityKey.firstSubKey, schema.Field)
+        self.assertEqual(mal.EntityKey.fourthSubKey.index, 3)
+        self.assertEqual(mal.EntityKey._fieldNumber, 4)
+        # The fields of the parent come first
+        self.assertEqual(check.ConstantCheckDefinition.description.index, 0)
+        parentNumber = check.CheckDefinitionDetails._fieldNumber
+        self.assertEqual(check.ConstantCheckDefinition.operator.index, parentNumber)
+        self.assertEqual(check.ConstantCheckDefinition._fieldNumber, parentNumber + 2)
+
+    def test_field_types(self):
+        self.assertEqual(schema.field_types(mal.Subscription),
+                         [('subscriptionId', mal.Identifier, False),
+                          ('entities', mal.EntityRequestList, False)])
+        self.assertIs(schema.field_types(mal.Subscription), schema.field_types(mal.Subscription))
+        self.assertEqual(schema.field_types(mal.Composite), [])
+
+    def test_resolution(self):
+        fields = schema.field_types(check.ConstantCheckDefinition)
+        self.assertEqual(fields[:len(schema.field_types(check.CheckDefinitionDetails))],
+                         schema.field_types(check.CheckDefinitionDetails))
+        # Types of other modules, and of the same module
+        self.assertIs(dict((f[0], f[1]) for f in fields)['operator'],
+                      com.services.archive.ExpressionOperator)
+        fields = schema.field_types(check.ReferenceCheckDefinition)
+        self.assertIs(fields[-1][1], check.ReferenceValue)
+        self.assertIs(schema.resolve_type(check.__name__, 'mal.UShort'), mal.UShort)
+
+    def test_list_item_type(self):
+        self.assertIs(schema.list_item_type(mal.LongList), mal.Long)
+        self.assertIs(schema.list_item_type(check.ReferenceValueList), check.ReferenceValue)
+
+    def test_construction(self):
+        value = check.ReferenceValue([3, 1.5, None])
+        self.assertIs(type(value.validCount), mal.UShort)
+        self.assertEqual(value.validCount.attribName, 'validCount')
+        self.assertIsNone(value.parameterId.internal_value)
+        with self.assertRaises(ValueError):
+            check.ReferenceValue([None, 1.5, None])
+        with self.assertRaises(RuntimeError):
+            mal.Composite([])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The generated MAL Element classes declare __slots__: their instances
+have no __dict__.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy.mo.mc.services import parameter
+
+
+class TestSlots(unittest.TestCase):
+
+    def test_all_types(self):
+        mal.registry.load_modules()
+        for name, objectClass in mal.registry.types_by_name().items():
+            for cls in objectClass.__mro__[:-2]:
+                self.assertIn('__slots__', vars(cls), "{} of {}".format(cls.__name__, name))
+
+    def test_instances(self):
+        elements = [mal.Long(1), mal.Identifier("x"), mal.IdentifierList(["x"]), mal.LongList([1]),
+                    mal.UpdateType(mal.UpdateTypeEnum.UPDATE), mal.Attribute(mal.Long(1)),
+                    mal.EntityKey(["A", 1, 2, 3]), parameter.ParameterValue([1, mal.Long(3), None])]
+        for element in elements:
+            self.assertFalse(hasattr(element, '__dict__'), type(element).__name__)
+            with self.assertRaises(AttributeError):
+                element.unknown = 1
+
+    def test_attribName(self):
+        key = mal.EntityKey(["A", 1, 2, 3])
+        self.assertEqual(key.firstSubKey.attribName, 'firstSubKey')
+        self.assertEqual(key.copy().fourthSubKey.attribName, 'fourthSubKey')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" Round trips of message bodies through the MAL split-binary encoding,
+whose booleans and presence flags are packed in a leading bitfield.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy import encoding
+
+
+class TestSplitBinaryEncoding(unittest.TestCase):
+
+    def setUp(self):
+        self.encoder = encoding.SplitBinaryEncoder()
+
+    def round_trip(self, body):
+        return self.encoder.decode_body(self.encoder.encode_body(body))
+
+    def test_attributes(self):
+        body = [mal.Long(-3), mal.Identifier("id"), mal.Double(2.5), mal.Blob(b"\x00\x01"),
+                mal.Boolean(False), mal.Time(1.5)]
+        decoded = self.round_trip(body)
+        self.assertEqual([type(e) for e in decoded], [type(e) for e in body])
+        self.assertEqual([e.internal_value for e in decoded], [-3, "id", 2.5, b"\x00\x01", False, 1.5])
+
+    def test_composite(self):
+        header = mal.UpdateHeader([1.5, "uri", mal.UpdateTypeEnum.CREATION, mal.EntityKey(["A", 1, None, 3])])
+        decoded = self.round_trip([header, mal.Pair([mal.UInteger(4), None])])
+        self.assertEqual(decoded[0].key.firstSubKey.internal_value, "A")
+        self.assertIsNone(decoded[0].key.thirdSubKey.internal_value)
+        self.assertEqual(decoded[0].updateType.internal_value, mal.UpdateTypeEnum.CREATION)
+        self.assertEqual(decoded[1].first.internal_value, 4)
+        self.assertIsNone(decoded[1].second.internal_value)
+
+    def test_trailing_null_parts(self):
+        self.assertEqual(self.round_trip([mal.Long(1), mal.Identifier(None)])[1:], [None])
+        self.assertEqual(self.round_trip([mal.Identifier(None)]), [None])
+        self.assertEqual(self.round_trip([mal.Long(1)] + [None] * 10)[1:], [None] * 10)
+        self.assertEqual(self.round_trip([None] * 8), [None] * 8)
+        self.assertEqual(self.round_trip([]), [])
+
+    def test_booleans_in_the_bitfield(self):
+        # Presence and value bits of the part, padding bits set, then the
+        # short form of Boolean as the only data
+        encoded = self.encoder.encode_body([mal.Boolean(True)])
+        shortform = encoding.BinaryWriter()
+        shortform.write_varint(encoding.absolute_short_form(mal.Boolean))
+        self.assertEqual(encoded, b"\x01\xff" + shortform.getvalue())
+        encoded = self.encoder.encode_body([mal.Boolean(False)])
+        self.assertEqual(encoded, b"\x01\xfd" + shortform.getvalue())
+
+    def test_boolean_fields(self):
+        value = mal.NamedValue(["flag", mal.Boolean(True)])
+        decoded = self.round_trip([value, mal.BooleanList([True, None, False])])
+        self.assertIs(decoded[0].value.internal_value, True)
+        self.assertEqual([e.internal_value for e in decoded[1].internal_value], [True, None, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" In framed mode, TCPSocket receives each message as a whole. """
+
+import os
+import socket
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.transport.tcp import TCPSocket
+
+
+class TestTCPFraming(unittest.TestCase):
+
+    def setUp(self):
+        a, b = socket.socketpair()
+        self.sender = TCPSocket(a, framed=True)
+        self.receiver = TCPSocket(b, framed=True)
+
+    def tearDown(self):
+        self.sender.disconnect()
+        self.receiver.disconnect()
+
+    def test_messages_are_kept_apart(self):
+        messages = [b"first", b"", b"x" * 3000, b"last"]
+        for message in messages:
+            self.sender.send(message)
+        self.assertEqual([bytes(self.receiver.recv()) for _ in messages], messages)
+
+    def test_large_message(self):
+        # Larger than the socket buffers: sent while it is received
+        message = os.urandom(4 * 1024 * 1024)
+        thread = threading.Thread(target=self.sender.send, args=(message,))
+        thread.start()
+        received = self.receiver.recv()
+        thread.join()
+        self.assertEqual(bytes(received), message)
+
+    def test_peer_closed(self):
+        self.sender.socket.sendall(TCPSocket._lengthheader.pack(10) + b"short")
+        self.sender.socket.shutdown(socket.SHUT_WR)
+        with self.assertRaises(ConnectionError):
+            self.receiver.recv()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The text formats of the MAL time values give the same dates as the
+datetime module, and parse back to the formatted values.
+"""
+
+import datetime
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy import timecodec
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def expected_text(milliseconds, ordinal=False):
+    date = EPOCH + datetime.timedelta(milliseconds=milliseconds)
+    if ordinal:
+        day = "%04d-%03d" % (date.year, date.timetuple().tm_yday)
+    else:
+        day = "%04d-%02d-%02d" % (date.year, date.month, date.day)
+    return "%sT%02d:%02d:%02d.%03d" % (day, date.hour, date.minute, date.second, date.microsecond // 1000)
+
+
+class TestTimeCodec(unittest.TestCase):
+
+    def test_known_values(self):
+        self.assertEqual(timecodec.format_time(0), "1970-01-01T00:00:00.000")
+        self.assertEqual(timecodec.format_time(1700000000.125), "2023-11-14T22:13:20.125")
+        self.assertEqual(timecodec.format_time(-0.001), "1969-12-31T23:59:59.999")
+        self.assertEqual(timecodec.format_finetime(1.000000001), "1970-01-01T00:00:01.000000001")
+        self.assertEqual(timecodec.format_ordinal_time(0), "1970-001T00:00:00.000")
+        self.assertEqual(timecodec.format_ordinal_time(1700000000.125), "2023-318T22:13:20.125")
+
+    def test_leap_years(self):
+        for year, month, day, day_of_year in ((2000, 2, 29, 60), (2000, 12, 31, 366), (2024, 3, 1, 61),
+                                              (1900, 3, 1, 60), (2100, 12, 31, 365), (1600, 2, 29, 60)):
+            value = (datetime.datetime(year, month, day) - EPOCH).total_seconds()
+            self.assertEqual(timecodec.format_time(value), "%04d-%02d-%02dT00:00:00.000" % (year, month, day))
+            self.assertEqual(timecodec.format_ordinal_time(value), "%04d-%03dT00:00:00.000" % (year, day_of_year))
+
+    def test_same_as_datetime(self):
+        rng = random.Random(25)
+        low = (datetime.datetime(1, 1, 1) - EPOCH) // datetime.timedelta(milliseconds=1)
+        high = (datetime.datetime(9999, 12, 31) - EPOCH) // datetime.timedelta(milliseconds=1)
+        for _ in range(2000):
+            milliseconds = rng.randint(low, high)
+            value = milliseconds / 1000
+            self.assertEqual(timecodec.format_time(value), expected_text(milliseconds))
+            self.assertEqual(timecodec.format_ordinal_time(value), expected_text(milliseconds, True))
+
+    def test_round_trips(self):
+        rng = random.Random(26)
+        for _ in range(2000):
+            milliseconds = rng.randint(-10 ** 13, 10 ** 13)
+            value = milliseconds / 1000
+            self.assertEqual(timecodec.parse_time(timecodec.format_time(value)), value)
+            self.assertEqual(timecodec.parse_ordinal_time(timecodec.format_ordinal_time(value)), value)
+            nanoseconds = rng.randint(-10 ** 15, 10 ** 15)
+            text = timecodec.format_finetime(nanoseconds / 10 ** 9)
+            self.assertEqual(timecodec.format_finetime(timecodec.parse_finetime(text)), text)
+
+    def test_parse(self):
+        # Trailing Z, missing and extra digits
+        self.assertEqual(timecodec.parse_time("2023-11-14T22:13:20.125Z"), 1700000000.125)
+        self.assertEqual(timecodec.parse_time("2023-11-14T22:13:20.1"), 1700000000.1)
+        self.assertEqual(timecodec.parse_time("2023-11-14T22:13:20.1259"), 1700000000.125)
+        self.assertEqual(timecodec.parse_time("2023-11-14T22:13:20"), 1700000000)
+        self.assertEqual(timecodec.parse_ordinal_time("1969-365T23:59:59.999"), -0.001)
+        with self.assertRaises(ValueError):
+            timecodec.parse_time("2023-11-14 22:13:20.125")
+        with self.assertRaises(ValueError):
+            timecodec.parse_time("2023-11-14T22:13")
+
+
+if __name__ == '__main__':
+    unittest.main()
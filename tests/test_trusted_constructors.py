@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The trusted constructors used by the decoders build the same elements
+as the checking constructors.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy import encoding
+
+
+class TestTrustedConstructors(unittest.TestCase):
+
+    def test_attribute(self):
+        element = mal.Long._from_value(5, False, 'value')
+        self.assertEqual(element.internal_value, 5)
+        self.assertEqual(element.attribName, 'value')
+        self.assertEqual(element.copy().internal_value, 5)
+        null = mal.Identifier._from_value(None)
+        self.assertIsNone(null.internal_value)
+        self.assertEqual(mal.Identifier(null).internal_value, None)
+
+    def test_composite(self):
+        fields = [mal.Identifier._from_value("A", True, 'firstSubKey'),
+                  mal.Long._from_value(1, True, 'secondSubKey'),
+                  mal.Long._from_value(None, True, 'thirdSubKey'),
+                  mal.Long._from_value(3, True, 'fourthSubKey')]
+        key = mal.EntityKey._from_fields(fields)
+        checked = mal.EntityKey(["A", 1, None, 3])
+        self.assertEqual([f.internal_value for f in key.internal_value],
+                         [f.internal_value for f in checked.internal_value])
+        self.assertEqual(key.thirdSubKey.attribName, 'thirdSubKey')
+        key.firstSubKey = "B"
+        self.assertEqual(key.firstSubKey.internal_value, "B")
+
+    def test_list(self):
+        items = [mal.Identifier._from_value("a"), None]
+        identifiers = mal.IdentifierList._from_items(items)
+        self.assertIs(identifiers._internal_value, items)
+        self.assertEqual(list(mal.LongList._from_items([1, None]).values()), [1, None])
+
+    def test_decoded_elements(self):
+        encoder = encoding.BinaryEncoder()
+        body = [mal.UpdateHeader([1.5, "u", mal.UpdateTypeEnum.CREATION, ["A", 1, None, 3]])]
+        decoded, = encoder.decode_body(encoder.encode_body(body))
+        self.assertEqual(decoded.key.firstSubKey.attribName, 'firstSubKey')
+        self.assertTrue(decoded.key.thirdSubKey._canBeNull)
+        self.assertIsNone(decoded.key.thirdSubKey.internal_value)
+        copy = decoded.copy()
+        copy.key.firstSubKey = "B"
+        self.assertEqual(decoded.key.firstSubKey.internal_value, "A")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The MAL/XML bodies decoded from the expat events are the same as the
+ones decoded from a DOM.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy.mo.mc.services import parameter
+from malpy import encoding
+
+
+def to_python(element):
+    """ Python values of an element, to compare decoded bodies """
+    if element is None:
+        return None
+    value = element.internal_value
+    if isinstance(element, (mal.Composite, mal.ElementList)) and value is not None:
+        value = [to_python(e) for e in value]
+    return (type(element).__name__, value)
+
+
+def body():
+    return [mal.Long(-5), mal.String('a<b&"c'), mal.Time(1.5), mal.FineTime(2.000000001),
+            mal.Blob(b"\x01\xab"), mal.Boolean(True), mal.Float(0.25),
+            mal.UpdateType(mal.UpdateTypeEnum.DELETION), mal.IdentifierList(["x", None]),
+            mal.LongList([1, None, 3]), mal.Pair([mal.UInteger(4), None]),
+            mal.UpdateHeader([1.5, "u", mal.UpdateTypeEnum.CREATION, ["k", 1, None, 3]]),
+            parameter.ParameterValueList([[1, mal.Long(3), None], [2, mal.String("x"), mal.Double(2.5)]])]
+
+
+class TestXMLDecoding(unittest.TestCase):
+
+    def test_round_trip(self):
+        encoder = encoding.XMLEncoder()
+        decoded = encoder.decode_body(encoder.encode_body(body()))
+        self.assertEqual([to_python(e) for e in decoded], [to_python(e) for e in body()])
+
+    def test_same_as_dom(self):
+        for indent in (False, True):
+            encoded = encoding.XMLEncoder(indent=indent).encode_body(body())
+            streamed = encoding.XMLEncoder().decode_body(encoded)
+            dom = encoding.XMLEncoder(use_dom=True).decode_body(encoded)
+            self.assertEqual([to_python(e) for e in streamed], [to_python(e) for e in dom])
+
+    def test_composite_fields(self):
+        encoder = encoding.XMLEncoder()
+        decoded, = encoder.decode_body(encoder.encode_body(body()[-1:]))
+        value = decoded.internal_value[1]
+        self.assertIs(type(value.rawValue), mal.String)
+        self.assertEqual(value.convertedValue.internal_value, 2.5)
+        self.assertIsNone(decoded.internal_value[0].convertedValue.internal_value)
+
+    def test_empty_body(self):
+        self.assertIsNone(encoding.XMLEncoder().decode_body(b""))
+
+    def test_malformed_document(self):
+        with self.assertRaises(Exception):
+            encoding.XMLEncoder().decode_body(b'<malxml:Body xmlns:malxml="x"><Long>1</Long>')
+
+
+if __name__ == '__main__':
+    unittest.main()
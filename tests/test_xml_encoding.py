@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2025 Olivier Churlaud <olivier@churlaud.com>
+# SPDX-FileCopyrightText: 2025 CNES
+#
+# SPDX-License-Identifier: MIT
+
+""" The streaming MAL/XML writer gives the same documents as the DOM one. """
+
+import os
+import sys
+import unittest
+import xml.dom.minidom
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from malpy.mo import mal
+from malpy import encoding
+
+
+def body():
+    return [mal.Pair([mal.Long(1), mal.String('a<b&"c')]), mal.LongList([1, None]),
+            mal.IdentifierList(["x", None]), mal.Time(1.5), mal.FineTime(2.000000001),
+            mal.Blob(b"\x01\xab"), None, mal.Boolean(False), mal.UpdateType(mal.UpdateTypeEnum.UPDATE),
+            mal.UpdateHeader([1.5, "u", mal.UpdateTypeEnum.CREATION, ["k", 1, None, 3]])]
+
+
+class TestXMLEncoding(unittest.TestCase):
+
+    def test_same_as_dom(self):
+        streamed = encoding.XMLEncoder(indent=True).encode_body(body())
+        self.assertEqual(streamed, encoding.XMLEncoder(use_dom=True).encode_body(body()))
+
+    def test_not_indented(self):
+        encoded = encoding.XMLEncoder().encode_body(body())
+        self.assertNotIn(b"\n\t", encoded)
+        indented = encoding.XMLEncoder(indent=True).encode_body(body())
+        self.assertEqual(xml.dom.minidom.parseString(encoded).toxml(),
+                         xml.dom.minidom.parseString(indented.replace(b"\n", b"").replace(b"\t", b"")).toxml())
+
+    def test_values(self):
+        encoded = encoding.XMLEncoder().encode_body(body()).decode('utf-8')
+        self.assertIn('<second><String>a&lt;b&amp;&quot;c</String></second>', encoded)
+        self.assertIn('<Time>1970-01-01T00:00:01.500</Time>', encoded)
+        self.assertIn('<FineTime>1970-01-01T00:00:02.000000001</FineTime>', encoded)
+        self.assertIn('<Blob>01ab</Blob>', encoded)
+        self.assertIn('<Long xsi:nil="true"/>', encoded)
+        self.assertIn('<UpdateType>UPDATE</UpdateType>', encoded)
+
+    def test_single_element(self):
+        encoder = encoding.XMLEncoder()
+        self.assertEqual(encoder.encode_body(mal.Long(3)), encoder.encode_body([mal.Long(3)]))
+
+
+if __name__ == '__main__':
+    unittest.main()